@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🪵 EchoProPulse Activity Log
+# Structured, non-blocking command logging. log_action() only
+# builds a LogRecord and drops it on a queue; a listener thread
+# formats JSON lines and writes them. The file rotates by size
+# and by time, and finished segments are gzipped on a separate
+# thread so rotation never stalls the writer.
+#
+#   {"ts": "...", "user_id": 123, "user": "name#0000",
+#    "command": "/status", "result": "OK", "latency_ms": 84.2}
+# ==========================================================
+import os
+import io
+import json
+import gzip
+import glob
+import time
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+ACTIVITY_LOG = os.getenv("ACTIVITY_LOG", "/root/EchoProPulse/discord_activity.jsonl")
+MAX_BYTES = int(os.getenv("ACTIVITY_LOG_MAX_BYTES", str(16 * 1024 * 1024)))
+ROTATE_INTERVAL = float(os.getenv("ACTIVITY_LOG_ROTATE_S", str(24 * 3600)))
+KEEP_SEGMENTS = int(os.getenv("ACTIVITY_LOG_KEEP", "30"))
+
+FIELDS = ("user_id", "user", "command", "result", "latency_ms")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {"ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds")}
+        for key in FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        extra = getattr(record, "fields", None)
+        if extra:
+            entry.update(extra)
+        if "command" not in entry:
+            entry["message"] = record.getMessage()
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SizeTimeRotatingHandler(logging.handlers.BaseRotatingHandler):
+    """
+    Rotates when the file passes max_bytes or is older than `interval` seconds.
+    The finished file is renamed to <stem>-<UTCstamp>.jsonl and gzipped on a
+    background thread; only the newest `keep` compressed segments are kept.
+    """
+
+    def __init__(self, path, max_bytes=MAX_BYTES, interval=ROTATE_INTERVAL, keep=KEEP_SEGMENTS):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        super().__init__(path, "a", encoding="utf-8", delay=False)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.keep = keep
+        started = os.path.getmtime(path) if os.path.getsize(path) else time.time()
+        self.rollover_at = started + interval
+        self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="activity-gzip")
+        stem, ext = os.path.splitext(path)
+        self._pattern = f"{stem}-%Y%m%dT%H%M%S.%fZ{ext}"
+        # Segments left uncompressed by an earlier crash
+        for leftover in glob.glob(f"{stem}-*{ext}"):
+            self._compressor.submit(self._compress, leftover)
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if time.time() >= self.rollover_at:
+            return True
+        return self.max_bytes > 0 and self.stream.tell() >= self.max_bytes
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename):
+            dest = datetime.now(timezone.utc).strftime(self._pattern)
+            os.replace(self.baseFilename, dest)
+            self._compressor.submit(self._compress, dest)
+        self.stream = self._open()
+        self.rollover_at = time.time() + self.interval
+
+    def _compress(self, path):
+        try:
+            with open(path, "rb") as src, gzip.open(path + ".gz", "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, io.DEFAULT_BUFFER_SIZE * 16)
+            os.remove(path)
+            stem, ext = os.path.splitext(self.baseFilename)
+            for old in sorted(glob.glob(f"{stem}-*{ext}.gz"))[:-self.keep or None]:
+                os.remove(old)
+        except OSError as e:
+            print(f"⚠️ Activity log compression failed for {path}: {e}")
+
+    def close(self):
+        super().close()
+        self._compressor.shutdown(wait=True)
+
+
+class ActivityLog:
+    """Queue front-end: callers pay for a LogRecord and a queue put, nothing else."""
+
+    def __init__(self, path=ACTIVITY_LOG, **rotation):
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.handler = SizeTimeRotatingHandler(path, **rotation)
+        self.handler.setFormatter(JsonLinesFormatter())
+        self.listener = logging.handlers.QueueListener(self.queue, self.handler)
+        self.logger = logging.getLogger(f"echopropulse.activity.{os.path.basename(path)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(logging.handlers.QueueHandler(self.queue))
+        self.listener.start()
+
+    def log(self, actor, command, result="OK", latency_ms=None, **fields):
+        """
+        `actor` is a discord User/Member or an Interaction; for an Interaction the
+        latency since Discord created it is filled in automatically.
+        """
+        user = getattr(actor, "user", None) if hasattr(actor, "created_at") and hasattr(actor, "response") else None
+        if user is not None:
+            if latency_ms is None:
+                latency_ms = round((datetime.now(timezone.utc) - actor.created_at).total_seconds() * 1000, 1)
+        else:
+            user = actor
+        self.logger.info(command, extra={
+            "user_id": getattr(user, "id", None),
+            "user": f"{getattr(user, 'name', user)}#{getattr(user, 'discriminator', '0000')}",
+            "command": command,
+            "result": str(result),
+            "latency_ms": latency_ms,
+            "fields": fields or None,
+        })
+
+    def close(self):
+        self.listener.stop()
+        self.handler.close()
+
+
+_logs = {}
+
+
+def get_activity_log(path=ACTIVITY_LOG):
+    log = _logs.get(path)
+    if log is None:
+        log = _logs[path] = ActivityLog(path)
+        atexit.register(log.close)
+    return log
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🧮 EchoProPulse AMM Simulator
+# Vectorized constant-product and stable-swap pool math on
+# NumPy arrays. One call prices thousands of candidate trade
+# sizes, so simulation mode and trade sizing need no network.
+# ==========================================================
+import numpy as np
+
+STABLE_MAX_ITER = 64
+
+
+def _as_array(amounts):
+    return np.atleast_1d(np.asarray(amounts, dtype=np.float64))
+
+
+class ConstantProductPool:
+    """x·y = k pool (Raydium/Orca-style) with a proportional input fee."""
+
+    kind = "constant_product"
+
+    def __init__(self, reserve_in: float, reserve_out: float, fee_bps: float = 30):
+        self.reserve_in = float(reserve_in)
+        self.reserve_out = float(reserve_out)
+        self.fee_bps = float(fee_bps)
+
+    def spot_price(self):
+        """Marginal output per unit input, before fees."""
+        return self.reserve_out / self.reserve_in
+
+    def amount_out(self, amounts):
+        a = _as_array(amounts)
+        a_eff = a * (1.0 - self.fee_bps / 10_000.0)
+        return self.reserve_out * a_eff / (self.reserve_in + a_eff)
+
+    def reversed(self):
+        return ConstantProductPool(self.reserve_out, self.reserve_in, self.fee_bps)
+
+
+class StableSwapPool:
+    """Two-coin Curve-style stable-swap pool with amplification `amp` and an output fee."""
+
+    kind = "stable_swap"
+
+    def __init__(self, reserve_in: float, reserve_out: float, amp: float = 100, fee_bps: float = 4):
+        self.reserve_in = float(reserve_in)
+        self.reserve_out = float(reserve_out)
+        self.amp = float(amp)
+        self.fee_bps = float(fee_bps)
+        self._d = self._invariant(self.reserve_in, self.reserve_out)
+
+    def _invariant(self, x, y):
+        ann = self.amp * 4.0
+        s = x + y
+        d = s
+        for _ in range(STABLE_MAX_ITER):
+            d_p = d ** 3 / (4.0 * x * y)
+            d_next = (ann * s + 2.0 * d_p) * d / ((ann - 1.0) * d + 3.0 * d_p)
+            if abs(d_next - d) <= 1e-12 * d:
+                return d_next
+            d = d_next
+        return d
+
+    def _y_for(self, x_new):
+        """Solve the invariant for the output reserve given new input reserves (vectorized)."""
+        ann = self.amp * 4.0
+        d = self._d
+        c = d ** 3 / (4.0 * x_new * ann)
+        b = x_new + d / ann
+        y = np.full_like(x_new, d)
+        for _ in range(STABLE_MAX_ITER):
+            y_next = (y * y + c) / (2.0 * y + b - d)
+            if np.all(np.abs(y_next - y) <= 1e-12 * d):
+                return y_next
+            y = y_next
+        return y
+
+    def amount_out(self, amounts):
+        a = _as_array(amounts)
+        dy = self.reserve_out - self._y_for(self.reserve_in + a)
+        return np.maximum(dy, 0.0) * (1.0 - self.fee_bps / 10_000.0)
+
+    def spot_price(self):
+        eps = max(self.reserve_in * 1e-9, 1e-12)
+        dy = self.reserve_out - self._y_for(np.array([self.reserve_in + eps]))[0]
+        return dy / eps
+
+    def reversed(self):
+        return StableSwapPool(self.reserve_out, self.reserve_in, self.amp, self.fee_bps)
+
+
+# ==========================================================
+# QUOTING
+# ==========================================================
+def quote(pool, amounts):
+    """
+    Price every amount in one pass. Returns a dict of arrays:
+      expected_out  — output after fees
+      exec_price    — expected_out / amount
+      price_impact  — fraction lost to curve movement (fees excluded)
+      total_cost    — fraction lost vs. spot, fees included
+    """
+    a = _as_array(amounts)
+    out = pool.amount_out(a)
+    spot = pool.spot_price()
+    fee = pool.fee_bps / 10_000.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exec_price = np.where(a > 0, out / a, spot * (1.0 - fee))
+    total_cost = 1.0 - exec_price / spot
+    impact = 1.0 - exec_price / (spot * (1.0 - fee))
+    return {
+        "amount_in": a,
+        "expected_out": out,
+        "exec_price": exec_price,
+        "price_impact": np.clip(impact, 0.0, 1.0),
+        "total_cost": np.clip(total_cost, 0.0, 1.0),
+    }
+
+
+def slippage_curve(pool, max_amount: float, points: int = 4096, log_spaced: bool = True):
+    """Quote `points` trade sizes from tiny up to `max_amount`."""
+    if log_spaced:
+        lo = max(max_amount * 1e-6, 1e-12)
+        sizes = np.geomspace(lo, max_amount, points)
+    else:
+        sizes = np.linspace(max_amount / points, max_amount, points)
+    return quote(pool, sizes)
+
+
+def max_size_for_impact(pool, max_impact: float, max_amount: float, points: int = 4096):
+    """Largest candidate size whose price impact stays at or below `max_impact`."""
+    curve = slippage_curve(pool, max_amount, points)
+    ok = np.nonzero(curve["price_impact"] <= max_impact)[0]
+    if ok.size == 0:
+        return 0.0, 0.0
+    i = ok[-1]
+    return float(curve["amount_in"][i]), float(curve["expected_out"][i])
+
+
+def quote_one(pool, amount: float):
+    """Scalar convenience wrapper used by the swap path."""
+    q = quote(pool, [amount])
+    return {k: float(v[0]) for k, v in q.items()}
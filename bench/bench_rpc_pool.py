@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# ==========================================================
+# ⏱️ RPC pool benchmark (offline)
+# Compares a fresh session per call (the old execute_swap
+# behaviour) against the long-lived RpcPool, using mock RPCs.
+#
+#   python3 bench/bench_rpc_pool.py --calls 500 --concurrency 50
+# ==========================================================
+import os
+import sys
+import time
+import asyncio
+import argparse
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_rpc import MockRpc
+from rpc_pool import RpcPool
+
+
+async def fresh_client_call(url):
+    async with aiohttp.ClientSession() as s:
+        async with s.post(url, json={"jsonrpc": "2.0", "id": 1, "method": "getSlot"}) as r:
+            return (await r.json())["result"]
+
+
+async def run_burst(fn, calls, concurrency):
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with sem:
+            t0 = time.perf_counter()
+            await fn()
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    total = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "total_s": round(total, 3),
+        "per_call_p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "per_call_p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+    }
+
+
+async def main(calls, concurrency, latency_ms):
+    # Separate servers so the fresh-session run doesn't advance the pooled servers' slots
+    base, fast, slow = MockRpc(latency_ms=latency_ms), MockRpc(latency_ms=latency_ms), MockRpc(latency_ms=latency_ms * 4 + 5)
+    base_url, fast_url, slow_url = await base.start(), await fast.start(), await slow.start()
+    try:
+        fresh = await run_burst(lambda: fresh_client_call(base_url), calls, concurrency)
+        async with RpcPool([slow_url, fast_url], probe_interval=0) as pool:
+            pooled = await run_burst(lambda: pool.call("getSlot"), calls, concurrency)
+            stats = pool.stats()
+        print(f"fresh session / call : {fresh}")
+        print(f"pooled, ranked       : {pooled}")
+        for s in stats:
+            print(f"  {s}")
+    finally:
+        await base.stop()
+        await fast.stop()
+        await slow.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency, args.latency_ms))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# ==========================================================
+# ⏱️ Bot startup benchmark
+# Cold-starts each bot_core profile in a fresh interpreter and
+# reports import time, per-cog load time and which heavy modules
+# got imported before login. With --live the profile really logs
+# in (STARTUP_BENCH=1: record the marks, then exit) to time
+# process start → gateway ready. Also prints the login and
+# first-command times the running bots appended to STARTUP_LOG.
+# Exits 1 when a profile is over --budget seconds.
+#
+#   python3 bench/bench_startup.py --runs 5
+#   python3 bench/bench_startup.py v10 --live --budget 10
+# ==========================================================
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+HEAVY = ("numpy", "psutil", "matplotlib", "trade_history", "log_index", "swap_trace", "ai_engine.ai_router")
+PROFILES = ("v10", "v9", "main", "ai")
+STARTUP_LOG = os.getenv("STARTUP_LOG", "/root/EchoProPulse/discord_bot/startup.jsonl")
+STARTUP_BUDGET = float(os.getenv("STARTUP_BUDGET", "15"))
+
+# Runs in the child: import the core, build the bot and load its cogs without logging in.
+OFFLINE = """
+import sys, json, time, asyncio
+t0 = time.perf_counter()
+import bot_core
+import_s = time.perf_counter() - t0
+bot = bot_core.create_bot(sys.argv[1])
+asyncio.run(bot.load_cogs())
+print(json.dumps({"import_s": import_s, "cogs_s": bot.marks["cogs_s"],
+                  "cogs_total_s": bot.marks["cogs_total_s"], "ready_s": bot_core.process_uptime(),
+                  "heavy": [m for m in json.loads(sys.argv[2]) if m in sys.modules]}))
+"""
+
+
+def offline_run(profile):
+    out = subprocess.run([sys.executable, "-c", OFFLINE, profile, json.dumps(HEAVY)], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def live_run(profile):
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "startup.jsonl")
+        env = dict(os.environ, STARTUP_BENCH="1", STARTUP_LOG=log)
+        subprocess.run([sys.executable, "-c", f"import bot_core; bot_core.run({profile!r})"], cwd=ROOT,
+                       env=env, capture_output=True, text=True, timeout=120)
+        if not os.path.exists(log):
+            raise RuntimeError(f"{profile} never reached on_ready (check the token / network)")
+        with open(log) as f:
+            marks = json.loads(f.readline())
+    return {"import_s": marks["import_s"], "cogs_s": marks["cogs_s"],
+            "cogs_total_s": marks["cogs_total_s"], "ready_s": marks["login_s"], "heavy": []}
+
+
+def recorded_marks(path=STARTUP_LOG):
+    """Latest startup record per profile from the running bots (first-command line wins)."""
+    latest = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                latest[rec.get("profile")] = rec
+    except OSError:
+        pass
+    return latest
+
+
+def main(profiles, runs, live, budget):
+    over = []
+    label = "login" if live else "no-login"
+    print(f"{'profile':<8} {'import s':>9} {'cogs s':>8} {label + ' s':>11}  slowest cog      heavy modules")
+    for profile in profiles:
+        results = [live_run(profile) if live else offline_run(profile) for _ in range(runs)]
+        med = {k: statistics.median(r[k] for r in results) for k in ("import_s", "cogs_total_s", "ready_s")}
+        cogs = results[-1]["cogs_s"]
+        slowest = max(cogs, key=cogs.get) if cogs else "—"
+        slow_txt = f"{slowest} {cogs[slowest] * 1000:.0f} ms" if cogs else "—"
+        heavy = ", ".join(results[-1]["heavy"]) or "none"
+        print(f"{profile:<8} {med['import_s']:9.3f} {med['cogs_total_s']:8.3f} {med['ready_s']:11.3f}  "
+              f"{slow_txt:<16} {heavy if not live else '—'}")
+        if med["ready_s"] > budget:
+            over.append(profile)
+
+    recorded = recorded_marks()
+    if recorded:
+        print(f"\nRecorded in {STARTUP_LOG}:")
+        for profile, rec in recorded.items():
+            first = rec.get("first_command_s")
+            first_txt = f"{first:.2f}s (/{rec.get('first_command')})" if first is not None else "n/a"
+            print(f"  {profile:<6} started {rec.get('started', '?')[:19]} • ready {rec.get('login_s', 0):.2f}s "
+                  f"• first command {first_txt}")
+
+    if over:
+        print(f"\n❌ Over the {budget:.1f}s budget: {', '.join(over)}")
+        return 1
+    print(f"\n✅ All profiles within the {budget:.1f}s budget")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("profiles", nargs="*", help=f"any of {', '.join(PROFILES)} (default: all)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--live", action="store_true", help="log in for real (needs DISCORD_BOT_TOKEN)")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET)
+    args = parser.parse_args()
+    unknown = set(args.profiles) - set(PROFILES)
+    if unknown:
+        parser.error(f"unknown profile(s): {', '.join(sorted(unknown))}")
+    sys.exit(main(args.profiles or PROFILES, max(1, args.runs), args.live, args.budget))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# ==========================================================
+# ⏱️ Swap trace replay benchmark (offline)
+# Replays the swaps from a swap_trace export (the SWAP_TRACE_EXPORT
+# file or a /latency export attachment) through run_swap in a
+# simulation context, and prints the recorded production stage
+# percentiles next to the local replay. The gap is time spent
+# outside this process (RPC, key load, network).
+#
+#   python3 bench/bench_swap_trace.py swap_traces.jsonl --repeat 5
+# ==========================================================
+import os
+import sys
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import solana_trade
+from swap_trace import Tracer, STAGES, TRACE_EXPORT, load_jsonl
+
+
+async def replay(records, repeat, concurrency):
+    tracer = Tracer(capacity=max(1, len(records) * repeat), export_path=None)
+    ctx = solana_trade.SwapContext.simulation(tracer=tracer)
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(rec):
+        async with sem:
+            await solana_trade.run_swap(ctx, rec["token_in"], rec["token_out"], float(rec["amount"]),
+                                        int(rec.get("slippage_bps", solana_trade.DEFAULT_SLIPPAGE_BPS)))
+
+    legs = [rec for rec in records if {"token_in", "token_out", "amount"} <= rec.keys()]
+    for _ in range(repeat):
+        await asyncio.gather(*(one(rec) for rec in legs))
+    return tracer
+
+
+def main(path, repeat, concurrency):
+    records = load_jsonl(path)
+    if not records:
+        print(f"📭 No traces in {path}")
+        return
+    recorded = Tracer.from_records(records).percentiles()
+    replayed = asyncio.run(replay(records, repeat, concurrency)).percentiles()
+    print(f"{len(records)} traces from {path}, replayed ×{repeat}\n")
+    print(f"{'stage':<12} {'recorded p50/p90/p99 ms':>28} {'replay p50/p90/p99 ms':>28}")
+    for stage in STAGES:
+        if stage not in recorded and stage not in replayed:
+            continue
+        cells = []
+        for stats in (recorded, replayed):
+            s = stats.get(stage)
+            cells.append(f"{s['p50']:8.3f} {s['p90']:8.3f} {s['p99']:8.3f}" if s else f"{'—':>26}")
+        print(f"{stage:<12} {cells[0]:>28} {cells[1]:>28}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", nargs="?", default=TRACE_EXPORT)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    main(args.path, args.repeat, args.concurrency)
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🤖 EchoProPulse Bot Core
+# One bot behind every entry point (echopropulse_v10.py,
+# echopropulse_v9.py, main_discord.py, dc_main.py). A profile
+# picks which feature cogs in cogs/ to load (status, trading,
+# diagnostics, admin, ai); BOT_COGS=status,admin overrides it.
+#
+# Cogs keep their heavy imports (psutil, numpy, matplotlib,
+# trade history, log index, AI router) inside the functions that
+# use them, and the core starts the loop monitor only after
+# login, so restart-to-ready pays for discord.py and little else.
+# Startup marks (import, per-cog load, login, first command) are
+# appended to STARTUP_LOG; see bench/bench_startup.py.
+# ==========================================================
+import time
+CORE_T0 = time.perf_counter()
+
+import os
+import sys
+import json
+import signal
+import asyncio
+import traceback
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from dotenv import load_dotenv
+
+import interaction_deadline
+from activity_log import get_activity_log
+from error_reporter import report_error
+from metrics import registry, start_http_server, COMMAND_SECONDS
+
+# ==========================================================
+# CONFIG
+# ==========================================================
+load_dotenv("/root/EchoProPulse/discord_bot/.env")
+load_dotenv()
+
+EST = ZoneInfo("America/New_York")
+
+DISCORD_TOKEN = os.getenv("DISCORD_BOT_TOKEN") or os.getenv("DISCORD_TOKEN")
+GUILD_ID = int(os.getenv("DISCORD_GUILD_ID", "0"))
+ADMIN_ID = int(os.getenv("DISCORD_ADMIN_ID", "0"))            # 0 = the profile's default (none unless set)
+ADMIN_ROLE_ID = int(os.getenv("DISCORD_ADMIN_ROLE_ID", "0"))
+ALERT_CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID", "0"))
+LOGS_CHANNEL_ID = int(os.getenv("DISCORD_LOG_CHANNEL_ID", "0"))
+VPS_CHANNEL_ID = int(os.getenv("DISCORD_VPS_CHANNEL_ID", "0"))
+SOLANA_WALLET = os.getenv("SOLANA_WALLET", "Unknown Wallet")
+SERVICE = os.getenv("ECHOPROPULSE_SERVICE", "echopropulse.service")
+
+STATE_FILE = "/root/EchoProPulse/live_state.txt"
+ACTIVITY_LOG = "/root/EchoProPulse/discord_activity.jsonl"
+ERROR_WEBHOOK = os.getenv("DISCORD_ERROR_WEBHOOK",
+    "https://discord.com/api/webhooks/1431086202407995402/your_private_error_webhook")
+
+STARTUP_LOG = os.getenv("STARTUP_LOG", "/root/EchoProPulse/discord_bot/startup.jsonl")
+STARTUP_BUDGET = float(os.getenv("STARTUP_BUDGET", "15"))      # seconds, process start → gateway ready
+STARTUP_BENCH = os.getenv("STARTUP_BENCH") == "1"              # log in, record marks, exit
+
+# Entry point → cogs. "ephemeral" is the visibility of auto-deferred replies.
+# admin_id / admin_role_id are the defaults those bots shipped with; DISCORD_ADMIN_ID /
+# DISCORD_ADMIN_ROLE_ID override them, and profiles without them have no admin until set.
+PROFILES = {
+    "v10": {"version": "v10", "cogs": ("status", "trading", "diagnostics", "admin"),
+            "guild_sync": True, "ephemeral": True},
+    "v9": {"version": "v9", "cogs": ("status", "trading", "admin"),
+           "ephemeral": True, "github_updates": True,
+           "admin_id": 1166517382064373841, "admin_role_id": 1431735725514297394},
+    "main": {"version": "v6", "cogs": ("status", "admin"), "ephemeral": False,
+             "admin_id": 1166517382064373841},
+    "ai": {"version": "ai", "cogs": ("ai",), "ephemeral": False},
+}
+ALL_COGS = ("status", "trading", "diagnostics", "admin", "ai")
+
+
+def process_uptime():
+    """Seconds since this process was exec'd (Linux /proc; falls back to core import time)."""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return time.perf_counter() - CORE_T0
+
+
+# ==========================================================
+# SHARED HELPERS (used by the cogs)
+# ==========================================================
+def is_admin(inter):
+    admin_id = getattr(inter.client, "admin_id", ADMIN_ID)
+    role_id = getattr(inter.client, "admin_role_id", ADMIN_ROLE_ID)
+    if admin_id and inter.user.id == admin_id:
+        return True
+    return bool(role_id) and any(r.id == role_id for r in getattr(inter.user, "roles", []))
+
+
+def embed_base(title, description, color=0x00FFB3):
+    embed = discord.Embed(title=title, description=description, color=color, timestamp=datetime.now(EST))
+    embed.set_footer(text=f"🕓 Updated: {datetime.now(EST):%I:%M %p EST}")
+    return embed
+
+
+def log_error_to_discord(err, source="EchoProPulse"):
+    """Send tracebacks or error messages to the shared error pipeline (see error_reporter.py)."""
+    report_error(err, source=source, webhook=ERROR_WEBHOOK)
+
+
+def log_action(actor, action, result="OK", **fields):
+    """Queue a JSON-lines activity record (actor: Interaction or user; see activity_log.py)."""
+    try:
+        get_activity_log(ACTIVITY_LOG).log(actor, action, result, **fields)
+    except Exception as e:
+        print(f"⚠️ Logging error: {e}")
+    if any(word in str(result).upper() for word in ("ERROR", "FAIL", "EXCEPTION")):
+        log_error_to_discord(result)
+
+
+async def restart_service(service=SERVICE):
+    """systemctl restart without blocking the loop; returns (ok, detail)."""
+    try:
+        proc = await asyncio.create_subprocess_exec("systemctl", "restart", service,
+                                                    stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.PIPE)
+        _, err = await proc.communicate()
+    except OSError as e:
+        return False, str(e)
+    if proc.returncode != 0:
+        return False, f"exit code {proc.returncode}: {err.decode().strip()[:200]}"
+    return True, "restarted"
+
+
+class TradingState:
+    """The persisted live-trading switch shared by every cog."""
+
+    def __init__(self, path=STATE_FILE):
+        self.path = path
+        self.live = False
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.live = f.read().strip().lower() == "true"
+                print(f"🔁 Restored trading state: {'ENABLED' if self.live else 'DISABLED'}")
+            except OSError as e:
+                print(f"⚠️ Could not load trading state: {e}")
+
+    def set(self, live):
+        self.live = bool(live)
+        try:
+            with open(self.path, "w") as f:
+                f.write(str(self.live).lower())
+            print(f"💾 Saved trading state: {'ENABLED' if self.live else 'DISABLED'}")
+        except OSError as e:
+            print(f"⚠️ Failed to save trading state: {e}")
+        return self.live
+
+
+# ==========================================================
+# BOT
+# ==========================================================
+class EchoBot(commands.Bot):
+    def __init__(self, profile="v10", cogs=None):
+        config = PROFILES[profile]
+        intents = discord.Intents.default()
+        intents.message_content = True
+        intents.guilds = True
+        super().__init__(command_prefix="/", intents=intents)
+        self.profile = profile
+        self.config = config
+        self.version = config["version"]
+        self.admin_id = ADMIN_ID or config.get("admin_id", 0)
+        self.admin_role_id = ADMIN_ROLE_ID or config.get("admin_role_id", 0)
+        env_cogs = [c.strip() for c in os.getenv("BOT_COGS", "").split(",") if c.strip()]
+        self.cog_names = tuple(cogs or env_cogs or config["cogs"])
+        self.trading = TradingState()
+        self.started = datetime.now(EST)
+        self.loop_monitor = None
+        self.heartbeat = None
+        self._ready_once = False
+        self.marks = {"profile": profile, "pid": os.getpid(), "started": self.started.isoformat(),
+                      "import_s": round(_IMPORT_S, 3), "cogs_s": {}}
+
+        # Auto-defer any command close to the 3 s ack deadline (see interaction_deadline.py)
+        interaction_deadline.install(self.tree, ephemeral=config["ephemeral"])
+        self.tree.on_error = self.on_app_command_error
+        self.add_listener(self.on_command_done, "on_app_command_completion")
+
+    # ------------------------------------------------------
+    # Startup
+    # ------------------------------------------------------
+    async def setup_hook(self):
+        await self.load_cogs()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, lambda: asyncio.ensure_future(self.graceful_shutdown()))
+
+    async def load_cogs(self):
+        t0 = time.perf_counter()
+        for name in self.cog_names:
+            t = time.perf_counter()
+            try:
+                await self.load_extension(f"cogs.{name}")
+            except commands.ExtensionError as e:
+                print(f"❌ Cog {name} failed to load: {e}")
+                log_error_to_discord(e, source=f"EchoProPulse {self.version}")
+                continue
+            self.marks["cogs_s"][name] = round(time.perf_counter() - t, 4)
+        self.marks["cogs_total_s"] = round(time.perf_counter() - t0, 4)
+        print(f"🧩 Loaded cogs {', '.join(self.marks['cogs_s'])} in {self.marks['cogs_total_s'] * 1000:.0f} ms")
+
+    async def on_ready(self):
+        print(f"✅ EchoProPulse ({self.version}) logged in as {self.user}")
+        if self._ready_once:
+            return      # on_ready fires again after every gateway reconnect
+        self._ready_once = True
+        self.marks["login_s"] = round(process_uptime(), 3)
+        print(f"⏱️ Ready {self.marks['login_s']:.2f}s after process start "
+              f"(imports {self.marks['import_s']:.2f}s, cogs {self.marks.get('cogs_total_s', 0):.2f}s)")
+        self.record_startup()
+        if STARTUP_BENCH:
+            await self.close()
+            return
+
+        self.start_health()
+        await self.sync_commands()
+        self.announce_online()
+        if self.marks["login_s"] > STARTUP_BUDGET:
+            from discord_notify import notify_logs
+            notify_logs(f"🐢 {self.version} took {self.marks['login_s']:.1f}s to become ready "
+                        f"(budget {STARTUP_BUDGET:.0f}s)")
+
+    async def sync_commands(self):
+        try:
+            if self.config.get("guild_sync") and GUILD_ID:
+                guild = discord.Object(id=GUILD_ID)
+                self.tree.copy_global_to(guild=guild)
+                synced = await self.tree.sync(guild=guild)
+            else:
+                synced = await self.tree.sync()
+            print(f"✅ Synced {len(synced)} slash commands with Discord.")
+            return synced
+        except discord.HTTPException as e:
+            print(f"⚠️ Command sync failed: {e}")
+            return None
+
+    def announce_online(self):
+        from discord_notify import notify_logs
+        trading = "🟢 Enabled" if self.trading.live else "🔴 Disabled"
+        notify_logs(f"🟢 **EchoProPulse {self.version} started** • 💹 Trading: {trading} • "
+                    f"💰 Wallet: `{SOLANA_WALLET}` • 🧩 {', '.join(self.cog_names)}")
+        ch = self.get_channel(ALERT_CHANNEL_ID)
+        if ch:
+            embed = embed_base("🚀 EchoProPulse Online",
+                               f"🧩 **Version:** {self.version}\n💹 **Trading:** {trading}\n"
+                               f"💰 **Wallet:** `{SOLANA_WALLET}`\n🕒 **Started:** {self.started:%I:%M %p EST}")
+            self.loop.create_task(ch.send(embed=embed))
+
+    def start_health(self):
+        """Loop monitor + heartbeat + /metrics; imported here so numpy loads after login."""
+        from liveness import Heartbeat, read_heartbeat, heartbeat_age
+        from loop_monitor import LoopMonitor
+        from notify_dispatcher import get_dispatcher
+        from discord_notify import notify_logs
+
+        def loop_state_changed(degraded, summary):
+            if degraded:
+                stall = summary.get("last_stall", {}).get("where", "n/a")
+                notify_logs(f"🟠 Event loop degraded — lag p99 {summary['lag_p99_ms']} ms\n🐢 Last stall: `{stall}`")
+            else:
+                notify_logs(f"🟢 Event loop recovered — lag p99 {summary['lag_p99_ms']} ms")
+
+        self.loop_monitor = LoopMonitor(self, queues={
+            "notify": lambda: sum(get_dispatcher().queue_depths().values()),
+            "activity_log": lambda: get_activity_log(ACTIVITY_LOG).queue.qsize(),
+        }, on_state=loop_state_changed)
+        self.heartbeat = Heartbeat(f"echopropulse-{self.version}", extra=self.loop_monitor.heartbeat_fields)
+        self.loop_monitor.start()
+        self.loop.create_task(self.heartbeat.run())
+
+        def loop_lag_p99():
+            p99 = self.loop_monitor.summary().get("lag_p99_ms")
+            return None if p99 is None else p99 / 1000
+
+        registry.gauge_func("heartbeat_age_seconds", "Seconds since the heartbeat file was written.",
+                            lambda: heartbeat_age(read_heartbeat()))
+        registry.gauge_func("event_loop_lag_p99_seconds", "Event loop scheduling lag p99 over the monitor window.",
+                            loop_lag_p99)
+        start_http_server()
+        self.dispatch("health_ready")
+
+    def record_startup(self):
+        """Append the startup marks as one JSON line (again after the first command, with its timing)."""
+        try:
+            with open(STARTUP_LOG, "a") as f:
+                f.write(json.dumps(self.marks) + "\n")
+        except OSError as e:
+            print(f"⚠️ Startup log write failed: {e}")
+
+    def uptime_str(self):
+        hours, remainder = divmod(int((datetime.now(EST) - self.started).total_seconds()), 3600)
+        return f"{hours}h {remainder // 60}m"
+
+    # ------------------------------------------------------
+    # Command metrics + errors
+    # ------------------------------------------------------
+    def _first_command(self, name):
+        if "first_command_s" not in self.marks:
+            self.marks["first_command_s"] = round(process_uptime(), 3)
+            self.marks["first_command"] = name
+            self.record_startup()
+
+    async def on_command_done(self, inter, command):
+        COMMAND_SECONDS.observe(interaction_deadline.elapsed(inter), command.qualified_name, "ok")
+        self._first_command(command.qualified_name)
+
+    async def on_app_command_error(self, inter, error: app_commands.AppCommandError):
+        name = inter.command.qualified_name if inter.command else "unknown"
+        COMMAND_SECONDS.observe(interaction_deadline.elapsed(inter), name, type(error).__name__)
+        self._first_command(name)
+        print(f"⚠️ /{name} failed: {error}")
+        traceback.print_exception(error)
+        if isinstance(error, app_commands.CommandInvokeError):
+            log_error_to_discord(error.original, source=f"EchoProPulse {self.version}")
+        try:
+            if interaction_deadline.needs_reply(inter):
+                await inter.response.send_message("⚠️ Command failed.", ephemeral=True)
+        except discord.HTTPException:
+            pass
+
+    # ------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------
+    async def graceful_shutdown(self):
+        print("⚠️ Shutdown signal received.")
+        ch = self.get_channel(ALERT_CHANNEL_ID)
+        if ch:
+            try:
+                await ch.send(embed=embed_base("🔴 EchoProPulse Offline",
+                                               f"Bot shutdown at {datetime.now(EST):%I:%M %p EST}", color=0xFF0040))
+            except discord.HTTPException as e:
+                print(f"⚠️ Failed to send offline alert: {e}")
+        await self.close()     # unloads every cog (cog_unload releases their workers)
+        print("🧹 Clean shutdown complete.")
+
+
+def create_bot(profile="v10", cogs=None):
+    return EchoBot(profile, cogs)
+
+
+def run(profile="v10", cogs=None):
+    bot = create_bot(profile, cogs)
+    print(f"✅ Starting EchoProPulse {bot.version} ({profile} profile: {', '.join(bot.cog_names)})")
+    print(f"🔍 Token found? {'YES' if DISCORD_TOKEN else 'NO'}")
+    if not DISCORD_TOKEN:
+        print("❌ Missing DISCORD_BOT_TOKEN in .env")
+        sys.exit(1)
+    try:
+        bot.run(DISCORD_TOKEN, reconnect=True)
+    except Exception as e:
+        log_error_to_discord(f"Startup failed: {e}")
+        print(f"❌ Fatal error: {e}")
+        sys.exit(1)
+
+
+_IMPORT_S = process_uptime()
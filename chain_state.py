@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# ==========================================================
+# ⛓️ EchoProPulse Chain-State Prefetcher
+# Background task that keeps a fresh recent blockhash and
+# rolling priority-fee percentiles in memory, so the swap
+# path reads them without a network round trip.
+# ==========================================================
+import os
+import math
+import time
+import asyncio
+from collections import deque
+from rpc_pool import get_pool
+
+REFRESH_MS = int(os.getenv("CHAIN_STATE_REFRESH_MS", "400"))
+FEE_WINDOW = int(os.getenv("PRIORITY_FEE_WINDOW", "600"))   # samples kept for percentiles
+MAX_STALE_S = float(os.getenv("CHAIN_STATE_MAX_STALE", "5"))
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already-sorted list."""
+    if not sorted_values:
+        return 0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(pct * len(sorted_values) / 100.0) - 1))
+    return sorted_values[k]
+
+
+class ChainStatePrefetcher:
+    """
+    Polls getLatestBlockhash and getRecentPrioritizationFees every `refresh_ms`.
+    Readers use the attributes directly; `is_fresh()` says whether they can be trusted.
+    """
+
+    def __init__(self, pool=None, refresh_ms=REFRESH_MS, fee_window=FEE_WINDOW, fee_accounts=None):
+        self.pool = pool
+        self.refresh = refresh_ms / 1000.0
+        self.fee_accounts = list(fee_accounts or [])
+        self.blockhash = None
+        self.last_valid_block_height = None
+        self.slot = None
+        self.updated_at = 0.0
+        self.errors = 0
+        self._fees = deque(maxlen=fee_window)
+        self._fee_slots = deque(maxlen=fee_window)
+        self._pct = {"p50": 0, "p75": 0, "p95": 0}
+        self._task = None
+        self._ready = asyncio.Event()
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+    async def start(self, wait=True):
+        if self.pool is None:
+            self.pool = await get_pool()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+        if wait:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=MAX_STALE_S)
+            except asyncio.TimeoutError:
+                print("⚠️ Chain-state prefetcher not ready yet; continuing without it.")
+        return self
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------
+    async def refresh_once(self):
+        bh, fees = await asyncio.gather(
+            self.pool.call("getLatestBlockhash", [{"commitment": "confirmed"}]),
+            self.pool.call("getRecentPrioritizationFees", [self.fee_accounts] if self.fee_accounts else []),
+            return_exceptions=True,
+        )
+        if isinstance(bh, Exception) and isinstance(fees, Exception):
+            raise bh
+
+        if not isinstance(bh, Exception):
+            self.blockhash = bh["value"]["blockhash"]
+            self.last_valid_block_height = bh["value"].get("lastValidBlockHeight")
+            self.slot = bh.get("context", {}).get("slot", self.slot)
+            self.updated_at = time.monotonic()
+
+        if not isinstance(fees, Exception) and fees:
+            newest = self._fee_slots[-1] if self._fee_slots else -1
+            for row in sorted(fees, key=lambda r: r["slot"]):
+                if row["slot"] > newest:
+                    self._fee_slots.append(row["slot"])
+                    self._fees.append(row["prioritizationFee"])
+            ordered = sorted(self._fees)
+            self._pct = {
+                "p50": percentile(ordered, 50),
+                "p75": percentile(ordered, 75),
+                "p95": percentile(ordered, 95),
+            }
+
+        if self.blockhash:
+            self._ready.set()
+
+    async def _loop(self):
+        while True:
+            t0 = time.monotonic()
+            try:
+                await self.refresh_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                if self.errors % 50 == 1:
+                    print(f"⚠️ Chain-state refresh failed ({self.errors}x): {e}")
+            await asyncio.sleep(max(0.0, self.refresh - (time.monotonic() - t0)))
+
+    # ------------------------------------------------------
+    # Readers (no I/O)
+    # ------------------------------------------------------
+    def age(self):
+        return time.monotonic() - self.updated_at if self.updated_at else float("inf")
+
+    def is_fresh(self, max_age=MAX_STALE_S):
+        return self.blockhash is not None and self.age() <= max_age
+
+    def fees(self):
+        """Priority fee percentiles in micro-lamports per compute unit."""
+        return dict(self._pct)
+
+    def priority_fee(self, level="p75"):
+        return self._pct.get(level, 0)
+
+    def snapshot(self):
+        return {
+            "blockhash": self.blockhash,
+            "slot": self.slot,
+            "age_ms": round(self.age() * 1000, 1) if self.updated_at else None,
+            "fees": self.fees(),
+            "errors": self.errors,
+        }
+
+
+# ==========================================================
+# SHARED PREFETCHER
+# ==========================================================
+_prefetcher = None
+
+
+async def get_prefetcher(wait=False):
+    """Process-wide prefetcher, started on first use. Pass wait=True at startup to warm it."""
+    global _prefetcher
+    if _prefetcher is None:
+        _prefetcher = ChainStatePrefetcher()
+    await _prefetcher.start(wait=wait)
+    return _prefetcher
+
+
+async def stop_prefetcher():
+    global _prefetcher
+    if _prefetcher is not None:
+        await _prefetcher.stop()
+        _prefetcher = None
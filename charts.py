@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 📊 EchoProPulse Health Charts
+# Renders CPU / memory / disk / loop-lag charts from the
+# metrics_sampler series. matplotlib runs in a one-worker
+# ProcessPoolExecutor, so rendering never touches the event loop
+# and matplotlib is never imported into the bot. The worker comes
+# from a forkserver, never a fork of the multi-threaded bot; it
+# re-imports the entry script as __mp_main__, which is fine now
+# that the entry points only run under `if __name__ == "__main__"`.
+# start() launches it and pre-imports matplotlib in the background.
+# PNGs are cached by (metrics, window, last sample timestamp):
+# every request inside one sample period reuses the same image,
+# and concurrent requests for it share a single render.
+# ==========================================================
+import io
+import os
+import asyncio
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from metrics_sampler import FIELDS, UNITS, WINDOWS
+
+CHART_METRICS = ("cpu", "mem", "disk", "loop_lag_ms")
+CACHE_SIZE = int(os.getenv("CHART_CACHE_SIZE", "16"))
+EST = ZoneInfo("America/New_York")
+
+LABELS = {"cpu": "CPU %", "mem": "Memory %", "disk": "Disk %", "load1": "Load 1m",
+          "net_rx_kbps": "Net ↓ kB/s", "net_tx_kbps": "Net ↑ kB/s", "rss_mb": "Bot RSS MB",
+          "loop_lag_ms": "Loop lag p99 ms"}
+COLORS = {"cpu": "#E67E22", "mem": "#3498DB", "disk": "#9B59B6", "loop_lag_ms": "#2ECC71"}
+
+
+# ==========================================================
+# RENDERING (worker process)
+# ==========================================================
+def _render_png(ts, values, metrics, window):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
+    times = [datetime.fromtimestamp(t, EST) for t in ts]
+    with plt.style.context("dark_background"):
+        fig, axes = plt.subplots(len(metrics), 1, figsize=(8, 1.5 * len(metrics) + 0.6), sharex=True, dpi=100)
+        axes = axes if len(metrics) > 1 else [axes]
+        for ax, metric, column in zip(axes, metrics, values.T):
+            color = COLORS.get(metric, "#1ABC9C")
+            ax.plot(times, column, color=color, linewidth=1.2)
+            ax.fill_between(times, column, color=color, alpha=0.15)
+            ax.set_ylabel(LABELS.get(metric, metric), fontsize=8)
+            ax.grid(alpha=0.2)
+            ax.tick_params(labelsize=7)
+            if UNITS.get(metric) == "%":
+                ax.set_ylim(0, 100)
+            else:
+                ax.set_ylim(bottom=0)
+        axes[-1].xaxis.set_major_formatter(mdates.DateFormatter("%H:%M", tz=EST))
+        axes[0].set_title(f"EchoProPulse VPS — last {window}", fontsize=10)
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png")
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def _warm():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401  (pay the import in the worker up front)
+
+
+# ==========================================================
+# CACHE + EXECUTOR (bot process)
+# ==========================================================
+_executor = None
+_cache = OrderedDict()     # key → asyncio.Future[bytes | None]
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("forkserver"))
+    return _executor
+
+
+def start():
+    """Start the render worker now and let it import matplotlib in the background (non-blocking)."""
+    get_executor().submit(_warm)
+
+
+async def render_health_chart(sampler, window="1h", metrics=CHART_METRICS):
+    """PNG bytes for `metrics` over `window` (a WINDOWS key), or None with fewer than two samples."""
+    ts, values = sampler.series(WINDOWS[window])
+    if len(ts) < 2:
+        return None
+    key = (tuple(metrics), window, float(ts[-1]))
+    fut = _cache.get(key)
+    if fut is None:
+        cols = [FIELDS.index(m) for m in metrics]
+        fut = asyncio.ensure_future(asyncio.get_running_loop().run_in_executor(
+            get_executor(), _render_png, ts, values[:, cols], tuple(metrics), window))
+        _cache[key] = fut
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    try:
+        return await asyncio.shield(fut)
+    except BrokenProcessPool as e:
+        _cache.pop(key, None)
+        print(f"⚠️ Chart worker died, restarting: {e}")
+        shutdown()
+        return None
+    except Exception as e:
+        _cache.pop(key, None)
+        print(f"⚠️ Chart render failed: {e}")
+        return None
+
+
+def shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    _cache.clear()      # drop renders that were cancelled with the old worker
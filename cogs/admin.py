@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🛠️ Admin cog — /restart, /shutdown, /sync, /cog
+# /cog loads or unloads a feature cog on the running bot, so a
+# lean profile can pull in e.g. diagnostics only when needed.
+# ==========================================================
+import os
+import asyncio
+import discord
+import aiohttp
+from discord import app_commands
+from discord.ext import commands
+
+from bot_core import ALERT_CHANNEL_ID, ALL_COGS, is_admin, embed_base, log_action, restart_service
+
+GITHUB_REPO = "missxtina11/EchoProPulse"
+LAST_COMMIT_FILE = "/root/EchoProPulse/discord_bot/last_commit.txt"
+
+
+class Admin(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.update_task = None
+
+    async def cog_load(self):
+        if self.bot.config.get("github_updates"):
+            self.update_task = asyncio.create_task(self.daily_update_task())
+
+    async def cog_unload(self):
+        if self.update_task:
+            self.update_task.cancel()
+
+    # ------------------------------------------------------
+    # Slash commands
+    # ------------------------------------------------------
+    @app_commands.command(name="restart", description="Restart the EchoProPulse service (Admin only)")
+    async def restart(self, inter: discord.Interaction):
+        from discord_notify import notify_logs
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        await inter.response.send_message("🔄 Restarting EchoProPulse...", ephemeral=True)
+        notify_logs(f"🔁 Restart initiated by {inter.user.mention}")
+        ok, detail = await restart_service()
+        if not ok:
+            await inter.followup.send(f"⚠️ Restart failed ({detail}).", ephemeral=True)
+        log_action(inter, "/restart", "OK" if ok else f"FAIL: {detail}")
+
+    @app_commands.command(name="shutdown", description="Shutdown the EchoProPulse bot (Admin only)")
+    async def shutdown(self, inter: discord.Interaction):
+        from discord_notify import notify_logs
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        notify_logs(f"⛔ Manual shutdown by {inter.user.mention}")
+        await inter.response.send_message("⛔ Bot shutting down...", ephemeral=True)
+        log_action(inter, "/shutdown")
+        await self.bot.graceful_shutdown()
+
+    @app_commands.command(name="sync", description="Re-sync all EchoProPulse commands (Admin only)")
+    async def sync(self, inter: discord.Interaction):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Unauthorized.", ephemeral=True)
+            return
+        await inter.response.defer(ephemeral=True)
+        synced = await self.bot.sync_commands()
+        if synced is None:
+            await inter.followup.send("⚠️ Sync failed — see the bot log.", ephemeral=True)
+            return
+        await inter.followup.send(f"✅ Synced {len(synced)} commands.", ephemeral=True)
+        log_action(inter, "/sync")
+
+    @app_commands.command(name="cog", description="Load, unload or reload a feature cog (Admin only)")
+    @app_commands.describe(action="What to do", name="Which cog")
+    @app_commands.choices(action=[app_commands.Choice(name=a, value=a) for a in ("load", "unload", "reload")],
+                          name=[app_commands.Choice(name=c, value=c) for c in ALL_COGS])
+    async def cog(self, inter: discord.Interaction, action: str, name: str):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        if name == "admin" and action == "unload":
+            await inter.response.send_message("🚫 Unloading admin would remove /cog itself.", ephemeral=True)
+            return
+        await inter.response.defer(ephemeral=True)
+        ext = f"cogs.{name}"
+        try:
+            if action == "load":
+                await self.bot.load_extension(ext)
+            elif action == "unload":
+                await self.bot.unload_extension(ext)
+            else:
+                await self.bot.reload_extension(ext)
+        except commands.ExtensionError as e:
+            await inter.followup.send(f"⚠️ {action} {name} failed: {e}", ephemeral=True)
+            log_action(inter, f"/cog {action} {name}", f"FAIL: {e}")
+            return
+        synced = await self.bot.sync_commands()
+        loaded = ", ".join(sorted(e.split(".", 1)[1] for e in self.bot.extensions))
+        await inter.followup.send(f"✅ {action} {name} • synced {len(synced or [])} commands\n🧩 Loaded: {loaded}",
+                                  ephemeral=True)
+        log_action(inter, f"/cog {action} {name}")
+
+    # ------------------------------------------------------
+    # GitHub auto-update notifier
+    # ------------------------------------------------------
+    async def daily_update_task(self):
+        await self.bot.wait_until_ready()
+        while True:
+            await self.check_github_updates()
+            await asyncio.sleep(86400)  # 24 hours (in seconds)
+
+    async def check_github_updates(self):
+        """Daily check for new commits on GitHub."""
+        url = f"https://api.github.com/repos/{GITHUB_REPO}/commits/main"
+        try:
+            async with aiohttp.ClientSession() as s:
+                async with s.get(url) as r:
+                    if r.status == 200:
+                        data = await r.json()
+                        latest = data["sha"]
+                        old = ""
+                        if os.path.exists(LAST_COMMIT_FILE):
+                            with open(LAST_COMMIT_FILE) as f:
+                                old = f.read().strip()
+                        if latest != old:
+                            with open(LAST_COMMIT_FILE, "w") as f:
+                                f.write(latest)
+                            ch = self.bot.get_channel(ALERT_CHANNEL_ID)
+                            if ch:
+                                await ch.send(embed=embed_base(
+                                    "🔔 Update Available",
+                                    f"New commit detected on **{GITHUB_REPO}**\n"
+                                    f"Commit SHA: `{latest[:7]}`\nPull latest to update EchoProPulse."))
+                                print("🆕 GitHub update alert sent.")
+        except Exception as e:
+            print(f"⚠️ GitHub update check failed: {e}")
+
+
+async def setup(bot):
+    await bot.add_cog(Admin(bot))
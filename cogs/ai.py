@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🧠 AI cog — /analyze (also as a "/analyze" text command)
+# The AI router loads on the first analysis, not at startup.
+# ==========================================================
+import asyncio
+from discord.ext import commands
+
+
+class AI(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="analyze", description="Run the AI chart analysis")
+    async def analyze(self, ctx: commands.Context):
+        from ai_engine.ai_router import route_ai_analysis
+        await ctx.defer()
+        token_data = {"symbol": "STB", "price": 0.004, "volume24h": 150000}
+        result = await asyncio.to_thread(route_ai_analysis, "chart", token_data)
+        await ctx.send(result)
+
+
+async def setup(bot):
+    await bot.add_cog(AI(bot))
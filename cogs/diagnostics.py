@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🧠 Diagnostics cog — /diagnostics, log viewer, hourly VPS report
+# psutil/numpy (metrics_sampler) load once the bot has logged in,
+# not while it is connecting; matplotlib only in the chart worker.
+# ==========================================================
+import io
+import os
+import sys
+import asyncio
+from datetime import datetime
+import discord
+from discord import app_commands, ButtonStyle, Embed
+from discord.ext import commands, tasks
+from discord.ui import View, Select, Modal, TextInput
+
+from bot_core import EST, VPS_CHANNEL_ID, is_admin
+
+# metrics_sampler.WINDOWS keys (kept literal so loading the cog doesn't import numpy)
+WINDOW_CHOICES = ("5m", "1h", "6h", "24h")
+LOG_PAGE_LINES = 40
+
+
+# ==========================================================
+# LOG VIEWER
+# ==========================================================
+class LogSearchModal(Modal, title="🔎 Search Logs"):
+    keyword = TextInput(label="Keyword", required=False, max_length=100, placeholder="e.g. restart")
+    since = TextInput(label="Since", required=False, max_length=25, placeholder="6h, 2d or 2025-10-25 14:00")
+    until = TextInput(label="Until", required=False, max_length=25, placeholder="blank = now")
+
+    def __init__(self, viewer):
+        super().__init__()
+        self.viewer = viewer
+
+    async def on_submit(self, inter: discord.Interaction):
+        from log_index import parse_when
+        try:
+            start, end = parse_when(self.since.value), parse_when(self.until.value)
+        except ValueError:
+            await inter.response.send_message("⚠️ Couldn't read that time. Use `6h`, `2d` or `YYYY-MM-DD HH:MM`.", ephemeral=True)
+            return
+        self.viewer.keyword = self.keyword.value.strip() or None
+        self.viewer.start, self.viewer.end = start, end
+        self.viewer.cursors = [None]
+        await self.viewer.refresh(inter)
+
+
+class LogViewer(View):
+    """Paginated, newest-first view over one log; pages come from log_index (mmap + sparse index)."""
+
+    def __init__(self, name="bot"):
+        from log_index import LOG_FILES
+        super().__init__(timeout=600)
+        self.name = name
+        self.keyword = self.start = self.end = None
+        self.cursors = [None]   # `before` offset of each page visited; last = current page
+        self.next_cursor = None
+        picker = Select(placeholder="Choose a log", options=[
+            discord.SelectOption(label=n, value=n, default=(n == name)) for n in LOG_FILES
+        ])
+        picker.callback = self.pick
+        self.picker = picker
+        self.add_item(picker)
+
+    async def render(self):
+        from log_index import LOG_FILES, log_file, paginate
+        lf = log_file(LOG_FILES[self.name])
+        query = (lf.search, self.keyword, self.start, self.end)
+        lines, self.next_cursor = await asyncio.to_thread(*query, LOG_PAGE_LINES, self.cursors[-1])
+        body, cut = paginate(lines)
+        if cut and len(lines) > cut:
+            # long lines: re-query the smaller page so the cut lines start the next one
+            lines, self.next_cursor = await asyncio.to_thread(*query, len(lines) - cut, self.cursors[-1])
+            body, _ = paginate(lines)
+        filters = []
+        if self.keyword:
+            filters.append(f"🔎 `{self.keyword}`")
+        if self.start or self.end:
+            filters.append(f"🕒 {self.start or '…'} → {self.end or 'now'}")
+        embed = Embed(
+            title=f"🪵 {self.name} log",
+            description=f"```\n{body or '(no matching lines)'}\n```",
+            color=discord.Color.dark_grey()
+        )
+        if filters:
+            embed.add_field(name="Filters", value=" • ".join(filters), inline=False)
+        size = os.path.getsize(LOG_FILES[self.name]) if os.path.exists(LOG_FILES[self.name]) else 0
+        embed.set_footer(text=f"Page {len(self.cursors)} • newest first • {size / 1e6:.1f} MB")
+        self.older.disabled = self.next_cursor is None
+        self.newer.disabled = len(self.cursors) == 1
+        for opt in self.picker.options:
+            opt.default = opt.value == self.name
+        return embed
+
+    async def refresh(self, inter):
+        await inter.response.defer()
+        await inter.edit_original_response(embed=await self.render(), view=self)
+
+    async def pick(self, inter: discord.Interaction):
+        self.name = self.picker.values[0]
+        self.cursors = [None]
+        await self.refresh(inter)
+
+    @discord.ui.button(label="◀ Older", style=ButtonStyle.secondary)
+    async def older(self, inter: discord.Interaction, _):
+        if self.next_cursor is not None:
+            self.cursors.append(self.next_cursor)
+        await self.refresh(inter)
+
+    @discord.ui.button(label="Newer ▶", style=ButtonStyle.secondary)
+    async def newer(self, inter: discord.Interaction, _):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        await self.refresh(inter)
+
+    @discord.ui.button(label="🔎 Search", style=ButtonStyle.primary)
+    async def search(self, inter: discord.Interaction, _):
+        await inter.response.send_modal(LogSearchModal(self))
+
+    @discord.ui.button(label="🔄 Latest", style=ButtonStyle.success)
+    async def latest(self, inter: discord.Interaction, _):
+        self.keyword = self.start = self.end = None
+        self.cursors = [None]
+        await self.refresh(inter)
+
+
+# ==========================================================
+# COG
+# ==========================================================
+class Diagnostics(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        # Loaded (or reloaded) with /cog after login: health_ready has already fired
+        if self.bot.loop_monitor is not None:
+            await self.start_background()
+
+    async def cog_unload(self):
+        self.vps_status_report.cancel()
+        charts = sys.modules.get("charts")
+        if charts is not None:      # only if the worker was ever started
+            charts.shutdown()
+
+    @commands.Cog.listener("on_health_ready")
+    async def on_health_ready(self):
+        await self.start_background()
+
+    async def start_background(self):
+        """Chart worker, loop-lag sampling and the hourly VPS report (after login)."""
+        import charts
+        from metrics_sampler import get_sampler
+        # forkserver worker (see charts.py); launching it takes ~0.1 s, so not on the loop
+        await asyncio.to_thread(charts.start)
+        sampler = get_sampler()
+        monitor = self.bot.loop_monitor
+        if monitor is not None:
+            # p99 loop lag over each sample period, so charts can plot it next to CPU/memory
+            per_sample = max(1, int(sampler.interval / monitor.interval))
+            sampler.sources["loop_lag_ms"] = lambda: monitor.lag_percentile(99, last=per_sample)
+        if not self.vps_status_report.is_running():
+            self.vps_status_report.start()
+
+    @app_commands.command(name="diagnostics", description="Run VPS diagnostics (Admin only)")
+    @app_commands.describe(window="Range for min/avg/max (default 1h)")
+    @app_commands.choices(window=[app_commands.Choice(name=w, value=w) for w in WINDOW_CHOICES])
+    async def diagnostics(self, inter: discord.Interaction, window: str = "1h"):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        import charts
+        from metrics_sampler import get_sampler, format_window, WINDOWS
+        from discord_notify import notify_logs
+        sampler = get_sampler()
+        now = sampler.latest()
+        if now is None:
+            await inter.response.send_message("⏳ Metrics sampler is warming up — try again in a few seconds.", ephemeral=True)
+            return
+        await inter.response.defer(ephemeral=True)
+        cpu, mem, disk = now["cpu"], now["mem"], now["disk"]
+        stats = sampler.window(WINDOWS[window])
+        png = await charts.render_health_chart(sampler, window)
+        embed = Embed(
+            title="🧠 System Diagnostics",
+            description=(
+                f"CPU: {cpu:.1f}% | MEM: {mem:.1f}% | DISK: {disk:.1f}%\n"
+                f"🌐 Net: ↓{now['net_rx_kbps']:.1f} ↑{now['net_tx_kbps']:.1f} kB/s | 🐍 RSS: {now['rss_mb']:.0f} MB\n"
+                f"**Last {window}** (min / avg / max, {stats['samples']} samples)\n"
+                f"```\n{format_window(stats)}\n```"
+            ),
+            color=0x2ECC71 if cpu < 70 else 0xE67E22 if cpu < 90 else 0xE74C3C
+        )
+        files = []
+        if png:
+            files.append(discord.File(io.BytesIO(png), filename="health.png"))
+            embed.set_image(url="attachment://health.png")
+        await inter.followup.send(embed=embed, files=files, ephemeral=True)
+        notify_logs(f"🧠 Diagnostics by {inter.user.mention}: CPU {cpu:.1f}%, MEM {mem:.1f}%, DISK {disk:.1f}%")
+
+    @commands.Cog.listener("on_interaction")
+    async def on_logs_button(self, inter: discord.Interaction):
+        if inter.type != discord.InteractionType.component or inter.data.get("custom_id") != "btn_logs":
+            return
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        await inter.response.defer(ephemeral=True, thinking=True)
+        viewer = LogViewer()
+        await inter.followup.send(embed=await viewer.render(), view=viewer, ephemeral=True)
+
+    # ------------------------------------------------------
+    # VPS auto status loop
+    # ------------------------------------------------------
+    @tasks.loop(hours=1)
+    async def vps_status_report(self):
+        try:
+            import psutil
+            import charts
+            from metrics_sampler import get_sampler, format_window, WINDOWS
+            sampler = get_sampler()
+            now = sampler.latest()
+            if now is None:
+                return
+            hour = sampler.window(WINDOWS["1h"])
+            cpu, mem, disk = now["cpu"], now["mem"], now["disk"]
+            uptime = str(datetime.utcnow() - datetime.utcfromtimestamp(psutil.boot_time()))
+            color = 0x00FF00 if cpu < 70 else 0xE67E22 if cpu < 90 else 0xE74C3C
+
+            embed = Embed(title="🖥️ VPS Health Report", color=color)
+            embed.add_field(name="💾 Memory", value=f"{mem:.1f}%", inline=True)
+            embed.add_field(name="🔥 CPU", value=f"{cpu:.1f}%", inline=True)
+            embed.add_field(name="📦 Disk", value=f"{disk:.1f}%", inline=True)
+            embed.add_field(name="📊 Last hour (min / avg / max)", value=f"```\n{format_window(hour)}\n```", inline=False)
+            embed.add_field(name="⏱️ Uptime", value=uptime.split('.')[0], inline=False)
+            embed.set_footer(text=f"EchoProPulse {self.bot.version} • {datetime.now(EST):%I:%M %p EST}")
+            png = await charts.render_health_chart(sampler, "1h")
+
+            ch = self.bot.get_channel(VPS_CHANNEL_ID)
+            if ch:
+                files = []
+                if png:
+                    files.append(discord.File(io.BytesIO(png), filename="vps_health.png"))
+                    embed.set_image(url="attachment://vps_health.png")
+                await ch.send(embed=embed, files=files)
+                print(f"✅ VPS report sent to {VPS_CHANNEL_ID}")
+        except Exception as e:
+            print(f"❌ VPS report error: {e}")
+
+    @vps_status_report.before_loop
+    async def before_vps_report(self):
+        # The first iteration runs right away: wait for the sampler's first sample
+        # instead of skipping the startup report until the next hour
+        from metrics_sampler import get_sampler
+        sampler = get_sampler()
+        while sampler.latest() is None:
+            await asyncio.sleep(1)
+
+
+async def setup(bot):
+    await bot.add_cog(Diagnostics(bot))
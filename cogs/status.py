@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 📊 Status cog — /start control panel, /status, /about
+# ==========================================================
+from datetime import datetime
+import discord
+from discord import app_commands, ButtonStyle, Embed
+from discord.ext import commands
+from discord.ui import View, Button
+
+from bot_core import EST, SOLANA_WALLET, is_admin, embed_base, log_action
+
+
+class ControlPanel(View):
+    def __init__(self, is_admin=False):
+        super().__init__(timeout=None)
+
+        # SYSTEM CONTROLS
+        self.add_item(Button(label="📊 Status", style=ButtonStyle.success, custom_id="btn_status"))
+        self.add_item(Button(label="🪵 Logs", style=ButtonStyle.secondary, custom_id="btn_logs"))
+        self.add_item(Button(label="🔄 Restart", style=ButtonStyle.danger, custom_id="btn_restart"))
+
+        # TRADING CONTROLS
+        self.add_item(Button(label="💹 Toggle Trading", style=ButtonStyle.primary, custom_id="btn_power"))
+
+        # ANALYTICS
+        self.add_item(Button(label="📈 Diagnostics", style=ButtonStyle.success, custom_id="btn_diagnostics"))
+        self.add_item(Button(label="👛 Wallets", style=ButtonStyle.secondary, custom_id="btn_wallets"))
+        self.add_item(Button(label="📊 Holders", style=ButtonStyle.secondary, custom_id="btn_holders"))
+
+        # ADMIN
+        if is_admin:
+            self.add_item(Button(label="🧩 Admin Panel", style=ButtonStyle.blurple, custom_id="btn_admin"))
+            self.add_item(Button(label="🔁 Sync", style=ButtonStyle.success, custom_id="btn_sync"))
+            self.add_item(Button(label="⛔ Shutdown", style=ButtonStyle.danger, custom_id="btn_shutdown"))
+
+
+class Status(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    def status_embed(self):
+        from liveness import read_heartbeat, heartbeat_age
+        bot = self.bot
+        hb_age = "N/A"
+        age = heartbeat_age(read_heartbeat())
+        if age is not None:
+            hb_age = f"{age:.0f}s ago" if age < 120 else f"{int(age // 60)} min ago"
+        loop = bot.loop_monitor.summary() if bot.loop_monitor else {"state": "starting"}
+        desc = (f"💹 **Trading:** {'🟢 Enabled' if bot.trading.live else '🔴 Disabled'}\n"
+                f"🕒 **Uptime:** {bot.uptime_str()}\n"
+                f"💰 **Wallet:** `{SOLANA_WALLET}`\n"
+                f"❤️ **Heartbeat:** {hb_age}\n"
+                f"🩺 **Event loop:** {loop['state']} • lag p99 {loop.get('lag_p99_ms', 'n/a')} ms\n"
+                f"⚙️ **Version:** {bot.version}")
+        color = 0x2ECC71 if bot.trading.live else 0xE74C3C
+        return embed_base(f"📊 EchoProPulse Status ({bot.version})", desc, color)
+
+    @app_commands.command(name="start", description="Open the EchoProPulse Control Center")
+    async def start(self, inter: discord.Interaction):
+        embed = Embed(
+            title=f"🚀 EchoProPulse Control Center ({self.bot.version})",
+            description=f"💹 Manage bot status, trading and system diagnostics.\n🕒 {datetime.now(EST):%I:%M %p EST}",
+            color=discord.Color.teal()
+        )
+        await inter.response.send_message(embed=embed, view=ControlPanel(is_admin=is_admin(inter)), ephemeral=True)
+        log_action(inter, "/start")
+
+    @app_commands.command(name="status", description="Show current EchoProPulse status and uptime.")
+    async def status(self, inter: discord.Interaction):
+        await inter.response.send_message(embed=self.status_embed(), ephemeral=True)
+        log_action(inter, "/status")
+
+    @app_commands.command(name="about", description="Information about the EchoProPulse bot.")
+    async def about(self, inter: discord.Interaction):
+        embed = embed_base(f"🤖 EchoProPulse {self.bot.version}",
+                           "🔗 Solana Trading Suite\n🧩 EchoProtocol\n🕓 EST Monitoring Active\n♻️ Auto-recovery enabled\n"
+                           f"🧩 Cogs: {', '.join(self.bot.cog_names)}")
+        await inter.response.send_message(embed=embed, ephemeral=True)
+        log_action(inter, "/about")
+
+    @commands.Cog.listener("on_interaction")
+    async def on_status_button(self, inter: discord.Interaction):
+        if inter.type != discord.InteractionType.component or inter.data.get("custom_id") != "btn_status":
+            return
+        await inter.response.send_message(embed=self.status_embed(), ephemeral=True)
+        log_action(inter, "btn_status")
+
+
+async def setup(bot):
+    await bot.add_cog(Status(bot))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 💹 Trading cog — /power, admin trading panel, /pnl, /latency
+# trade_history, swap_trace (numpy) and solana_trade load on first use.
+# ==========================================================
+import os
+import asyncio
+from datetime import datetime, timedelta
+import discord
+from discord import app_commands, ButtonStyle, Embed
+from discord.ext import commands
+from discord.ui import View, Button
+
+from bot_core import (EST, ALERT_CHANNEL_ID, is_admin, embed_base, log_action,
+                      log_error_to_discord, restart_service)
+
+
+class Trading(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def set_trading(self, inter, live):
+        from discord_notify import notify_logs
+        self.bot.trading.set(live)
+        state_text = "⚡ Trading ENABLED" if live else "⛔ Trading DISABLED"
+        notify_logs(f"⚙️ {inter.user.mention} set trading: {state_text}")
+        ch = self.bot.get_channel(ALERT_CHANNEL_ID)
+        if ch:
+            await ch.send(f"{'🟢 Trading enabled' if live else '🔴 Trading stopped'} by {inter.user.mention}")
+        log_action(inter, "Start Trading" if live else "Stop Trading")
+        if live:
+            await self.warm_trading()
+        return state_text
+
+    async def warm_trading(self):
+        """Pay the RPC connect, key decrypt and chain-state warm-up before the first swap, off the loop."""
+        try:
+            from solana_trade import start_trading
+            await start_trading()
+        except Exception as e:
+            print(f"⚠️ Trading warm-up failed: {e}")
+            log_error_to_discord(e, source=f"EchoProPulse {self.bot.version}")
+
+    @commands.Cog.listener("on_health_ready")
+    async def on_health_ready(self):
+        if self.bot.trading.live:
+            await self.warm_trading()
+
+    # ------------------------------------------------------
+    # Slash commands
+    # ------------------------------------------------------
+    @app_commands.command(name="power", description="Toggle trading ON/OFF (Admin only)")
+    async def power(self, inter: discord.Interaction):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        live = not self.bot.trading.live
+        await inter.response.send_message("⚡ Trading ENABLED" if live else "⛔ Trading DISABLED", ephemeral=True)
+        await self.set_trading(inter, live)
+
+    @app_commands.command(name="pnl", description="Per-token volume, fees and P&L (Admin only)")
+    @app_commands.describe(days="Window in days (default 7)")
+    async def pnl(self, inter: discord.Interaction, days: app_commands.Range[int, 1, 365] = 7):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        await inter.response.defer(ephemeral=True)
+        from trade_history import history, format_pnl
+        end = datetime.now(EST)
+        table = await asyncio.to_thread(history.pnl_by_token, end - timedelta(days=days), end)
+        embed = Embed(
+            title=f"💹 Trade P&L — last {days}d",
+            description=format_pnl(table, days),
+            color=discord.Color.teal()
+        )
+        embed.set_footer(text=f"P&L = net token flow (received − spent) • {end:%I:%M %p EST}")
+        await inter.followup.send(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="latency", description="Swap pipeline p50/p90/p99 per stage (Admin only)")
+    @app_commands.describe(trades="Most recent trades to include (default 500)", export="Attach the raw traces (JSONL) for bench/")
+    async def latency(self, inter: discord.Interaction, trades: app_commands.Range[int, 1, 10000] = 500, export: bool = False):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+            return
+        await inter.response.defer(ephemeral=True)
+        from swap_trace import recent_tracer, format_percentiles
+        tracer = await asyncio.to_thread(recent_tracer)
+        stats = tracer.percentiles(last=trades)
+        if not stats:
+            await inter.followup.send("📭 No swap traces recorded yet.", ephemeral=True)
+            return
+        embed = Embed(
+            title=f"⏱️ Swap Latency — last {min(trades, stats['total']['n'])} trades",
+            description=f"```\n{format_percentiles(stats)}\n```",
+            color=discord.Color.blurple()
+        )
+        embed.set_footer(text="total = start of execute_swap → result • context stages only on single swaps")
+        files = []
+        if export:
+            path = f"/tmp/swap_traces_{datetime.now(EST):%Y%m%d_%H%M%S}.jsonl"
+            await asyncio.to_thread(tracer.export_jsonl, path, trades)
+            files.append(discord.File(path, filename=os.path.basename(path)))
+        await inter.followup.send(embed=embed, files=files, ephemeral=True)
+
+    # ------------------------------------------------------
+    # Control panel buttons
+    # ------------------------------------------------------
+    @commands.Cog.listener("on_interaction")
+    async def on_trading_button(self, inter: discord.Interaction):
+        if inter.type != discord.InteractionType.component:
+            return
+        cid = inter.data.get("custom_id", "")
+        if cid == "btn_power":
+            if not is_admin(inter):
+                await inter.response.send_message("🚫 Admin only.", ephemeral=True)
+                return
+            live = not self.bot.trading.live
+            await inter.response.send_message("⚡ Trading ENABLED" if live else "⛔ Trading DISABLED", ephemeral=True)
+            await self.set_trading(inter, live)
+        elif cid in ("btn_admin", "admin_panel"):
+            await self.open_admin_panel(inter)
+
+    async def open_admin_panel(self, inter):
+        if not is_admin(inter):
+            await inter.response.send_message("🚫 Unauthorized.", ephemeral=True)
+            log_action(inter, "admin_panel", "DENIED")
+            return
+
+        async def start_cb(i):
+            await i.response.edit_message(embed=embed_base("🟢 Trading Enabled", "Trading is now active."), view=None)
+            await self.set_trading(i, True)
+            ok, detail = await restart_service()
+            if not ok:
+                log_error_to_discord(f"Service restart failed: {detail}")
+
+        async def stop_cb(i):
+            await i.response.edit_message(embed=embed_base("🔴 Trading Disabled", "Trading paused."), view=None)
+            await self.set_trading(i, False)
+
+        view = View()
+        b1 = Button(label="🟢 Start Trading", style=ButtonStyle.success)
+        b2 = Button(label="🔴 Stop Trading", style=ButtonStyle.danger)
+        b1.callback = start_cb
+        b2.callback = stop_cb
+        view.add_item(b1)
+        view.add_item(b2)
+        await inter.response.send_message(embed=embed_base("🛠️ Admin Panel", "Control system trading below:"),
+                                          view=view, ephemeral=True)
+        log_action(inter, "Admin Panel Opened")
+
+
+async def setup(bot):
+    await bot.add_cog(Trading(bot))
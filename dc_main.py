@@ -1,17 +1,8 @@
-import os, discord
-from discord.ext import commands
-from dotenv import load_dotenv
-from ai_engine.ai_router import route_ai_analysis
+import os
+from bot_core import create_bot
 
-load_dotenv()
-intents = discord.Intents.default()
-bot = commands.Bot(command_prefix="/", intents=intents)
-
-@bot.command()
-async def analyze(ctx):
-    token_data = {"symbol": "STB", "price": 0.004, "volume24h": 150000}
-    result = route_ai_analysis("chart", token_data)
-    await ctx.send(result)
+# AI-only profile: cogs/ai.py (/analyze); the AI router loads on first use
+bot = create_bot("ai")
 
 async def run_discord_bot():
     await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
@@ -26,13 +26,9 @@ fi
   echo "DISCORD_LOG_CHANNEL_ID=$DISCORD_LOG_CHANNEL_ID"
 } >> "$LOG_FILE"
 
-# --- Unified Python helper for Discord notifications
+# --- Discord notifications via the notify relay (no Python startup)
 function send_discord_message() {
-  local MESSAGE="$1"
-  /root/EchoProPulse/venv/bin/python3 - <<PY
-from discord_notify import notify_logs
-notify_logs("$MESSAGE")
-PY
+  "$BOT_DIR/notify.sh" logs "$1"
 }
 
 # --- Check disk usage before cleanup
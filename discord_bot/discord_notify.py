@@ -2,12 +2,18 @@
 # ============================================================
 # 📡 Discord Notification Helper — EchoProPulse Edition
 # Posts structured messages to MAIN, LOGS, and VPS channels.
+# Thin front-end over the shared non-blocking dispatcher in
+# /root/EchoProPulse/notify_dispatcher.py.
 # ============================================================
 import os
-import requests
-from dotenv import load_dotenv
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+from notify_dispatcher import get_dispatcher
+
 # --- Load environment
 load_dotenv(dotenv_path="/root/EchoProPulse/discord_bot/.env")
 
@@ -16,34 +22,19 @@ MAIN_CHANNEL = os.getenv("DISCORD_CHANNEL_ID")
 LOG_CHANNEL = os.getenv("DISCORD_LOG_CHANNEL_ID")
 VPS_CHANNEL = os.getenv("DISCORD_VPS_CHANNEL_ID")
 
-# --- Shared request headers
-HEADERS = {
-    "Authorization": f"Bot {BOT_TOKEN}",
-    "Content-Type": "application/json"
-}
-
 # ============================================================
 # 🔗 Universal Helper
 # ============================================================
 def post_message(channel_id: str, content: str):
-    """Send a message to a specific Discord channel."""
+    """Queue a message for a specific Discord channel; never blocks."""
     if not channel_id or not content:
         print("[WARN] Missing channel ID or content.")
         return False
+    return get_dispatcher(BOT_TOKEN).submit(channel_id, {"content": content})
 
-    url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
-    payload = {"content": content}
-
-    try:
-        response = requests.post(url, headers=HEADERS, json=payload)
-        if response.status_code not in (200, 204):
-            print(f"⚠️ Discord API returned {response.status_code}: {response.text}")
-        else:
-            print(f"✅ Sent message to {channel_id}: {content[:80]}...")
-        return response.ok
-    except Exception as e:
-        print(f"❌ Failed to post to Discord: {e}")
-        return False
+def flush(timeout: float = 10):
+    """Wait for queued notifications to be delivered (for short-lived scripts)."""
+    return get_dispatcher(BOT_TOKEN).flush(timeout)
 
 # ============================================================
 # 📢 Channel-Specific Helpers
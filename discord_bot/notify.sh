@@ -0,0 +1,59 @@
+#!/bin/bash
+# ============================================================
+# 📡 EchoProPulse notify client
+# Sends one message to the notification relay over its Unix
+# socket — no Python startup, returns in a few milliseconds.
+#
+#   notify.sh logs "🧹 Cleanup done"
+#   echo "multi-line text" | notify.sh vps
+#   notify.sh "$DISCORD_WEBHOOK" "message"     # webhook URL target
+#
+# Falls back to the Python helper if the relay is not running.
+# ============================================================
+
+SOCK="${NOTIFY_RELAY_SOCKET:-/root/EchoProPulse/discord_bot/notify.sock}"
+VENV_PY="/root/EchoProPulse/venv/bin/python3"
+BOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+CHANNEL="${1:-logs}"
+shift
+if [ $# -gt 0 ]; then
+    MESSAGE="$*"
+else
+    MESSAGE="$(cat)"
+fi
+[ -z "$MESSAGE" ] && exit 0
+
+# --- JSON string escaping (drop stray control chars, escape the rest)
+json_escape() {
+    local s
+    s=$(printf '%s' "$1" | tr -d '\000-\010\013\014\016-\037')
+    s=${s//\\/\\\\}
+    s=${s//\"/\\\"}
+    s=${s//$'\n'/\\n}
+    s=${s//$'\r'/\\r}
+    s=${s//$'\t'/\\t}
+    printf '%s' "$s"
+}
+
+LINE="{\"channel\": \"$(json_escape "$CHANNEL")\", \"content\": \"$(json_escape "$MESSAGE")\"}"
+
+if [ -S "$SOCK" ]; then
+    if command -v socat >/dev/null 2>&1; then
+        printf '%s\n' "$LINE" | socat - "UNIX-CONNECT:$SOCK" 2>/dev/null && exit 0
+    elif command -v nc >/dev/null 2>&1; then
+        printf '%s\n' "$LINE" | nc -U -N "$SOCK" 2>/dev/null && exit 0
+    fi
+fi
+
+# --- Slow path: relay down or no socket client installed
+PY="$VENV_PY"
+[ -x "$PY" ] || PY="python3"
+NOTIFY_LINE="$LINE" "$PY" - <<PY
+import json, os, sys
+sys.path[:0] = ["$BOT_DIR", os.path.dirname("$BOT_DIR")]
+from notify_relay import resolve
+from notify_dispatcher import get_dispatcher
+target, payload = resolve(json.loads(os.environ["NOTIFY_LINE"]))
+get_dispatcher().submit(target, payload)
+PY
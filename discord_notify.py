@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 import os
-import requests
-import json
 from dotenv import load_dotenv
+from notify_dispatcher import get_dispatcher
 
 # Load environment variables
 load_dotenv(dotenv_path="/root/EchoProPulse/discord_bot/.env")
@@ -12,27 +11,21 @@ MAIN_CHANNEL = os.getenv("DISCORD_CHANNEL_ID")
 LOG_CHANNEL = os.getenv("DISCORD_LOG_CHANNEL_ID")
 VPS_CHANNEL = os.getenv("DISCORD_VPS_CHANNEL_ID")
 
-HEADERS = {
-    "Authorization": f"Bot {BOT_TOKEN}",
-    "Content-Type": "application/json"
-}
 
 def post_message(channel_id: str, content: str):
-    """Send a message to a specific Discord channel."""
+    """
+    Queue a message for a specific Discord channel (or webhook URL).
+    Returns immediately; delivery, retries and rate limits are handled
+    by the background dispatcher (see notify_dispatcher.py).
+    """
     if not channel_id or not content:
         return False
-    url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
-    payload = {"content": content}
-    try:
-        r = requests.post(url, headers=HEADERS, json=payload, timeout=10)
-        if r.status_code not in [200, 204]:
-            print(f"⚠️ Discord API returned {r.status_code}: {r.text}")
-        else:
-            print(f"✅ Sent message to {channel_id}: {content}")
-        return r.ok
-    except Exception as e:
-        print(f"❌ Failed to post to Discord: {e}")
-        return False
+    return get_dispatcher(BOT_TOKEN).submit(channel_id, {"content": content})
+
+
+def flush(timeout: float = 10):
+    """Wait for queued notifications to be delivered (for short-lived scripts)."""
+    return get_dispatcher(BOT_TOKEN).flush(timeout)
 
 
 # ====== Channel-Specific Helpers ======
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🧯 EchoProPulse Error Reporter
+# One shared pipeline for error webhooks. Exceptions are
+# fingerprinted by type + normalized stack; the first
+# occurrence is posted right away (non-blocking), repeats are
+# counted and rolled into periodic digests, e.g.
+#   "RpcError ×57 in last 5 min (first 14:02:11, last 14:06:58)"
+# Counters stay available for metrics export.
+# ==========================================================
+import os
+import re
+import sys
+import time
+import hashlib
+import threading
+import traceback
+from datetime import datetime, timezone
+from notify_dispatcher import get_dispatcher
+from metrics import registry
+
+DEFAULT_WEBHOOK = os.getenv("DISCORD_ERROR_WEBHOOK")
+DIGEST_INTERVAL = float(os.getenv("ERROR_DIGEST_INTERVAL", "300"))
+TRACE_CHARS = 1500
+
+_NUMBERS = re.compile(r"0x[0-9a-fA-F]+|\b\d+(\.\d+)?\b")
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+
+def normalize_message(text):
+    """Strip the parts of an error message that vary between occurrences."""
+    return _QUOTED.sub("'…'", _NUMBERS.sub("N", str(text)))[:200]
+
+
+def fingerprint(exc=None, message=""):
+    """
+    Stable id for "the same error": exception type plus the (file, function) of
+    every frame. Line numbers and message details are left out so edits and
+    varying values don't split one problem into many.
+    """
+    if exc is not None:
+        frames = traceback.extract_tb(exc.__traceback__) if exc.__traceback__ else []
+        parts = [type(exc).__name__] + [f"{os.path.basename(f.filename)}:{f.name}" for f in frames]
+    else:
+        parts = ["Message", normalize_message(message)]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+class ErrorStats:
+    __slots__ = ("fp", "source", "kind", "message", "where", "first_seen", "last_seen",
+                 "count", "pending", "window_start")
+
+    def __init__(self, fp, source, kind, message, where):
+        now = time.time()
+        self.fp, self.source, self.kind, self.message, self.where = fp, source, kind, message, where
+        self.first_seen = self.last_seen = self.window_start = now
+        self.count = 0
+        self.pending = 0   # occurrences not yet reported in a digest
+
+
+class ErrorReporter:
+    def __init__(self, webhook=DEFAULT_WEBHOOK, digest_interval=DIGEST_INTERVAL):
+        self.webhook = webhook
+        self.digest_interval = digest_interval
+        self._stats = {}    # (webhook, fp) -> ErrorStats
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------
+    def report(self, err=None, source="EchoProPulse", webhook=None):
+        """
+        Record an error. `err` may be an exception, a string, or None (use the
+        exception currently being handled). Never blocks on the network.
+        """
+        webhook = webhook or self.webhook
+        exc = err if isinstance(err, BaseException) else None
+        if exc is None:
+            current = sys.exc_info()[1]
+            if current is not None:
+                exc = current
+        message = str(err) if err is not None and not isinstance(err, BaseException) else str(exc or "")
+        fp = fingerprint(exc, message)
+        kind = type(exc).__name__ if exc is not None else "Error"
+
+        with self._lock:
+            key = (webhook, fp)
+            st = self._stats.get(key)
+            first = st is None
+            if first:
+                where = ""
+                if exc is not None and exc.__traceback__:
+                    last = traceback.extract_tb(exc.__traceback__)[-1]
+                    where = f"{os.path.basename(last.filename)}:{last.name}"
+                st = self._stats[key] = ErrorStats(fp, source, kind, normalize_message(message), where)
+            st.count += 1
+            st.last_seen = time.time()
+            if not first:
+                st.pending += 1
+
+        if first:
+            if exc is not None:
+                tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+            else:
+                tb = message
+            self._send(webhook, f"⚠️ **{source} Error** `{fp}`\n```{tb[-TRACE_CHARS:]}```\n"
+                                f"_Repeats are summarised every {int(self.digest_interval // 60) or 1} min._")
+        self._ensure_digest_thread()
+        return fp
+
+    def _send(self, webhook, content):
+        if not webhook:
+            print(content)
+            return
+        get_dispatcher().submit(webhook, {"content": content})
+
+    # ------------------------------------------------------
+    # Digests
+    # ------------------------------------------------------
+    def _ensure_digest_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._digest_loop, name="error-digest", daemon=True)
+            self._thread.start()
+
+    def _digest_loop(self):
+        while not self._stop.wait(self.digest_interval):
+            self.flush_digest()
+
+    def flush_digest(self):
+        """Post one summary per webhook covering every error that repeated since the last digest."""
+        now = time.time()
+        by_hook = {}
+        with self._lock:
+            for (webhook, _), st in self._stats.items():
+                if st.pending:
+                    by_hook.setdefault(webhook, []).append(
+                        (st.pending, st.kind, st.message, st.where, st.fp, st.source, now - st.window_start,
+                         st.first_seen, st.last_seen)
+                    )
+                    st.pending = 0
+                st.window_start = now
+        for webhook, rows in by_hook.items():
+            rows.sort(reverse=True)
+            lines = ["🧾 **Error digest**"]
+            for pending, kind, message, where, fp, source, window, first, last in rows[:20]:
+                lines.append(
+                    f"• `{fp}` **{kind}** ×{pending} in last {max(1, round(window / 60))} min "
+                    f"[{source}{' @ ' + where if where else ''}] — {message[:120]}\n"
+                    f"  first {_fmt(first)}, last {_fmt(last)}"
+                )
+            if len(rows) > 20:
+                lines.append(f"…and {len(rows) - 20} more")
+            self._send(webhook, "\n".join(lines))
+
+    # ------------------------------------------------------
+    # Metrics export
+    # ------------------------------------------------------
+    def snapshot(self):
+        with self._lock:
+            return [
+                {"fingerprint": st.fp, "source": st.source, "type": st.kind, "where": st.where,
+                 "message": st.message, "count": st.count,
+                 "first_seen": st.first_seen, "last_seen": st.last_seen}
+                for st in self._stats.values()
+            ]
+
+    def metric_values(self):
+        """{(source, type, fingerprint): count} for the metrics registry."""
+        return {(row["source"], row["type"], row["fingerprint"]): row["count"] for row in self.snapshot()}
+
+
+def _fmt(ts):
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%H:%M:%S UTC")
+
+
+reporter = ErrorReporter()
+registry.counter_func("errors", "Reported errors per fingerprint.", reporter.metric_values,
+                      ("source", "type", "fingerprint"))
+
+
+def report_error(err=None, source="EchoProPulse", webhook=None):
+    return reporter.report(err, source=source, webhook=webhook)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# ==========================================================
+# ⏳ EchoProPulse Interaction Deadline Tracker
+# Discord drops an interaction that isn't acknowledged within
+# 3 s ("Unknown interaction", 10062). install(tree) timestamps
+# every slash command, and if the handler hasn't responded
+# INTERACTION_ACK_BUDGET seconds after Discord created the
+# interaction, defers it on the handler's behalf. The handler's
+# later send_message() then goes out as the deferred reply, so
+# slow commands degrade to "thinking…" instead of failing.
+#
+# Ack latency (mode = handler | auto_defer) and unacknowledged
+# interactions are recorded per command in metrics.py.
+#
+# Per-command opt-outs via app_commands extras:
+#   @tree.command(..., extras={"auto_defer": False})        # opens a modal
+#   @tree.command(..., extras={"defer_ephemeral": False})   # public reply
+# ==========================================================
+import os
+import asyncio
+import discord
+from discord.interactions import InteractionResponse
+
+from metrics import ACK_SECONDS, INTERACTION_FAILURES
+
+ACK_BUDGET = float(os.getenv("INTERACTION_ACK_BUDGET", "2.0"))
+UNKNOWN_INTERACTION = 10062
+
+
+def command_name(inter):
+    command = inter.command
+    if command is not None:
+        return command.qualified_name
+    return (inter.data or {}).get("name", "unknown")
+
+
+def elapsed(inter):
+    """Seconds since Discord created the interaction."""
+    return max(0.0, (discord.utils.utcnow() - inter.created_at).total_seconds())
+
+
+class DeadlineResponse(InteractionResponse):
+    """InteractionResponse that records its ack and can be auto-deferred by the tracker."""
+
+    __slots__ = ("_lock", "_timer", "_command", "_ephemeral", "auto_deferred", "reply_pending")
+
+    def __init__(self, parent, command, ephemeral):
+        super().__init__(parent)
+        self._lock = asyncio.Lock()
+        self._timer = None
+        self._command = command
+        self._ephemeral = ephemeral
+        self.auto_deferred = False
+        self.reply_pending = False     # auto-deferred and the handler hasn't replied yet
+
+    # ------------------------------------------------------
+    # Ack bookkeeping
+    # ------------------------------------------------------
+    async def _ack(self, mode, call):
+        first = not self.is_done()
+        try:
+            result = await call
+        except discord.NotFound as e:
+            if e.code == UNKNOWN_INTERACTION:
+                INTERACTION_FAILURES.inc(self._command, "unknown_interaction")
+                print(f"⌛ /{self._command} missed the ack deadline ({elapsed(self._parent):.2f}s)")
+            raise
+        if first:
+            ACK_SECONDS.observe(elapsed(self._parent), self._command, mode)
+        return result
+
+    def arm(self, budget):
+        delay = max(0.0, budget - elapsed(self._parent))
+        self._timer = asyncio.get_running_loop().create_task(self._auto_defer(delay))
+
+    def disarm(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _auto_defer(self, delay):
+        await asyncio.sleep(delay)
+        async with self._lock:
+            if self.is_done() or self._parent.command_failed:
+                return
+            try:
+                await self._ack("auto_defer", InteractionResponse.defer(self, ephemeral=self._ephemeral, thinking=True))
+            except discord.HTTPException as e:
+                if not isinstance(e, discord.NotFound):
+                    INTERACTION_FAILURES.inc(self._command, "defer_failed")
+                    print(f"⚠️ Auto-defer of /{self._command} failed: {e}")
+                return
+            self.auto_deferred = self.reply_pending = True
+            print(f"⏳ /{self._command} auto-deferred at {elapsed(self._parent):.2f}s")
+
+    # ------------------------------------------------------
+    # Response methods used by handlers
+    # ------------------------------------------------------
+    async def defer(self, *, ephemeral=False, thinking=False):
+        async with self._lock:
+            if self.auto_deferred:
+                # The handler takes over the reply (it will follow up); the visibility was
+                # fixed by the auto-defer, so its `ephemeral` no longer applies
+                self.reply_pending = False
+                return
+            await self._ack("handler", super().defer(ephemeral=ephemeral, thinking=thinking))
+            self._ephemeral = ephemeral
+
+    async def send_message(self, content=None, **kwargs):
+        async with self._lock:
+            if not self.auto_deferred:
+                return await self._ack("handler", super().send_message(content, **kwargs))
+            # Already deferred by the tracker: the reply becomes the deferred response
+            kwargs.pop("delete_after", None)
+            self.reply_pending = False
+        await self._parent.followup.send(content, **kwargs)
+
+    async def send_modal(self, modal, /):
+        async with self._lock:
+            return await self._ack("handler", super().send_modal(modal))
+
+
+def needs_reply(inter):
+    """True while the user has seen nothing from the handler (not responded, or only auto-deferred)."""
+    response = inter.response
+    return not response.is_done() or getattr(response, "reply_pending", False)
+
+
+def install(tree, budget=ACK_BUDGET, ephemeral=True):
+    """
+    Attach the tracker to `tree`. `ephemeral` is the default visibility of an
+    auto-deferred reply; commands override it with extras={"defer_ephemeral": ...}.
+    """
+    previous_check = tree.interaction_check
+
+    async def interaction_check(inter):
+        if inter.type is discord.InteractionType.application_command:
+            command = inter.command
+            extras = getattr(command, "extras", {}) or {}
+            inter._cs_response = response = DeadlineResponse(
+                inter, command_name(inter), extras.get("defer_ephemeral", ephemeral)
+            )
+            if extras.get("auto_defer", True):
+                response.arm(budget)
+        return await previous_check(inter)
+
+    async def on_app_command_completion(inter, command):
+        response = inter.response
+        if not isinstance(response, DeadlineResponse):
+            return
+        response.disarm()
+        if response.reply_pending:
+            # handler finished without a reply: close out the "thinking…" message
+            response.reply_pending = False
+            try:
+                await inter.followup.send("✅ Done.", ephemeral=response._ephemeral)
+            except discord.HTTPException:
+                pass
+
+    tree.interaction_check = interaction_check
+    tree.client.add_listener(on_app_command_completion, "on_app_command_completion")
+    return tree
+
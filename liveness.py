@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 💓 EchoProPulse Liveness
+# Bot side: Heartbeat runs on the bot's event loop and, every
+# HEARTBEAT_INTERVAL seconds, rewrites the heartbeat record,
+# pings the supervisor over a Unix datagram socket and sends
+# systemd WATCHDOG=1 (when started with Type=notify and
+# WatchdogSec=). A stuck loop stops all three at once.
+#
+# Supervisor side: LivenessMonitor listens on the socket and
+# watches the heartbeat file with inotify, so it wakes on every
+# beat and fires on_stale() once LIVENESS_TIMEOUT passes with
+# neither — seconds, not hours.
+# ==========================================================
+import os
+import json
+import time
+import ctypes
+import ctypes.util
+import socket
+import struct
+import asyncio
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+EST = ZoneInfo("America/New_York")
+
+HEARTBEAT_FILE = os.getenv("HEARTBEAT_FILE", "/root/EchoProPulse/discord_bot/heartbeat.log")
+LIVENESS_SOCKET = os.getenv("LIVENESS_SOCKET", "/root/EchoProPulse/discord_bot/liveness.sock")
+HEARTBEAT_INTERVAL = float(os.getenv("HEARTBEAT_INTERVAL", "2"))
+LIVENESS_TIMEOUT = float(os.getenv("LIVENESS_TIMEOUT", "15"))
+STARTUP_GRACE = float(os.getenv("LIVENESS_STARTUP_GRACE", "60"))
+
+
+# ==========================================================
+# HEARTBEAT RECORD
+# ==========================================================
+def read_heartbeat(path=HEARTBEAT_FILE):
+    """Latest heartbeat record as a dict, or None. Understands the old bare-ISO-timestamp files."""
+    try:
+        with open(path, "r") as f:
+            text = f.read().strip()
+    except OSError:
+        return None
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return {"ts": text}
+
+
+def heartbeat_age(record):
+    """Seconds since the record was written, or None."""
+    try:
+        return (datetime.now(EST) - datetime.fromisoformat(record["ts"])).total_seconds()
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def sd_notify(state):
+    """Send a state string to systemd's notify socket; no-op outside a Type=notify service."""
+    addr = os.getenv("NOTIFY_SOCKET")
+    if not addr:
+        return False
+    if addr.startswith("@"):
+        addr = "\0" + addr[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
+            s.sendto(state.encode(), addr)
+        return True
+    except OSError:
+        return False
+
+
+# ==========================================================
+# BOT SIDE
+# ==========================================================
+class Heartbeat:
+    """
+    Runs on the bot's event loop. `extra` is an optional callable returning a
+    dict merged into every record (health data the supervisor can read).
+    """
+
+    def __init__(self, name="echopropulse", path=HEARTBEAT_FILE, socket_path=LIVENESS_SOCKET,
+                 interval=HEARTBEAT_INTERVAL, extra=None):
+        self.name = name
+        self.path = path
+        self.socket_path = socket_path
+        self.interval = interval
+        self.extra = extra
+        self.seq = 0
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+
+    def record(self):
+        rec = {"ts": datetime.now(EST).isoformat(), "name": self.name, "pid": os.getpid(), "seq": self.seq}
+        if self.extra:
+            try:
+                rec.update(self.extra())
+            except Exception as e:
+                rec["extra_error"] = str(e)
+        return rec
+
+    def beat(self):
+        self.seq += 1
+        data = json.dumps(self.record())
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                f.write(data + "\n")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️ Heartbeat write error: {e}")
+        try:
+            self._sock.sendto(data.encode(), self.socket_path)
+        except OSError:
+            pass   # supervisor not running; the file still carries the beat
+        sd_notify("WATCHDOG=1")
+
+    async def run(self):
+        sd_notify("READY=1")
+        while True:
+            self.beat()
+            await asyncio.sleep(self.interval)
+
+
+# ==========================================================
+# SUPERVISOR SIDE
+# ==========================================================
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")
+
+
+def _inotify_watch(directory):
+    """(fd, libc) watching `directory` for finished writes/renames, or (None, None) if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None, None
+        if libc.inotify_add_watch(fd, directory.encode(), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+            os.close(fd)
+            return None, None
+        return fd, libc
+    except (OSError, AttributeError):
+        return None, None
+
+
+class LivenessMonitor:
+    """
+    Calls `await on_stale(age_seconds)` when no ping or heartbeat-file update has
+    arrived for `timeout` seconds, then waits `grace` seconds for the restarted
+    bot before arming again. The deadline is re-armed on every event, so there
+    is no polling interval to wait out.
+    """
+
+    def __init__(self, on_stale, timeout=LIVENESS_TIMEOUT, path=HEARTBEAT_FILE,
+                 socket_path=LIVENESS_SOCKET, grace=STARTUP_GRACE):
+        self.on_stale = on_stale
+        self.timeout = timeout
+        self.path = path
+        self.socket_path = socket_path
+        self.grace = grace
+        self.last_seen = time.monotonic()
+        self.last_record = None
+        self.source = None
+        self.pings = 0
+        self._sock = None
+        self._inotify = None
+
+    def _seen(self, source, record=None):
+        self.last_seen = max(self.last_seen, time.monotonic())
+        self.source = source
+        if record is not None:
+            self.last_record = record
+
+    def _on_ping(self):
+        try:
+            while True:
+                data = self._sock.recv(65536)
+                self.pings += 1
+                try:
+                    self._seen("socket", json.loads(data))
+                except ValueError:
+                    self._seen("socket")
+        except BlockingIOError:
+            pass
+
+    def _on_inotify(self):
+        name = os.path.basename(self.path).encode()
+        try:
+            buf = os.read(self._inotify, 65536)
+        except BlockingIOError:
+            return
+        i = 0
+        while i < len(buf):
+            _, _, _, length = _EVENT.unpack_from(buf, i)
+            fname = buf[i + _EVENT.size:i + _EVENT.size + length].rstrip(b"\0")
+            i += _EVENT.size + length
+            if fname == name:
+                self._seen("file", read_heartbeat(self.path))
+
+    def _open(self):
+        loop = asyncio.get_running_loop()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(self.socket_path)
+        self._sock.setblocking(False)
+        os.chmod(self.socket_path, 0o660)
+        loop.add_reader(self._sock.fileno(), self._on_ping)
+
+        self._inotify, _ = _inotify_watch(os.path.dirname(self.path) or ".")
+        if self._inotify is not None:
+            loop.add_reader(self._inotify, self._on_inotify)
+        else:
+            print("⚠️ inotify unavailable — relying on socket pings only.")
+
+        # The bot may be starting alongside us (reboot, supervisor restart): give it the
+        # startup grace and let the first ping or file event set the state. A bot that is
+        # already dead is caught by the supervisor's service_state check, not a stale mtime.
+        self.last_seen = time.monotonic() + self.grace
+
+    def close(self):
+        loop = asyncio.get_running_loop()
+        if self._sock is not None:
+            loop.remove_reader(self._sock.fileno())
+            self._sock.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        if self._inotify is not None:
+            loop.remove_reader(self._inotify)
+            os.close(self._inotify)
+
+    def age(self):
+        return time.monotonic() - self.last_seen
+
+    async def run(self):
+        self._open()
+        try:
+            while True:
+                remaining = self.timeout - self.age()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+                await self.on_stale(self.age())
+                # give the restarted bot time to come up before judging it again
+                self.last_seen = time.monotonic() + self.grace
+        finally:
+            self.close()
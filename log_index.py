@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🔎 EchoProPulse Log Index
+# Tail and search for large text logs without reading them
+# whole. Files are memory-mapped; tails walk backwards from
+# the end, and a sparse (offset, timestamp) index — one entry
+# per STRIDE bytes, extended as the file grows — narrows time
+# range searches to the few MB that matter.
+#
+#   python3 log_index.py watchdog.log --tail 20
+#   python3 log_index.py bot.log --grep "Sync failed" --since 6h
+# ==========================================================
+import os
+import re
+import bisect
+import mmap
+import argparse
+from datetime import datetime, timedelta, timezone
+
+LOG_DIR = "/root/EchoProPulse/discord_bot"
+LOG_FILES = {
+    "bot": os.path.join(LOG_DIR, "bot.log"),
+    "watchdog": os.path.join(LOG_DIR, "watchdog.log"),
+    "cleanup": os.path.join(LOG_DIR, "cleanup_echo.log"),
+    "activity": "/root/EchoProPulse/discord_activity.jsonl",
+}
+# Zone each log's timestamps are written in; the rest use the server's local time
+LOG_ZONES = {LOG_FILES["activity"]: timezone.utc}    # activity_log stamps UTC
+STRIDE = int(os.getenv("LOG_INDEX_STRIDE", str(1024 * 1024)))
+SCAN_CHUNK = 4 * 1024 * 1024
+
+# "2025-10-25 14:03:11" (shell scripts) or "2025-10-25T14:03:11" (ISO / JSON lines)
+TS_RE = re.compile(rb"(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})")
+
+
+def parse_line_ts(line):
+    m = TS_RE.search(line[:80])
+    if not m:
+        return None
+    try:
+        return datetime.strptime(f"{m.group(1).decode()} {m.group(2).decode()}", "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def line_key(line):
+    """Sortable bytes form of a line's timestamp (b"YYYY-MM-DD HH:MM:SS"), or None. Cheaper than strptime."""
+    m = TS_RE.search(line, 0, 80)
+    return m.group(1) + b" " + m.group(2) if m else None
+
+
+def _key(when):
+    return when.strftime("%Y-%m-%d %H:%M:%S").encode() if when is not None else None
+
+
+def _in_zone(when, tz):
+    """`when` as a naive datetime in `tz` (None = server local), comparable with a log's own stamps."""
+    return when.astimezone(tz).replace(tzinfo=None) if when is not None else None
+
+
+def parse_when(text, now=None):
+    """
+    '30m', '6h', '2d' (relative to now) or an absolute 'YYYY-MM-DD[ HH:MM[:SS]][±HH:MM]'.
+    Returns an aware datetime; absolute times without an offset are server local time.
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+    now = now or datetime.now().astimezone()
+    m = re.fullmatch(r"(\d+)\s*([smhd])", text.lower())
+    if m:
+        unit = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}[m.group(2)]
+        return now - timedelta(**{unit: int(m.group(1))})
+    return datetime.fromisoformat(text.replace("T", " ")).astimezone()
+
+
+class LogFile:
+    """
+    One log file. The index survives growth (it is only extended) and is reset
+    when the file shrinks or is replaced, i.e. after rotation or truncation.
+    `tz` is the zone its timestamps are written in (None = server local time).
+    """
+
+    def __init__(self, path, stride=STRIDE, tz=None):
+        self.path = path
+        self.stride = stride
+        self.tz = tz
+        self.offsets = []    # line-start offsets, ~stride apart, ascending
+        self.stamps = []     # timestamp of the first dated line at/after each offset
+        self.indexed_to = 0
+        self._ident = None
+
+    # ------------------------------------------------------
+    # Mapping / index maintenance
+    # ------------------------------------------------------
+    def _map(self):
+        f = open(self.path, "rb")
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            f.close()
+            return None, 0
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        f.close()
+        return mm, size
+
+    def _refresh(self, mm, size):
+        st = os.stat(self.path)
+        ident = (st.st_dev, st.st_ino)
+        if ident != self._ident or size < self.indexed_to:
+            self.offsets, self.stamps, self.indexed_to, self._ident = [], [], 0, ident
+        pos = self.indexed_to
+        while pos < size:
+            start = 0 if pos == 0 else mm.find(b"\n", pos - 1) + 1
+            if (pos and start == 0) or start >= size:
+                break
+            ts, probe = None, start
+            # first dated line within the next few lines
+            for _ in range(16):
+                end = mm.find(b"\n", probe)
+                if end < 0:
+                    break
+                ts = parse_line_ts(mm[probe:end])
+                if ts is not None:
+                    break
+                probe = end + 1
+            if ts is None:
+                break   # incomplete tail or undated region; retry when the file grows
+            if not self.stamps or ts >= self.stamps[-1]:
+                self.offsets.append(start)
+                self.stamps.append(ts)
+            pos = start + self.stride
+        self.indexed_to = max(self.indexed_to, min(pos, size))
+
+    def _range(self, start, end, size):
+        """Byte window [lo, hi) that can contain lines between start and end."""
+        lo, hi = 0, size
+        if start is not None and self.stamps:
+            i = bisect.bisect_right(self.stamps, start) - 1
+            lo = self.offsets[i] if i >= 0 else 0
+        if end is not None and self.stamps:
+            j = bisect.bisect_right(self.stamps, end)
+            hi = self.offsets[j] if j < len(self.offsets) else size
+        return lo, hi
+
+    # ------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------
+    def tail(self, n=40, before=None):
+        """Last n lines ending before byte offset `before`: (lines oldest→newest, cursor for older)."""
+        return self.search(limit=n, before=before)
+
+    def search(self, keyword=None, start=None, end=None, limit=40, before=None):
+        """
+        Newest-first scan for lines matching `keyword` (case-insensitive) inside
+        [start, end] (naive = server local time). Returns (lines oldest→newest, cursor);
+        pass the cursor back as `before` for the next (older) page. cursor is None when exhausted.
+        """
+        if not os.path.exists(self.path):
+            return [], None
+        start, end = _in_zone(start, self.tz), _in_zone(end, self.tz)
+        mm, size = self._map()
+        if mm is None:
+            return [], None
+        try:
+            if start is not None or end is not None:
+                self._refresh(mm, size)
+            lo, hi = self._range(start, end, size)
+            if before is not None:
+                hi = min(hi, before)
+            start, end = _key(start), _key(end)
+            if not keyword:
+                return self._tail(mm, lo, hi, limit, start, end)
+            pattern = re.compile(re.escape(keyword.encode()), re.IGNORECASE)
+            found = []
+            cursor = hi
+            while cursor > lo and len(found) < limit:
+                chunk_lo = max(lo, cursor - SCAN_CHUNK)
+                if chunk_lo > lo:
+                    chunk_lo = mm.find(b"\n", chunk_lo, cursor) + 1 or cursor
+                    if chunk_lo >= cursor:   # single line longer than a chunk
+                        chunk_lo = max(lo, mm.rfind(b"\n", lo, cursor - 1) + 1)
+                batch = self._scan(mm, chunk_lo, cursor, pattern, start, end)
+                take = batch[-(limit - len(found)):]
+                found = take + found
+                cursor = take[0][0] if len(batch) > len(take) else chunk_lo
+            more = cursor > lo
+            return [line for _, line in found], (cursor if more else None)
+        finally:
+            mm.close()
+
+    @staticmethod
+    def _tail(mm, lo, hi, limit, start, end):
+        """Walk lines backwards from hi with rfind; only the returned page is ever touched."""
+        found = []
+        stop = hi
+        if stop > lo and mm[stop - 1:stop] == b"\n":
+            stop -= 1
+        while stop > lo and len(found) < limit:
+            ls = max(lo, mm.rfind(b"\n", lo, stop) + 1)
+            line = mm[ls:stop]
+            stop = ls - 1
+            if not line:
+                continue
+            if start is not None or end is not None:
+                ts = line_key(line)
+                if ts is not None and end is not None and ts > end:
+                    continue
+                if ts is not None and start is not None and ts < start:
+                    stop = lo   # everything older is out of range too
+                    break
+            found.append(line.decode("utf-8", "replace"))
+        found.reverse()
+        cursor = stop + 1 if stop > lo else None
+        return found, cursor
+
+    @staticmethod
+    def _scan(mm, lo, hi, pattern, start, end):
+        """[(line_start, text)] of lines in [lo, hi) matching pattern, oldest first."""
+        out = []
+        last = -1
+        for m in pattern.finditer(mm, lo, hi):
+            ls = mm.rfind(b"\n", lo, m.start()) + 1 or lo
+            if ls == last:
+                continue
+            le = mm.find(b"\n", m.end(), hi)
+            out.append((ls, mm[ls:hi if le < 0 else le]))
+            last = ls
+        if start is not None or end is not None:
+            kept = []
+            for pos, line in out:
+                ts = line_key(line)
+                if ts is None or ((start is None or ts >= start) and (end is None or ts <= end)):
+                    kept.append((pos, line))
+            out = kept
+        return [(pos, line.decode("utf-8", "replace")) for pos, line in out]
+
+
+_files = {}
+
+
+def log_file(path):
+    lf = _files.get(path)
+    if lf is None:
+        lf = _files[path] = LogFile(path, tz=LOG_ZONES.get(path))
+    return lf
+
+
+def paginate(lines, limit=3900):
+    """Fit lines (newest last) into one embed description, keeping the newest ones."""
+    out, used = [], 0
+    for line in reversed(lines):
+        line = line if len(line) <= 300 else line[:297] + "…"
+        if used + len(line) + 1 > limit:
+            break
+        out.append(line)
+        used += len(line) + 1
+    return "\n".join(reversed(out)), len(lines) - len(out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tail or search a log via the sparse index")
+    parser.add_argument("file", help="path or alias: " + ", ".join(LOG_FILES))
+    parser.add_argument("--tail", type=int, default=40)
+    parser.add_argument("--grep", default=None)
+    parser.add_argument("--since", default=None)
+    parser.add_argument("--until", default=None)
+    args = parser.parse_args()
+
+    lf = log_file(LOG_FILES.get(args.file, args.file))
+    lines, _ = lf.search(args.grep, parse_when(args.since), parse_when(args.until), args.tail)
+    print("\n".join(lines))
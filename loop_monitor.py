@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🩺 EchoProPulse Loop Monitor
+# Samples event-loop scheduling lag, gateway latency, pending
+# tasks and queue depths into a fixed-size ring buffer, and
+# publishes p50/p99 into the heartbeat record. A sentinel
+# thread notices when the loop stops ticking and captures the
+# loop thread's stack, naming the handler that is blocking it.
+# Lag p99 above LOOP_LAG_DEGRADED_MS flips the state to
+# "degraded" until it recovers.
+# ==========================================================
+import os
+import sys
+import math
+import time
+import asyncio
+import threading
+import traceback
+from collections import deque
+import numpy as np
+
+SAMPLE_INTERVAL = float(os.getenv("LOOP_SAMPLE_INTERVAL", "0.25"))
+WINDOW_SAMPLES = int(os.getenv("LOOP_WINDOW_SAMPLES", "1200"))          # 5 min at 0.25 s
+LAG_DEGRADED_MS = float(os.getenv("LOOP_LAG_DEGRADED_MS", "250"))
+STALL_MS = float(os.getenv("LOOP_STALL_MS", "500"))
+
+# ring buffer columns
+LAG, GATEWAY, TASKS, QUEUED = range(4)
+
+
+class LoopMonitor:
+    """
+    `bot` (optional) supplies bot.latency; `queues` maps a name to a zero-arg
+    callable returning that queue's depth. `on_state(degraded, summary)` is
+    called on every ok↔degraded transition.
+    """
+
+    def __init__(self, bot=None, queues=None, interval=SAMPLE_INTERVAL, window=WINDOW_SAMPLES,
+                 lag_threshold_ms=LAG_DEGRADED_MS, stall_ms=STALL_MS, on_state=None):
+        self.bot = bot
+        self.queues = dict(queues or {})
+        self.interval = interval
+        self.lag_threshold_ms = lag_threshold_ms
+        self.stall_ms = stall_ms
+        self.on_state = on_state
+        self.samples = np.full((window, 4), np.nan)
+        self.count = 0
+        self.degraded = False
+        self.stalls = deque(maxlen=20)    # (wall time, blocked ms, stack summary)
+        self._last_tick = time.monotonic()
+        self._loop_thread = None
+        self._task = None
+        self._sentinel = None
+
+    # ------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------
+    def start(self):
+        if self._task is None or self._task.done():
+            self._loop_thread = threading.get_ident()
+            self._last_tick = time.monotonic()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if self._sentinel is None:
+            self._sentinel = threading.Thread(target=self._watch, name="loop-sentinel", daemon=True)
+            self._sentinel.start()
+        return self._task
+
+    def _queue_depths(self):
+        depths = {}
+        for name, fn in self.queues.items():
+            try:
+                depths[name] = int(fn())
+            except Exception:
+                depths[name] = -1
+        return depths
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            t0 = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - t0 - self.interval) * 1000)
+            self._last_tick = time.monotonic()
+            latency = getattr(self.bot, "latency", None)
+            gateway_ms = latency * 1000 if latency is not None and math.isfinite(latency) else np.nan
+            self.samples[self.count % len(self.samples)] = (
+                lag_ms, gateway_ms, len(asyncio.all_tasks(loop)), sum(self._queue_depths().values())
+            )
+            self.count += 1
+            self._update_state()
+
+    def _window(self):
+        return self.samples[:min(self.count, len(self.samples))]
+
+    def _update_state(self):
+        if self.count < 8:
+            return
+        p99 = float(np.nanpercentile(self._window()[:, LAG], 99))
+        degraded = p99 > self.lag_threshold_ms
+        if degraded != self.degraded:
+            self.degraded = degraded
+            summary = self.summary()
+            print(f"{'🟠 Event loop degraded' if degraded else '🟢 Event loop recovered'}: "
+                  f"lag p99 {p99:.0f} ms (threshold {self.lag_threshold_ms:.0f} ms)")
+            if self.on_state:
+                try:
+                    self.on_state(degraded, summary)
+                except Exception as e:
+                    print(f"⚠️ Loop monitor on_state failed: {e}")
+
+    # ------------------------------------------------------
+    # Stall detection (runs off-loop)
+    # ------------------------------------------------------
+    def _watch(self):
+        reported = None
+        while True:
+            time.sleep(self.stall_ms / 2000)
+            blocked_ms = (time.monotonic() - self._last_tick) * 1000 - self.interval * 1000
+            if blocked_ms < self.stall_ms:
+                reported = None
+                continue
+            if reported == self._last_tick:
+                continue   # one capture per stall
+            reported = self._last_tick
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)[-6:]
+            where = " ← ".join(f"{os.path.basename(f.filename)}:{f.lineno} {f.name}" for f in reversed(stack))
+            self.stalls.append((time.time(), round(blocked_ms), where))
+            print(f"🐢 Event loop blocked {blocked_ms:.0f} ms in {where}")
+
+    # ------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------
+    def summary(self):
+        window = self._window()
+        if not len(window):
+            return {"state": "starting"}
+
+        def pct(col, p):
+            values = window[:, col]
+            if np.isnan(values).all():
+                return None
+            return round(float(np.nanpercentile(values, p)), 1)
+
+        out = {
+            "state": "degraded" if self.degraded else "ok",
+            "lag_p50_ms": pct(LAG, 50),
+            "lag_p99_ms": pct(LAG, 99),
+            "lag_max_ms": round(float(np.nanmax(window[:, LAG])), 1),
+            "gateway_p50_ms": pct(GATEWAY, 50),
+            "gateway_p99_ms": pct(GATEWAY, 99),
+            "tasks": int(window[(self.count - 1) % len(self.samples), TASKS]),
+            "queues": self._queue_depths(),
+            "samples": len(window),
+        }
+        if self.stalls:
+            ts, ms, where = self.stalls[-1]
+            out["last_stall"] = {"age_s": round(time.time() - ts), "blocked_ms": ms, "where": where}
+        return out
+
+    def lag_percentile(self, p, last=None):
+        """Lag percentile (ms) over the newest `last` samples (default: whole window), or None."""
+        n = min(self.count, len(self.samples), last or len(self.samples))
+        lag = self.samples[np.arange(self.count - n, self.count) % len(self.samples), LAG]
+        if not n or np.isnan(lag).all():
+            return None
+        return round(float(np.nanpercentile(lag, p)), 1)
+
+    def heartbeat_fields(self):
+        """Extra fields for liveness.Heartbeat records."""
+        return {"loop": self.summary()}
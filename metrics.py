@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 📟 EchoProPulse Metrics
+# Minimal OpenMetrics/Prometheus instrumentation.
+#
+# Updates are lock-free: every thread writes to its own shard
+# (a thread-local dict of counters / bucket arrays), so inc()
+# and observe() cost a dict lookup and a bisect. A scrape sums
+# the shards. Gauges that already exist elsewhere (queue depth,
+# heartbeat age) are read by callbacks at scrape time only.
+#
+#   curl -s http://127.0.0.1:9464/metrics
+# ==========================================================
+import os
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_ADDR = os.getenv("METRICS_ADDR", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9464"))
+PREFIX = "echopropulse_"
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# seconds; covers sub-ms cache hits up to slow RPC / Discord round trips
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _fmt(v):
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class _Sharded:
+    """Per-thread storage; shards are registered once per thread and summed on collect."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        try:
+            return self._local.data
+        except AttributeError:
+            data = self._local.data = {}
+            with self._lock:
+                self._shards.append(data)
+            return data
+
+
+class Counter(_Sharded):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__()
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def inc(self, *labels, amount=1):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def totals(self):
+        out = {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, value in list(shard.items()):
+                out[key] = out.get(key, 0) + value
+        return out
+
+    def collect(self):
+        yield f"# TYPE {self.name} counter"
+        yield f"# HELP {self.name} {self.documentation}"
+        for key, value in sorted(self.totals().items()):
+            yield f"{self.name}_total{_labels(self.labelnames, key)} {_fmt(value)}"
+
+
+class Histogram(_Sharded):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__()
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            # [bucket counts..., +Inf count, sum]
+            cell = shard[labels] = [0] * (len(self.bounds) + 1) + [0.0]
+        cell[bisect.bisect_left(self.bounds, value)] += 1
+        cell[-1] += value
+
+    def totals(self):
+        out = {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, cell in list(shard.items()):
+                acc = out.get(key)
+                if acc is None:
+                    out[key] = list(cell)
+                else:
+                    for i, v in enumerate(cell):
+                        acc[i] += v
+        return out
+
+    def collect(self):
+        yield f"# TYPE {self.name} histogram"
+        yield f"# HELP {self.name} {self.documentation}"
+        for key, cell in sorted(self.totals().items()):
+            running = 0
+            for bound, count in zip(self.bounds, cell):
+                running += count
+                le = 'le="%s"' % bound
+                yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {running}"
+            running += cell[len(self.bounds)]
+            le = 'le="+Inf"'
+            yield f"{self.name}_bucket{_labels(self.labelnames, key, le)} {running}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {running}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(cell[-1])}"
+
+
+class GaugeFunc:
+    """Gauge whose values come from `fn()` at scrape time: a number or {label tuple: number}."""
+    kind = "gauge"
+    suffix = ""
+
+    def __init__(self, name, documentation, fn, labelnames=()):
+        self.name = PREFIX + name
+        self.documentation = documentation
+        self.fn = fn
+        self.labelnames = tuple(labelnames)
+
+    def collect(self):
+        try:
+            value = self.fn()
+        except Exception:
+            return
+        if value is None:
+            return
+        yield f"# TYPE {self.name} {self.kind}"
+        yield f"# HELP {self.name} {self.documentation}"
+        items = value.items() if isinstance(value, dict) else [((), value)]
+        for key, v in sorted(items):
+            if v is not None:
+                yield f"{self.name}{self.suffix}{_labels(self.labelnames, key)} {_fmt(v)}"
+
+
+class CounterFunc(GaugeFunc):
+    """Counter kept elsewhere (e.g. dispatcher stats), read at scrape time."""
+    kind = "counter"
+    suffix = "_total"
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+        self.collectors = []     # callables yielding finished OpenMetrics lines
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_func(self, name, documentation, fn, labelnames=()):
+        with self._lock:
+            self.metrics[PREFIX + name] = metric = GaugeFunc(name, documentation, fn, labelnames)
+        return metric
+
+    def counter_func(self, name, documentation, fn, labelnames=()):
+        with self._lock:
+            self.metrics[PREFIX + name] = metric = CounterFunc(name, documentation, fn, labelnames)
+        return metric
+
+    def add_collector(self, fn):
+        self.collectors.append(fn)
+
+    def exposition(self):
+        lines = []
+        for metric in list(self.metrics.values()):
+            lines.extend(metric.collect())
+        for fn in list(self.collectors):
+            try:
+                lines.extend(fn())
+            except Exception as e:
+                print(f"⚠️ Metrics collector {getattr(fn, '__name__', fn)} failed: {e}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ==========================================================
+# SHARED METRICS
+# ==========================================================
+COMMAND_SECONDS = registry.histogram("command_seconds", "Slash command handling time.", ("command", "result"))
+ACK_SECONDS = registry.histogram("interaction_ack_seconds", "Interaction creation to first acknowledgement.", ("command", "mode"))
+INTERACTION_FAILURES = registry.counter("interaction_failures", "Interactions that could not be acknowledged.", ("command", "reason"))
+SWAP_STAGE_SECONDS = registry.histogram("swap_stage_seconds", "execute_swap time per stage.", ("stage",))
+RPC_SECONDS = registry.histogram("rpc_request_seconds", "JSON-RPC round trip per endpoint.", ("endpoint", "method"))
+RPC_ERRORS = registry.counter("rpc_errors", "Failed JSON-RPC attempts per endpoint.", ("endpoint",))
+NOTIFY_RATE_LIMITED = registry.counter("notify_rate_limited", "Discord 429 responses seen by the notifier.", ("scope",))
+
+
+# ==========================================================
+# HTTP ENDPOINT
+# ==========================================================
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = registry.exposition().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+
+
+def start_http_server(port=METRICS_PORT, addr=METRICS_ADDR):
+    """Serve /metrics from a daemon thread (idempotent). Returns the server or None if the port is taken."""
+    global _server
+    if _server is None:
+        try:
+            _server = ThreadingHTTPServer((addr, port), _Handler)
+        except OSError as e:
+            print(f"⚠️ Metrics endpoint not started on {addr}:{port}: {e}")
+            return None
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"📟 Metrics on http://{addr}:{port}/metrics")
+    return _server
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 📈 EchoProPulse System Metrics Sampler
+# A daemon thread samples CPU, memory, disk, network and the
+# bot's own RSS every SAMPLE_INTERVAL seconds into fixed-size
+# numpy ring buffers (24 h at 10 s by default). Commands read
+# the latest sample or min/avg/max over a window instantly,
+# instead of blocking the event loop in psutil.cpu_percent(1).
+# ==========================================================
+import os
+import time
+import threading
+import numpy as np
+import psutil
+
+SAMPLE_INTERVAL = float(os.getenv("METRICS_SAMPLE_INTERVAL", "10"))
+RETENTION = float(os.getenv("METRICS_RETENTION", str(24 * 3600)))
+DISK_PATH = os.getenv("METRICS_DISK_PATH", "/")
+
+FIELDS = ("cpu", "mem", "disk", "load1", "net_rx_kbps", "net_tx_kbps", "rss_mb", "loop_lag_ms")
+UNITS = {"cpu": "%", "mem": "%", "disk": "%", "load1": "", "net_rx_kbps": " kB/s", "net_tx_kbps": " kB/s",
+         "rss_mb": " MB", "loop_lag_ms": " ms"}
+
+WINDOWS = {"5m": 300, "1h": 3600, "6h": 6 * 3600, "24h": 24 * 3600}
+
+
+class SystemSampler:
+    def __init__(self, interval=SAMPLE_INTERVAL, retention=RETENTION, disk_path=DISK_PATH):
+        self.interval = interval
+        self.capacity = max(1, int(retention / interval))
+        self.disk_path = disk_path
+        self.ts = np.zeros(self.capacity, dtype=np.float64)
+        self.values = np.full((self.capacity, len(FIELDS)), np.nan, dtype=np.float32)
+        self.count = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._proc = psutil.Process()
+        self._net = None
+        self.sources = {}     # field → zero-arg callable for values psutil can't see (e.g. loop lag)
+
+    # ------------------------------------------------------
+    # Sampling thread
+    # ------------------------------------------------------
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            psutil.cpu_percent(interval=None)    # prime: the first call has no baseline
+            self._net = (time.monotonic(), psutil.net_io_counters())
+            self._thread = threading.Thread(target=self._loop, name="metrics-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        # first sample quickly so commands have data right after startup
+        delay = min(1.0, self.interval)
+        while not self._stop.wait(delay):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"⚠️ Metrics sample failed: {e}")
+            delay = self.interval
+
+    def sample(self):
+        now = time.monotonic()
+        net = psutil.net_io_counters()
+        t_prev, net_prev = self._net
+        dt = max(now - t_prev, 1e-6)
+        self._net = (now, net)
+        row = (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory().percent,
+            psutil.disk_usage(self.disk_path).percent,
+            os.getloadavg()[0],
+            (net.bytes_recv - net_prev.bytes_recv) / dt / 1024,
+            (net.bytes_sent - net_prev.bytes_sent) / dt / 1024,
+            self._proc.memory_info().rss / 1e6,
+            self._source("loop_lag_ms"),
+        )
+        with self._lock:
+            i = self.count % self.capacity
+            self.ts[i] = time.time()
+            self.values[i] = row
+            self.count += 1
+
+    def _source(self, field):
+        fn = self.sources.get(field)
+        if fn is None:
+            return np.nan
+        try:
+            value = fn()
+        except Exception:
+            return np.nan
+        return np.nan if value is None else value
+
+    # ------------------------------------------------------
+    # Readers (any thread, no blocking)
+    # ------------------------------------------------------
+    def latest(self):
+        """{field: value} of the newest sample plus 'ts', or None before the first sample."""
+        with self._lock:
+            if not self.count:
+                return None
+            i = (self.count - 1) % self.capacity
+            out = dict(zip(FIELDS, (float(v) for v in self.values[i])))
+            out["ts"] = float(self.ts[i])
+        return out
+
+    def series(self, seconds=None):
+        """(timestamps, values[n, len(FIELDS)]) oldest→newest within the last `seconds`."""
+        with self._lock:
+            n = min(self.count, self.capacity)
+            start = (self.count - n) % self.capacity
+            idx = (np.arange(n) + start) % self.capacity
+            ts, values = self.ts[idx].copy(), self.values[idx].copy()
+        if seconds is not None and n:
+            keep = ts >= time.time() - seconds
+            ts, values = ts[keep], values[keep]
+        return ts, values
+
+    def window(self, seconds):
+        """{field: (min, avg, max)} over the last `seconds`, plus 'samples'."""
+        _, values = self.series(seconds)
+        out = {"samples": len(values)}
+        if not len(values):
+            return out
+        for j, field in enumerate(FIELDS):
+            col = values[:, j]
+            if np.isnan(col).all():
+                continue
+            out[field] = (float(np.nanmin(col)), float(np.nanmean(col)), float(np.nanmax(col)))
+        return out
+
+
+def format_window(stats, fields=FIELDS):
+    """One line per metric: 'cpu  12.0% / 18.3% / 64.1%' (min / avg / max)."""
+    lines = []
+    for field in fields:
+        if field not in stats:
+            continue
+        lo, avg, hi = stats[field]
+        unit = UNITS[field]
+        lines.append(f"{field:<12} {lo:7.1f}{unit} / {avg:7.1f}{unit} / {hi:7.1f}{unit}")
+    return "\n".join(lines)
+
+
+_sampler = None
+
+
+def get_sampler():
+    global _sampler
+    if _sampler is None:
+        _sampler = SystemSampler().start()
+    return _sampler
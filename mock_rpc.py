@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🧪 EchoProPulse Mock Solana RPC
+# Local JSON-RPC server with scripted responses, for offline
+# benchmarks of the RPC pool and chain-state prefetcher.
+#
+#   python3 mock_rpc.py --port 8899 --latency-ms 5
+# ==========================================================
+import json
+import time
+import asyncio
+import argparse
+import itertools
+from aiohttp import web
+
+
+class MockRpc:
+    """
+    Serves JSON-RPC from a script: {method: result | [result, result, ...] | callable}.
+    Lists are consumed in order and the last entry repeats. Results that are dicts with
+    an "error" key are returned as JSON-RPC errors.
+    """
+
+    def __init__(self, script=None, latency_ms=0.0, slot_start=250_000_000):
+        self.script = dict(script or {})
+        self.latency = latency_ms / 1000.0
+        self.calls = {}
+        self._slots = itertools.count(slot_start)
+        self._cursor = {}
+        self._runner = None
+        self.url = None
+
+    def default_result(self, method, params):
+        if method == "getSlot":
+            return next(self._slots)
+        if method == "getLatestBlockhash":
+            slot = next(self._slots)
+            return {
+                "context": {"slot": slot},
+                "value": {"blockhash": f"MockBlockhash{slot}", "lastValidBlockHeight": slot + 150},
+            }
+        if method == "getRecentPrioritizationFees":
+            slot = next(self._slots)
+            return [{"slot": slot - i, "prioritizationFee": (i * 37) % 5000} for i in range(150)]
+        if method == "getHealth":
+            return "ok"
+        if method == "sendTransaction":
+            return f"MockSig{int(time.time() * 1e6)}"
+        return None
+
+    def result_for(self, method, params):
+        entry = self.script.get(method)
+        if entry is None:
+            return self.default_result(method, params)
+        if callable(entry):
+            return entry(params)
+        if isinstance(entry, list):
+            i = self._cursor.get(method, 0)
+            self._cursor[method] = min(i + 1, len(entry) - 1)
+            return entry[i]
+        return entry
+
+    async def handle(self, request):
+        body = await request.json()
+        method = body.get("method")
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        result = self.result_for(method, body.get("params"))
+        if isinstance(result, dict) and "error" in result:
+            reply = {"jsonrpc": "2.0", "id": body.get("id"), "error": result["error"]}
+        else:
+            reply = {"jsonrpc": "2.0", "id": body.get("id"), "result": result}
+        return web.Response(text=json.dumps(reply), content_type="application/json")
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _serve(port, latency_ms):
+    rpc = MockRpc(latency_ms=latency_ms)
+    url = await rpc.start(port=port)
+    print(f"🧪 Mock RPC listening on {url} (latency {latency_ms} ms)")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock Solana JSON-RPC server")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.port, args.latency_ms))
+    except KeyboardInterrupt:
+        print("👋 Mock RPC stopped.")
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+# ============================================================
+# 📬 EchoProPulse Notification Dispatcher
+# Non-blocking Discord delivery: callers enqueue and return,
+# a background asyncio loop posts through one pooled HTTP
+# session with per-channel queues and Discord's per-route
+# rate-limit buckets (X-RateLimit-* headers, 429 retry_after).
+# ============================================================
+import os
+import time
+import atexit
+import asyncio
+import threading
+import aiohttp
+from notify_outbox import Outbox, OUTBOX_PATH
+from metrics import registry, NOTIFY_RATE_LIMITED
+
+API_BASE = os.getenv("DISCORD_API_BASE", "https://discord.com/api/v10")
+MAX_QUEUE = int(os.getenv("NOTIFY_MAX_QUEUE", "1000"))
+MAX_ATTEMPTS = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "5"))
+FLUSH_TIMEOUT = float(os.getenv("NOTIFY_FLUSH_TIMEOUT", "10"))
+REQUEST_TIMEOUT = 10
+COALESCE_WINDOW = float(os.getenv("NOTIFY_COALESCE_MS", "750")) / 1000.0
+COALESCE_MAX = int(os.getenv("NOTIFY_COALESCE_MAX", "50"))
+REDRIVE_INTERVAL = float(os.getenv("NOTIFY_REDRIVE_INTERVAL", "30"))
+COMPACT_INTERVAL = float(os.getenv("NOTIFY_COMPACT_INTERVAL", "600"))
+
+# Discord message limits
+CONTENT_LIMIT = 2000
+EMBEDS_PER_MESSAGE = 10
+EMBED_TOTAL_LIMIT = 6000
+
+
+def is_webhook(target) -> bool:
+    return str(target).startswith(("http://", "https://"))
+
+
+def route_for(target) -> str:
+    """Discord rate-limits per route + major parameter (channel id / webhook)."""
+    return f"webhook:{target}" if is_webhook(target) else f"POST /channels/{target}/messages"
+
+
+# ============================================================
+# 🧵 Coalescing
+# ============================================================
+def split_content(text, limit=CONTENT_LIMIT):
+    """Split text into chunks of at most `limit` chars, preferring line breaks."""
+    chunks, current = [], ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def embed_size(embed):
+    """Characters Discord counts towards the 6000-per-message embed limit."""
+    size = len(embed.get("title", "")) + len(embed.get("description", ""))
+    size += len(embed.get("footer", {}).get("text", "")) + len(embed.get("author", {}).get("name", ""))
+    for field in embed.get("fields", []):
+        size += len(field.get("name", "")) + len(field.get("value", ""))
+    return size
+
+
+def coalesce(payloads):
+    """
+    Merge payloads bound for one channel into as few messages as Discord allows.
+    Contents are joined with newlines and split at 2000 chars; embeds are packed
+    10 per message within the 6000-char total. Payloads carrying other keys
+    (e.g. webhook username) only merge with payloads that carry the same ones.
+    """
+    groups = []
+    for p in payloads:
+        extra = {k: v for k, v in p.items() if k not in ("content", "embeds")}
+        if groups and groups[-1][0] == extra:
+            groups[-1][1].append(p)
+        else:
+            groups.append((extra, [p]))
+
+    merged = []
+    for extra, group in groups:
+        text = "\n".join(p["content"] for p in group if p.get("content"))
+        embeds = [e for p in group for e in p.get("embeds", [])]
+
+        messages = [{"content": c} for c in split_content(text)] if text else []
+        batch, batch_size = [], 0
+        for e in embeds:
+            size = embed_size(e)
+            if batch and (len(batch) >= EMBEDS_PER_MESSAGE or batch_size + size > EMBED_TOTAL_LIMIT):
+                messages.append({"embeds": batch})
+                batch, batch_size = [], 0
+            batch.append(e)
+            batch_size += size
+        if batch:
+            # Attach the first embed batch to the last text chunk when it fits
+            if messages and "embeds" not in messages[-1]:
+                messages[-1]["embeds"] = batch
+            else:
+                messages.append({"embeds": batch})
+        merged.extend({**extra, **m} for m in messages)
+    return merged
+
+
+# ============================================================
+# 🚦 Rate-limit buckets
+# ============================================================
+class RateLimiter:
+    """Tracks Discord buckets from response headers; `wait()` sleeps only when a bucket is empty."""
+
+    def __init__(self):
+        self._bucket_for_route = {}   # route -> bucket hash
+        self._buckets = {}            # bucket -> (remaining, reset_at monotonic)
+        self._global_until = 0.0
+
+    def _key(self, route):
+        return self._bucket_for_route.get(route, route)
+
+    async def wait(self, route):
+        while True:
+            now = time.monotonic()
+            delay = self._global_until - now
+            remaining, reset_at = self._buckets.get(self._key(route), (1, 0.0))
+            if remaining <= 0 and reset_at > now:
+                delay = max(delay, reset_at - now)
+            if delay <= 0:
+                if remaining <= 0:
+                    self._buckets.pop(self._key(route), None)
+                else:
+                    # Optimistically reserve a slot so concurrent senders don't overshoot
+                    self._buckets[self._key(route)] = (remaining - 1, reset_at)
+                return
+            await asyncio.sleep(delay)
+
+    def update(self, route, headers):
+        bucket = headers.get("X-RateLimit-Bucket")
+        if bucket:
+            self._bucket_for_route[route] = bucket
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is not None and reset_after is not None:
+            self._buckets[self._key(route)] = (int(remaining), time.monotonic() + float(reset_after))
+
+    def backoff(self, route, retry_after, is_global=False):
+        until = time.monotonic() + retry_after
+        if is_global:
+            self._global_until = max(self._global_until, until)
+        else:
+            self._buckets[self._key(route)] = (0, until)
+
+
+# ============================================================
+# 📬 Dispatcher
+# ============================================================
+class NotifyDispatcher:
+    """
+    Owns a private event loop on a daemon thread, so it works the same from
+    async bot handlers and from plain scripts. `submit()` never blocks.
+    Messages go through the durable outbox first (set outbox_path="" to disable);
+    undelivered ones are retried periodically and replayed after a restart.
+    """
+
+    def __init__(self, bot_token=None, max_queue=MAX_QUEUE, coalesce_window=COALESCE_WINDOW,
+                 outbox_path=OUTBOX_PATH):
+        self.bot_token = bot_token
+        self.max_queue = max_queue
+        self.coalesce_window = coalesce_window
+        self.outbox_path = outbox_path
+        self.outbox = None
+        self.outbox_pending = 0
+        self.coalesced = 0
+        self.limiter = RateLimiter()
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.rate_limited = 0
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._queues = {}
+        self._workers = {}
+        self._inflight = set()
+        self._maint_task = None
+        self._start_lock = threading.Lock()
+
+    # --------------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------------
+    def start(self):
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return self
+            self._loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(ready,), name="notify-dispatcher", daemon=True)
+            self._thread.start()
+            ready.wait()
+        return self
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        if self.outbox_path:
+            try:
+                self.outbox = Outbox(self.outbox_path)
+            except Exception as e:
+                print(f"⚠️ Notify outbox unavailable ({e}); falling back to memory only.")
+        self._loop.call_soon(ready.set)
+        self._maint_task = self._loop.create_task(self._maintenance())
+        self._loop.run_forever()
+
+    async def _maintenance(self):
+        """Replay orphaned/undelivered outbox rows and keep the outbox bounded."""
+        if self.outbox is None:
+            return
+        last_compact = 0.0
+        while True:
+            try:
+                self.outbox.claim_orphans()
+                for row_id, target, payload in self.outbox.pending(exclude=self._inflight):
+                    self._put(target, row_id, payload)
+                if time.monotonic() - last_compact >= COMPACT_INTERVAL:
+                    dropped = self.outbox.compact()
+                    if dropped:
+                        print(f"⚠️ Notify outbox compaction dropped {dropped} stale message(s).")
+                    last_compact = time.monotonic()
+                self.outbox_pending = self.outbox.count()
+            except Exception as e:
+                print(f"⚠️ Notify outbox maintenance failed: {e}")
+            await asyncio.sleep(REDRIVE_INTERVAL)
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    # --------------------------------------------------------
+    # Producer API (any thread, any loop)
+    # --------------------------------------------------------
+    def submit(self, target, payload) -> bool:
+        """Queue a message payload for a channel id or webhook URL. Returns immediately."""
+        if not target or not payload:
+            return False
+        self.start()
+        self._loop.call_soon_threadsafe(self._enqueue, str(target), payload)
+        return True
+
+    def _enqueue(self, target, payload):
+        row_id = None
+        if self.outbox is not None:
+            try:
+                row_id = self.outbox.add(target, payload)
+            except Exception as e:
+                print(f"⚠️ Notify outbox write failed: {e}")
+        self._put(target, row_id, payload)
+
+    def _put(self, target, row_id, payload):
+        q = self._queues.get(target)
+        if q is None:
+            q = self._queues[target] = asyncio.Queue(maxsize=self.max_queue)
+            self._workers[target] = self._loop.create_task(self._worker(target, q))
+        try:
+            q.put_nowait((row_id, payload))
+            if row_id is not None:
+                self._inflight.add(row_id)
+        except asyncio.QueueFull:
+            if row_id is None:
+                self.dropped += 1
+                print(f"⚠️ Notify queue full for {target}; message dropped.")
+            # otherwise it stays in the outbox and is redriven later
+
+    # --------------------------------------------------------
+    # Delivery
+    # --------------------------------------------------------
+    async def _collect(self, q):
+        """First queued payload plus anything else arriving within the coalesce window."""
+        batch = [await q.get()]
+        deadline = time.monotonic() + self.coalesce_window
+        while len(batch) < COALESCE_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(q.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _worker(self, target, q):
+        while True:
+            batch = await self._collect(q)
+            ids = [row_id for row_id, _ in batch]
+            done = False
+            try:
+                messages = coalesce([payload for _, payload in batch])
+                self.coalesced += len(batch) - len(messages)
+                for payload in messages:
+                    # None = retryable failure: keep the rows for the next redrive
+                    if await self._deliver(target, payload) is None:
+                        break
+                else:
+                    done = True     # only once every payload went out (or was rejected for good)
+            except Exception as e:
+                self.failed += 1
+                print(f"❌ Failed to post to Discord: {e}")
+            finally:
+                if self.outbox is not None:
+                    try:
+                        (self.outbox.delete if done else self.outbox.bump)(ids)
+                        self.outbox_pending = self.outbox.count()
+                    except Exception as e:
+                        print(f"⚠️ Notify outbox update failed: {e}")
+                self._inflight.difference_update(ids)
+                for _ in batch:
+                    q.task_done()
+
+    async def _deliver(self, target, payload):
+        """True = delivered, False = rejected for good (dropped), None = retry later."""
+        route = route_for(target)
+        if is_webhook(target):
+            url, headers = target, {}
+        else:
+            url = f"{API_BASE}/channels/{target}/messages"
+            headers = {"Authorization": f"Bot {self.bot_token}"}
+
+        session = await self._get_session()
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            await self.limiter.wait(route)
+            try:
+                async with session.post(url, json=payload, headers=headers) as r:
+                    self.limiter.update(route, r.headers)
+                    if r.status == 429:
+                        self.rate_limited += 1
+                        try:
+                            body = await r.json(content_type=None)
+                        except ValueError:
+                            body = None     # e.g. a Cloudflare HTML page: fall back to the headers
+                        if not isinstance(body, dict):
+                            body = {}
+                        NOTIFY_RATE_LIMITED.inc("global" if body.get("global") else "route")
+                        try:
+                            retry = float(body.get("retry_after", r.headers.get("Retry-After", 1)))
+                        except (TypeError, ValueError):
+                            retry = 1.0
+                        self.limiter.backoff(route, retry, bool(body.get("global")))
+                        continue
+                    if r.status >= 500:
+                        await asyncio.sleep(min(2 ** attempt, 30))
+                        continue
+                    if r.status not in (200, 204):
+                        self.failed += 1
+                        print(f"⚠️ Discord API returned {r.status}: {(await r.text())[:200]}")
+                        return False
+                    self.sent += 1
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"⚠️ Discord post attempt {attempt} failed: {e}")
+                if attempt < MAX_ATTEMPTS:
+                    await asyncio.sleep(min(2 ** attempt, 30))
+        self.failed += 1
+        print(f"❌ Gave up posting to {target} after {MAX_ATTEMPTS} attempts; will retry from the outbox.")
+        return None
+
+    # --------------------------------------------------------
+    # Flush / introspection
+    # --------------------------------------------------------
+    async def _drain(self):
+        await asyncio.gather(*(q.join() for q in list(self._queues.values())))
+
+    def flush(self, timeout=FLUSH_TIMEOUT) -> bool:
+        """Block (from a non-dispatcher thread) until queued messages are delivered."""
+        if not self._thread or not self._thread.is_alive():
+            return True
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(), self._loop).result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def close(self, timeout=FLUSH_TIMEOUT):
+        if not self._thread or not self._thread.is_alive():
+            return
+        self.flush(timeout)
+
+        async def _shutdown():
+            tasks = list(self._workers.values()) + [self._maint_task]
+            for task in tasks:
+                if task:
+                    task.cancel()
+            await asyncio.gather(*(t for t in tasks if t), return_exceptions=True)
+            if self._session and not self._session.closed:
+                await self._session.close()
+            if self.outbox is not None:
+                self.outbox.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), self._loop).result(5)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+    def queue_depths(self):
+        return {t: q.qsize() for t, q in list(self._queues.items())}
+
+    def stats(self):
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "rate_limited": self.rate_limited,
+            "coalesced": self.coalesced,
+            "queued": sum(q.qsize() for q in self._queues.values()),
+            "outbox": self.outbox_pending,
+        }
+
+
+_dispatcher = None
+
+
+def _register_metrics(d):
+    # webhook URLs carry their token, so they are reported under one label
+    def depths():
+        out = {}
+        for target, n in d.queue_depths().items():
+            key = ("webhook",) if is_webhook(target) else (str(target),)
+            out[key] = out.get(key, 0) + n
+        return out
+
+    registry.gauge_func("notify_queue_depth", "Notifications waiting per target.", depths, ("target",))
+    registry.gauge_func("notify_outbox_pending", "Undelivered rows in the SQLite outbox.", lambda: d.outbox_pending)
+    registry.counter_func("notify_messages", "Notifications by outcome.", lambda: {
+        (k,): d.stats()[k] for k in ("sent", "failed", "dropped", "coalesced")
+    }, ("outcome",))
+
+
+def get_dispatcher(bot_token=None):
+    """Process-wide dispatcher; flushed on interpreter exit so short scripts still deliver."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotifyDispatcher(bot_token or os.getenv("DISCORD_BOT_TOKEN"))
+        atexit.register(_dispatcher.close)
+        _register_metrics(_dispatcher)
+    elif bot_token and not _dispatcher.bot_token:
+        _dispatcher.bot_token = bot_token
+    return _dispatcher
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# ============================================================
+# 📮 EchoProPulse Notification Outbox
+# Durable SQLite (WAL) queue behind the notify dispatcher.
+# Every notification is written here before delivery and
+# deleted once Discord accepts it, so alerts survive outages
+# and process restarts. Delivery is at-least-once.
+# ============================================================
+import os
+import json
+import time
+import sqlite3
+
+OUTBOX_PATH = os.getenv("NOTIFY_OUTBOX", "/root/EchoProPulse/discord_bot/notify_outbox.db")
+OUTBOX_MAX_ROWS = int(os.getenv("NOTIFY_OUTBOX_MAX_ROWS", "5000"))
+OUTBOX_MAX_AGE = float(os.getenv("NOTIFY_OUTBOX_MAX_AGE", str(24 * 3600)))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    target    TEXT    NOT NULL,
+    payload   TEXT    NOT NULL,
+    created   REAL    NOT NULL,
+    attempts  INTEGER NOT NULL DEFAULT 0,
+    owner     INTEGER
+);
+CREATE INDEX IF NOT EXISTS outbox_owner ON outbox(owner);
+"""
+
+
+def _alive(pid):
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class Outbox:
+    """
+    Rows belong to the process that wrote them (owner = pid). Rows whose owner
+    has exited are claimed by the next process that drains, which is how
+    undelivered alerts get replayed after a crash or restart.
+    Use from a single thread (the dispatcher's loop thread).
+    """
+
+    def __init__(self, path=OUTBOX_PATH, max_rows=OUTBOX_MAX_ROWS, max_age=OUTBOX_MAX_AGE):
+        self.path = path
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self.pid = os.getpid()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=5, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def add(self, target, payload):
+        cur = self.db.execute(
+            "INSERT INTO outbox (target, payload, created, owner) VALUES (?, ?, ?, ?)",
+            (str(target), json.dumps(payload), time.time(), self.pid),
+        )
+        return cur.lastrowid
+
+    def delete(self, ids):
+        ids = [i for i in ids if i is not None]
+        if ids:
+            self.db.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def bump(self, ids):
+        ids = [i for i in ids if i is not None]
+        if ids:
+            self.db.executemany("UPDATE outbox SET attempts = attempts + 1 WHERE id = ?", [(i,) for i in ids])
+
+    def claim_orphans(self):
+        """Take over rows written by processes that are no longer running."""
+        owners = [r[0] for r in self.db.execute("SELECT DISTINCT owner FROM outbox WHERE owner != ? OR owner IS NULL", (self.pid,))]
+        dead = [o for o in owners if not _alive(o)]
+        for o in dead:
+            if o is None:
+                self.db.execute("UPDATE outbox SET owner = ? WHERE owner IS NULL", (self.pid,))
+            else:
+                self.db.execute("UPDATE outbox SET owner = ? WHERE owner = ?", (self.pid, o))
+        return len(dead)
+
+    def pending(self, exclude=(), limit=1000):
+        """Undelivered rows owned by this process, oldest first: [(id, target, payload)]."""
+        rows = self.db.execute(
+            "SELECT id, target, payload FROM outbox WHERE owner = ? ORDER BY id LIMIT ?",
+            (self.pid, limit + len(exclude)),
+        ).fetchall()
+        return [(i, t, json.loads(p)) for i, t, p in rows if i not in exclude][:limit]
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def compact(self):
+        """Drop rows past the age limit or beyond the size cap (oldest first), then checkpoint the WAL."""
+        dropped = self.db.execute("DELETE FROM outbox WHERE created < ?", (time.time() - self.max_age,)).rowcount
+        excess = self.count() - self.max_rows
+        if excess > 0:
+            dropped += self.db.execute(
+                "DELETE FROM outbox WHERE id IN (SELECT id FROM outbox ORDER BY id LIMIT ?)", (excess,)
+            ).rowcount
+        self.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return dropped
+
+    def close(self):
+        try:
+            self.db.close()
+        except Exception:
+            pass
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# ============================================================
+# 📡 EchoProPulse Notification Relay
+# Long-running daemon on a Unix socket. Shell scripts and cron
+# jobs write newline-delimited JSON and return immediately; the
+# relay forwards everything through one pooled, rate-limited,
+# outbox-backed dispatcher.
+#
+#   {"channel": "logs", "content": "🧹 cleanup done"}
+#   {"channel": "vps", "embeds": [{"title": "..."}]}
+#   {"channel": "https://discord.com/api/webhooks/...", "content": "..."}
+#
+# channel may be main | logs | vps | a channel id | a webhook URL.
+# Client: discord_bot/notify.sh <channel> <message>
+# ============================================================
+import os
+import json
+import signal
+import asyncio
+from dotenv import load_dotenv
+from notify_dispatcher import get_dispatcher
+
+load_dotenv(dotenv_path="/root/EchoProPulse/discord_bot/.env")
+
+SOCKET_PATH = os.getenv("NOTIFY_RELAY_SOCKET", "/root/EchoProPulse/discord_bot/notify.sock")
+MAX_LINE = 256 * 1024
+
+# Same aliases and prefixes as the discord_notify helpers
+CHANNELS = {
+    "main": (os.getenv("DISCORD_CHANNEL_ID"), "🚀 "),
+    "logs": (os.getenv("DISCORD_LOG_CHANNEL_ID"), "🪵 "),
+    "vps": (os.getenv("DISCORD_VPS_CHANNEL_ID"), "🖥️ "),
+}
+
+
+def resolve(message):
+    """Turn one relay message into (target, payload); raises ValueError if unusable."""
+    channel = str(message.get("channel") or "logs")
+    target, prefix = CHANNELS.get(channel, (channel, ""))
+    if not target:
+        raise ValueError(f"channel '{channel}' is not configured")
+    payload = {}
+    if message.get("content"):
+        payload["content"] = f"{prefix}{message['content']}" if message.get("prefix", True) else message["content"]
+    if message.get("embeds"):
+        payload["embeds"] = message["embeds"]
+    if message.get("username"):
+        payload["username"] = message["username"]
+    if not payload:
+        raise ValueError("message has no content or embeds")
+    return target, payload
+
+
+class Relay:
+    def __init__(self, path=SOCKET_PATH):
+        self.path = path
+        self.dispatcher = get_dispatcher()
+        self.received = 0
+        self.rejected = 0
+        self._server = None
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    self.rejected += 1
+                    print("⚠️ Relay message over size limit; connection dropped.")
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    target, payload = resolve(json.loads(line))
+                    self.dispatcher.submit(target, payload)
+                    self.received += 1
+                except (ValueError, TypeError, AttributeError) as e:
+                    self.rejected += 1
+                    print(f"⚠️ Relay rejected message: {e}")
+        finally:
+            writer.close()
+
+    async def serve(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._server = await asyncio.start_unix_server(self.handle, path=self.path, limit=MAX_LINE)
+        os.chmod(self.path, 0o660)
+        self.dispatcher.start()
+        print(f"📡 Notify relay listening on {self.path}")
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        async with self._server:
+            await stop.wait()
+        print(f"🧹 Relay stopping ({self.received} relayed, {self.rejected} rejected); flushing…")
+        await asyncio.to_thread(self.dispatcher.flush)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+if __name__ == "__main__":
+    asyncio.run(Relay().serve())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🗂️ EchoProPulse Quote Cache
+# LRU + TTL cache for swap quotes/routes, keyed by
+# (token_in, token_out, amount bucket, slippage). Concurrent
+# misses on the same key share a single in-flight fetch.
+# ==========================================================
+import os
+import math
+import time
+import asyncio
+from collections import OrderedDict
+
+QUOTE_TTL = float(os.getenv("QUOTE_TTL", "2.0"))              # seconds
+QUOTE_MAX_SLOT_AGE = int(os.getenv("QUOTE_MAX_SLOT_AGE", "4"))  # ~1.6 s of slots
+QUOTE_CACHE_SIZE = int(os.getenv("QUOTE_CACHE_SIZE", "1024"))
+QUOTE_BUCKET_PCT = float(os.getenv("QUOTE_BUCKET_PCT", "1.0"))  # amount bucket width, %
+
+
+def amount_bucket(amount, pct=QUOTE_BUCKET_PCT):
+    """
+    Log-scale bucket so every amount within ~pct% of each other shares a key.
+    1.00 and 1.005 land together; 1.0 and 2.0 never do.
+    """
+    if amount <= 0:
+        return None
+    return round(math.log(amount) / math.log1p(pct / 100.0))
+
+
+class QuoteCache:
+    """Bounded LRU of quotes that expire after `ttl` seconds or `max_slot_age` slots."""
+
+    def __init__(self, maxsize=QUOTE_CACHE_SIZE, ttl=QUOTE_TTL, max_slot_age=QUOTE_MAX_SLOT_AGE):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_slot_age = max_slot_age
+        self._entries = OrderedDict()   # key -> (value, expires_at, slot)
+        self._inflight = {}             # key -> Future
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0                 # callers that piggy-backed on an in-flight fetch
+
+    @staticmethod
+    def key(token_in, token_out, amount, slippage_bps):
+        return (token_in, token_out, amount_bucket(amount), int(slippage_bps))
+
+    def _fresh(self, entry, slot):
+        _, expires_at, entry_slot = entry
+        if time.monotonic() > expires_at:
+            return False
+        if slot is not None and entry_slot is not None and slot - entry_slot > self.max_slot_age:
+            return False
+        return True
+
+    def get(self, key, slot=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not self._fresh(entry, slot):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, slot=None):
+        self._entries[key] = (value, time.monotonic() + self.ttl, slot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token_in=None, token_out=None):
+        """Drop every entry (or only those for one pair)."""
+        if token_in is None and token_out is None:
+            self._entries.clear()
+            return
+        for k in [k for k in self._entries if (token_in in (None, k[0]) and token_out in (None, k[1]))]:
+            del self._entries[k]
+
+    async def get_or_fetch(self, token_in, token_out, amount, slippage_bps, fetch, slot=None):
+        """
+        Return a cached quote or `await fetch()` for it. If another task is already
+        fetching the same key, wait on that fetch instead of starting a second one.
+        """
+        key = self.key(token_in, token_out, amount, slippage_bps)
+        value = self.get(key, slot)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.shared += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await fetch()
+            self.put(key, value, slot)
+            fut.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()     # mark retrieved so a fetch nobody shared doesn't warn
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self):
+        total = self.hits + self.misses + self.shared
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "hit_rate": round((self.hits + self.shared) / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# ==========================================================
+# ⏪ EchoProPulse Replay / Backtest Engine
+# Streams historical price and pool-state files through a
+# strategy and the solana_trade swap path in simulation mode.
+# Files are read row by row (CSV/JSONL, optionally .gz) and
+# merged by timestamp, so memory stays flat for any length.
+#
+#   python3 replay.py ticks/*.csv.gz --strategy threshold --param threshold=0.02
+#   python3 replay.py ticks/*.csv --sweep threshold=0.01,0.02,0.05 --processes 4
+# ==========================================================
+import os
+import csv
+import sys
+import gzip
+import json
+import heapq
+import time
+import asyncio
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import solana_trade
+from amm_sim import ConstantProductPool, StableSwapPool
+
+DEFAULT_DEPTH = float(os.getenv("SIM_POOL_DEPTH", "1000000"))
+
+
+# ==========================================================
+# TICK STREAMS
+# ==========================================================
+def _open(path):
+    return gzip.open(path, "rt", newline="") if path.endswith(".gz") else open(path, "r", newline="")
+
+
+def _ts(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def read_ticks(path):
+    """
+    Yield ticks from one file, one row at a time. Rows need ts, token_in, token_out and either
+    reserve_in/reserve_out (pool state) or price (synthesised into a pool of SIM_POOL_DEPTH).
+    Optional: kind (constant_product|stable_swap), fee_bps, amp.
+    """
+    with _open(path) as f:
+        base = path[:-3] if path.endswith(".gz") else path
+        is_json = base.endswith((".jsonl", ".ndjson"))
+        rows = (json.loads(line) for line in f if line.strip()) if is_json else csv.DictReader(f)
+        for row in rows:
+            row["ts"] = _ts(row["ts"])
+            yield row
+
+
+def merged_ticks(paths):
+    """Merge several time-sorted tick files into one time-sorted stream, lazily."""
+    return heapq.merge(*(read_ticks(p) for p in paths), key=lambda r: r["ts"])
+
+
+def pool_from_tick(tick):
+    fee = float(tick.get("fee_bps") or solana_trade.SIM_POOL_FEE_BPS)
+    if tick.get("reserve_in") not in (None, ""):
+        r_in, r_out = float(tick["reserve_in"]), float(tick["reserve_out"])
+    else:
+        r_in = DEFAULT_DEPTH
+        r_out = DEFAULT_DEPTH * float(tick["price"])
+    if tick.get("kind") == "stable_swap":
+        return StableSwapPool(r_in, r_out, float(tick.get("amp") or 100), fee)
+    return ConstantProductPool(r_in, r_out, fee)
+
+
+# ==========================================================
+# CLOCK
+# ==========================================================
+class ReplayClock:
+    """
+    Simulated clock driven by tick timestamps.
+    speed=None runs as fast as the CPU allows; speed=60 replays one minute per second.
+    """
+
+    def __init__(self, speed=None):
+        self.speed = speed
+        self.now = None
+        self._wall0 = None
+        self._sim0 = None
+
+    async def advance(self, ts):
+        if self.now is None:
+            self._wall0, self._sim0 = time.monotonic(), ts
+        self.now = ts
+        if self.speed:
+            due = self._wall0 + (ts - self._sim0) / self.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+# ==========================================================
+# STRATEGIES
+# ==========================================================
+class Strategy:
+    """Base strategy: return a list of (token_in, token_out, amount) legs per tick."""
+
+    def __init__(self, **params):
+        self.params = params
+
+    def on_tick(self, tick, pool, clock):
+        return []
+
+    def on_fill(self, leg, result):
+        pass
+
+
+class ThresholdStrategy(Strategy):
+    """Buys `size` whenever the pair's price moves more than `threshold` from the last trade."""
+
+    def __init__(self, threshold=0.02, size=100.0, **params):
+        super().__init__(threshold=float(threshold), size=float(size), **params)
+        self.last = {}
+
+    def on_tick(self, tick, pool, clock):
+        pair = (tick["token_in"], tick["token_out"])
+        price = pool.spot_price()
+        ref = self.last.get(pair)
+        if ref is None:
+            self.last[pair] = price
+            return []
+        if abs(price / ref - 1.0) >= self.params["threshold"]:
+            self.last[pair] = price
+            return [(tick["token_in"], tick["token_out"], self.params["size"])]
+        return []
+
+
+STRATEGIES = {"threshold": ThresholdStrategy}
+
+
+# ==========================================================
+# ENGINE
+# ==========================================================
+def _pct(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100.0 * len(sorted_values)))]
+
+
+async def replay(paths, strategy, speed=None, fills_out=None, max_ticks=None):
+    """
+    Drive `strategy` over the merged tick stream. Each leg goes through
+    solana_trade.run_swap in an offline simulation context. Per-trade fills
+    (slippage vs. pre-trade spot, wall latency) stream to `fills_out` as JSONL.
+    """
+    clock = ReplayClock(speed)
+    ctx = solana_trade.SwapContext.simulation()
+    latencies, slippages = [], []
+    ticks = trades = errors = 0
+    sink = open(fills_out, "w") if fills_out else None
+    t_start = time.perf_counter()
+    try:
+        for tick in merged_ticks(paths):
+            if max_ticks and ticks >= max_ticks:
+                break
+            ticks += 1
+            await clock.advance(tick["ts"])
+            pool = pool_from_tick(tick)
+            solana_trade.register_sim_pool(tick["token_in"], tick["token_out"], pool)
+
+            for leg in strategy.on_tick(tick, pool, clock):
+                token_in, token_out, amount = leg
+                spot = solana_trade.sim_pool_for(token_in, token_out).spot_price()
+                t0 = time.perf_counter()
+                res = await solana_trade.run_swap(ctx, token_in, token_out, amount)
+                latency = time.perf_counter() - t0
+                strategy.on_fill(leg, res)
+                if res["status"] != "success":
+                    errors += 1
+                    continue
+                trades += 1
+                out = res["route"]["expected_out"]
+                slip = 1.0 - out / (amount * spot) if amount and spot else 0.0
+                latencies.append(latency)
+                slippages.append(slip)
+                if sink:
+                    sink.write(json.dumps({
+                        "ts": clock.now, "in": token_in, "out": token_out, "amount": amount,
+                        "filled": out, "slippage": slip, "latency_us": round(latency * 1e6, 1),
+                    }) + "\n")
+    finally:
+        if sink:
+            sink.close()
+
+    elapsed = time.perf_counter() - t_start
+    latencies.sort()
+    slippages.sort()
+    return {
+        "params": strategy.params,
+        "ticks": ticks,
+        "trades": trades,
+        "errors": errors,
+        "wall_s": round(elapsed, 3),
+        "ticks_per_s": round(ticks / elapsed, 1) if elapsed else 0.0,
+        "latency_p50_us": round(_pct(latencies, 50) * 1e6, 1),
+        "latency_p99_us": round(_pct(latencies, 99) * 1e6, 1),
+        "slippage_avg": sum(slippages) / len(slippages) if slippages else 0.0,
+        "slippage_p99": _pct(slippages, 99),
+    }
+
+
+# ==========================================================
+# PARAMETER SWEEPS
+# ==========================================================
+def _run_one(args):
+    paths, strategy_name, params, max_ticks = args
+    strategy = STRATEGIES[strategy_name](**params)
+    return asyncio.run(replay(paths, strategy, max_ticks=max_ticks))
+
+
+def sweep(paths, strategy_name, grid, processes=None, max_ticks=None):
+    """Run every combination in `grid` ({param: [values]}) in its own worker process."""
+    keys = sorted(grid)
+    combos = [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+    jobs = [(list(paths), strategy_name, combo, max_ticks) for combo in combos]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_run_one, jobs))
+
+
+def _parse_params(items):
+    params = {}
+    for item in items or []:
+        key, _, value = item.partition("=")
+        params[key] = value
+    return params
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay tick files through a strategy in simulation mode")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--strategy", default="threshold", choices=sorted(STRATEGIES))
+    parser.add_argument("--param", action="append", help="strategy parameter, key=value")
+    parser.add_argument("--sweep", action="append", help="swept parameter, key=v1,v2,...")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--speed", type=float, default=None, help="sim seconds per wall second")
+    parser.add_argument("--fills", default=None, help="write per-trade fills to this JSONL file")
+    parser.add_argument("--max-ticks", type=int, default=None)
+    args = parser.parse_args()
+
+    params = _parse_params(args.param)
+    if args.sweep:
+        grid = {k: [v] for k, v in params.items()}
+        for k, v in _parse_params(args.sweep).items():
+            grid[k] = v.split(",")
+        for result in sweep(args.files, args.strategy, grid, args.processes, args.max_ticks):
+            print(json.dumps(result))
+    else:
+        strategy = STRATEGIES[args.strategy](**params)
+        result = asyncio.run(replay(args.files, strategy, args.speed, args.fills, args.max_ticks))
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["errors"] == 0 else 1)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🌐 EchoProPulse RPC Pool
+# Long-lived Solana JSON-RPC connections across several endpoints.
+# Each call goes to the fastest healthy endpoint; errors and
+# slot lag push an endpoint down the list until it recovers.
+# ==========================================================
+import os
+import time
+import asyncio
+import itertools
+import aiohttp
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+from metrics import RPC_SECONDS, RPC_ERRORS
+
+load_dotenv()
+
+DEFAULT_RPC = "https://api.mainnet-beta.solana.com"
+
+# Comma-separated list, e.g. "https://mainnet.helius-rpc.com/?api-key=...,http://127.0.0.1:8899"
+RPC_URLS = [u.strip() for u in os.getenv("SOLANA_RPC_URLS", "").split(",") if u.strip()] or [
+    os.getenv("SOLANA_RPC", DEFAULT_RPC)
+]
+
+REQUEST_TIMEOUT = float(os.getenv("RPC_TIMEOUT", "5"))
+PROBE_INTERVAL = float(os.getenv("RPC_PROBE_INTERVAL", "10"))
+MAX_SLOT_LAG = int(os.getenv("RPC_MAX_SLOT_LAG", "25"))
+ERROR_COOLDOWN = 5.0        # seconds an endpoint sits out after a failure
+EWMA_ALPHA = 0.3            # weight of the newest latency sample
+
+# JSON-RPC error codes that mean "this node is unhealthy", not "your request is bad"
+NODE_UNHEALTHY_CODES = {-32005, -32004, -32014}
+
+
+class RpcError(Exception):
+    """Raised when an RPC call fails on every endpoint or returns a request error."""
+
+    def __init__(self, message, code=None, endpoint=None):
+        super().__init__(message)
+        self.code = code
+        self.endpoint = endpoint
+
+
+class Endpoint:
+    """Rolling health stats for one RPC URL."""
+
+    def __init__(self, url):
+        self.url = url
+        parsed = urlparse(url)
+        self.label = parsed.hostname + (f":{parsed.port}" if parsed.port else "") if parsed.hostname else url
+        self.latency = None          # EWMA seconds
+        self.slot = 0
+        self.errors = 0
+        self.calls = 0
+        self.down_until = 0.0
+
+    def record_ok(self, elapsed):
+        self.calls += 1
+        self.latency = elapsed if self.latency is None else (
+            EWMA_ALPHA * elapsed + (1 - EWMA_ALPHA) * self.latency
+        )
+
+    def record_error(self):
+        self.errors += 1
+        RPC_ERRORS.inc(self.label)
+        self.down_until = time.monotonic() + ERROR_COOLDOWN
+
+    def snapshot(self):
+        return {
+            "url": self.url,
+            "latency_ms": round(self.latency * 1000, 2) if self.latency is not None else None,
+            "slot": self.slot,
+            "calls": self.calls,
+            "errors": self.errors,
+            "down": self.down_until > time.monotonic(),
+        }
+
+
+class RpcPool:
+    """
+    Keeps one pooled HTTP session open against every configured endpoint.
+    Use `await pool.call("getSlot")` — the pool picks the endpoint and falls back on failure.
+    """
+
+    def __init__(self, urls=None, timeout=REQUEST_TIMEOUT, probe_interval=PROBE_INTERVAL,
+                 max_slot_lag=MAX_SLOT_LAG):
+        self.endpoints = [Endpoint(u) for u in (urls or RPC_URLS)]
+        if not self.endpoints:
+            raise ValueError("RpcPool needs at least one endpoint")
+        self.timeout = timeout
+        self.probe_interval = probe_interval
+        self.max_slot_lag = max_slot_lag
+        self._ids = itertools.count(1)
+        self._session = None
+        self._probe_task = None
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+    async def start(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=60, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            await self.probe()
+        if self.probe_interval and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.create_task(self._probe_loop())
+        return self
+
+    async def close(self):
+        if self._probe_task:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ------------------------------------------------------
+    # Endpoint ranking
+    # ------------------------------------------------------
+    def best_slot(self):
+        return max(e.slot for e in self.endpoints)
+
+    def ranked(self):
+        """Endpoints ordered healthy → lagging → cooling down, fastest first."""
+        now = time.monotonic()
+        top = self.best_slot()
+
+        def score(e):
+            down = e.down_until > now
+            lagging = top and e.slot and (top - e.slot) > self.max_slot_lag
+            latency = e.latency if e.latency is not None else float("inf")
+            return (down, bool(lagging), latency)
+
+        return sorted(self.endpoints, key=score)
+
+    # ------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------
+    async def _post(self, ep, method, params):
+        if self._session is None or self._session.closed:
+            await self.start()
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+        t0 = time.perf_counter()
+        async with self._session.post(ep.url, json=payload) as r:
+            if r.status == 429 or r.status >= 500:
+                raise RpcError(f"HTTP {r.status}", code=r.status, endpoint=ep.url)
+            body = await r.json(content_type=None)
+        elapsed = time.perf_counter() - t0
+        RPC_SECONDS.observe(elapsed, ep.label, method)
+        err = body.get("error")
+        if err:
+            code = err.get("code")
+            if code in NODE_UNHEALTHY_CODES:
+                raise RpcError(err.get("message", "node unhealthy"), code=code, endpoint=ep.url)
+            # Request-level error: the node answered fine, so it still counts as healthy
+            ep.record_ok(elapsed)
+            raise RpcError(err.get("message", "rpc error"), code=code, endpoint=None)
+        ep.record_ok(elapsed)
+        return body.get("result")
+
+    async def call(self, method, params=None):
+        """Send a JSON-RPC call to the best endpoint, falling back down the ranked list."""
+        last = None
+        for ep in self.ranked():
+            try:
+                return await self._post(ep, method, params)
+            except RpcError as e:
+                if e.endpoint is None:
+                    raise
+                ep.record_error()
+                last = e
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                ep.record_error()
+                last = RpcError(f"{type(e).__name__}: {e}", endpoint=ep.url)
+        raise RpcError(f"All RPC endpoints failed for {method}: {last}")
+
+    # ------------------------------------------------------
+    # Health probing
+    # ------------------------------------------------------
+    async def _probe_one(self, ep):
+        try:
+            ep.slot = int(await self._post(ep, "getSlot", [{"commitment": "processed"}]) or 0)
+        except Exception:
+            ep.record_error()
+
+    async def probe(self):
+        """Measure latency and current slot on every endpoint concurrently."""
+        await asyncio.gather(*(self._probe_one(ep) for ep in self.endpoints))
+
+    async def _probe_loop(self):
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            try:
+                await self.probe()
+            except Exception as e:
+                print(f"⚠️ RPC probe failed: {e}")
+
+    def stats(self):
+        return [e.snapshot() for e in self.ranked()]
+
+
+# ==========================================================
+# SHARED POOL
+# ==========================================================
+_pool = None
+
+
+async def get_pool():
+    """Return the process-wide pool, starting it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = RpcPool()
+    await _pool.start()
+    return _pool
+
+
+async def close_pool():
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -1,4 +1,4 @@
-import os, json, base64
+import os, json, base64, asyncio, threading
 from cryptography.fernet import Fernet
 from solana.keypair import Keypair
 from dotenv import load_dotenv
@@ -32,3 +32,86 @@ def load_keypair_secure():
     secret_list = json.loads(decrypted.decode())
     kp = Keypair.from_secret_key(bytes(secret_list))
     return kp
+
+
+# ==========================================================
+# CACHED SIGNER
+# ==========================================================
+LEGACY_KEYFILE = "/root/EchoProPulse/discord_bot/private.json"
+
+
+def load_keypair_plain(path=LEGACY_KEYFILE):
+    """Load an unencrypted JSON secret-key list (legacy private.json layout)."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Keyfile not found at {path}")
+    with open(path, "r") as f:
+        secret = json.load(f)
+    return Keypair.from_secret_key(bytes(secret))
+
+
+class CachedSigner:
+    """
+    Holds the decrypted keypair in memory so the swap path never touches disk or Fernet.
+    Prefers the encrypted SOL_KEYFILE_PATH; falls back to the legacy private.json.
+    """
+
+    def __init__(self, keypair=None):
+        self._kp = keypair
+        self._lock = threading.Lock()
+
+    def load(self):
+        if self._kp is None:
+            with self._lock:
+                if self._kp is None:
+                    if os.getenv("SOL_KEYFILE_PATH") and os.getenv("ENCRYPTION_KEY"):
+                        self._kp = load_keypair_secure()
+                    else:
+                        print("⚠️ SOL_KEYFILE_PATH/ENCRYPTION_KEY not set — using plaintext private.json")
+                        self._kp = load_keypair_plain()
+        return self._kp
+
+    @property
+    def keypair(self):
+        return self.load()
+
+    @property
+    def pubkey(self):
+        kp = self.load()
+        return kp.pubkey() if callable(getattr(kp, "pubkey", None)) else kp.public_key
+
+    def sign(self, tx):
+        """
+        Sign one item in place where possible and return it:
+          - legacy Transaction objects are signed via tx.sign(keypair)
+          - solders (Versioned)Message objects become a signed VersionedTransaction
+          - raw bytes return the detached signature
+        """
+        kp = self.load()
+        if isinstance(tx, (bytes, bytearray)):
+            return kp.sign_message(bytes(tx)) if hasattr(kp, "sign_message") else kp.sign(bytes(tx)).signature
+        if hasattr(tx, "sign"):
+            tx.sign(kp)
+            return tx
+        from solders.transaction import VersionedTransaction
+        return VersionedTransaction(tx, [kp])
+
+    def sign_many(self, transactions):
+        """Sign a whole bundle with the cached key; results keep input order."""
+        self.load()
+        return [self.sign(tx) for tx in transactions]
+
+
+_signer = CachedSigner()
+
+
+def get_signer():
+    """Process-wide signer; call once at startup to pay the decrypt cost up front."""
+    _signer.load()
+    return _signer
+
+
+async def load_signer():
+    """get_signer() for the event loop: the first call decrypts in a worker thread, later ones return the cache."""
+    if _signer._kp is None:
+        await asyncio.to_thread(_signer.load)
+    return _signer
@@ -1,80 +1,248 @@
-import os, asyncio, json, traceback, requests, datetime
-from solders.keypair import Keypair
-from solana.rpc.async_api import AsyncClient
+import os, asyncio, datetime
 from solana.transaction import Transaction
 from solana.rpc.types import TxOpts
 from dotenv import load_dotenv
+from rpc_pool import get_pool
+from signer import load_signer
+from quote_cache import QuoteCache
+from chain_state import get_prefetcher
+from amm_sim import ConstantProductPool, quote_one
+from trade_journal import journal, check_fields, NOTE, SIMULATED, FAILED
+from error_reporter import report_error
+from swap_trace import SwapTrace, tracer as swap_tracer
 
 load_dotenv()
 
 # Discord webhook for error reports
 ERROR_WEBHOOK = "https://discord.com/api/webhooks/1431086202429112342/nZfJ17Jo9fdA7xSIgBgCSVRfKDUgTKMkRt8AcMh1xEM329OgJ1HAYBtJCOsP956IANUF"
-SOLANA_RPC = "https://api.mainnet-beta.solana.com"  # You can swap this for Helius, QuickNode, etc.
+# RPC endpoints (public, Helius, QuickNode, local validator) are set via SOLANA_RPC_URLS — see rpc_pool.py
 SOLANA_WALLET = os.getenv("SOLANA_WALLET")
-PRIVATE_KEY_FILE = "/root/EchoProPulse/discord_bot/private.json"
 
 # ==========================================================
 # LOGGING + ERROR REPORTING
 # ==========================================================
 def log_error_to_discord(err):
-    try:
-        tb = traceback.format_exc()
-        data = {
-            "content": f"⚠️ **EchoProPulse Trading Error:**\n```{err}\n{tb}```"
-        }
-        requests.post(ERROR_WEBHOOK, json=data)
-    except Exception as e:
-        print(f"⚠️ Failed to send trading webhook: {e}")
+    """Fingerprinted, non-blocking error report (repeats roll into digests; see error_reporter.py)."""
+    report_error(err, source="EchoProPulse Trading", webhook=ERROR_WEBHOOK)
+
 
+def log_trade(message, kind=NOTE, **fields):
+    """Queue a trade record for the binary journal (never blocks; see trade_journal.py)."""
+    record_trade(journal, kind, note=message, **fields)
 
-def log_trade(message):
-    """Write trade info to a persistent log file."""
-    log_file = "/root/EchoProPulse/trade_activity.log"
-    with open(log_file, "a") as f:
-        f.write(f"[{datetime.datetime.now():%Y-%m-%d %I:%M:%S %p EST}] {message}\n")
+
+def record_trade(j, kind, **fields):
+    """Best-effort journal write: a record that can't be packed is logged, never raised into the swap path."""
+    try:
+        j.record(kind, **fields)
+    except Exception as e:
+        print(f"⚠️ Trade journal write failed: {e}")
 
 
 # ==========================================================
 # TRADING CORE
 # ==========================================================
-async def execute_swap(token_in: str, token_out: str, amount: float):
+DEFAULT_SWAP_CONCURRENCY = int(os.getenv("SWAP_CONCURRENCY", "16"))
+DEFAULT_SLIPPAGE_BPS = int(os.getenv("SWAP_SLIPPAGE_BPS", "50"))
+
+quote_cache = QuoteCache()
+
+# Simulation-mode pools; unknown pairs get a default constant-product pool
+SIM_POOL_DEPTH = float(os.getenv("SIM_POOL_DEPTH", "1000000"))
+SIM_POOL_FEE_BPS = float(os.getenv("SIM_POOL_FEE_BPS", "30"))
+sim_pools = {}
+
+
+def register_sim_pool(token_in: str, token_out: str, pool):
+    """Install pool state for a pair (and its reverse) used by simulation mode."""
+    sim_pools[(token_in, token_out)] = pool
+    sim_pools[(token_out, token_in)] = pool.reversed()
+    quote_cache.invalidate(token_in, token_out)
+    quote_cache.invalidate(token_out, token_in)
+
+
+def sim_pool_for(token_in: str, token_out: str):
+    pool = sim_pools.get((token_in, token_out))
+    if pool is None:
+        pool = ConstantProductPool(SIM_POOL_DEPTH, SIM_POOL_DEPTH, SIM_POOL_FEE_BPS)
+    return pool
+
+
+async def fetch_quote(token_in: str, token_out: str, amount: float, slippage_bps: int):
     """
-    Executes a real trade on Solana via Jupiter routes.
-    (For safety, this demo uses simulation mode unless LIVE_TRADING=True)
+    Simulated quote from the local AMM model (real Jupiter endpoint would go here).
+    Returns a rate rather than an absolute output so one cached quote
+    can serve every amount in the same bucket.
     """
-    try:
-        client = AsyncClient(SOLANA_RPC)
+    pool = sim_pool_for(token_in, token_out)
+    q = quote_one(pool, amount)
+    return {
+        "rate": q["exec_price"],
+        "fee_rate": pool.fee_bps / 10_000.0,
+        "price_impact_pct": round(q["price_impact"] * 100, 4),
+        "slippage_bps": slippage_bps,
+    }
+
+
+class SwapContext:
+    """Client, signer, chain state and blockhash shared by every leg of a batch."""
+
+    def __init__(self, client, signer, chain=None, journal=journal, offline=False, tracer=swap_tracer):
+        self.client = client
+        self.signer = signer
+        self.chain = chain
+        self.journal = journal
+        self.offline = offline      # replay/backtest: no prints, no Discord error reports
+        self.tracer = tracer        # per-stage timings for /latency (see swap_trace.py)
+        self._blockhash = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def create(cls, trace=None):
+        trace = trace or SwapTrace()
+        # Shared, already-connected pool — no per-trade TCP/TLS handshake
+        with trace.span("rpc_pool"):
+            client = await get_pool()
+        # Keypair is decrypted once (start_trading) and cached in memory (see signer.py)
+        with trace.span("signer"):
+            signer = await load_signer()
+        # Blockhash + priority fees kept warm in the background (see chain_state.py)
+        with trace.span("chain_state"):
+            chain = await get_prefetcher()
+        return cls(client, signer, chain)
+
+    @classmethod
+    def simulation(cls, journal=None, tracer=None):
+        """Network-free context for replays: no RPC, no key, journal/tracer only if given."""
+        return cls(None, None, None, journal=journal, offline=True, tracer=tracer)
+
+    @property
+    def slot(self):
+        return self.chain.slot if self.chain else None
 
-        # Load keypair from local private.json file
-        if not os.path.exists(PRIVATE_KEY_FILE):
-            raise Exception("Missing /discord_bot/private.json for Solana keypair")
+    def priority_fee(self, level="p75"):
+        return self.chain.priority_fee(level) if self.chain else 0
 
-        with open(PRIVATE_KEY_FILE, "r") as f:
-            secret = json.load(f)
-        kp = Keypair.from_secret_key(bytes(secret))
+    async def blockhash(self):
+        """Pin one recent blockhash for the batch; prefetched if fresh, else one RPC call."""
+        async with self._lock:
+            if self._blockhash is None:
+                if self.chain and self.chain.is_fresh():
+                    self._blockhash = self.chain.blockhash
+                else:
+                    res = await self.client.call("getLatestBlockhash", [{"commitment": "confirmed"}])
+                    self._blockhash = res["value"]["blockhash"]
+        return self._blockhash
 
-        # Placeholder Jupiter API call (real endpoint would go here)
+
+async def run_swap(ctx: SwapContext, token_in: str, token_out: str, amount: float,
+                   slippage_bps: int = DEFAULT_SLIPPAGE_BPS, trace: SwapTrace = None):
+    """One swap leg using the shared batch context (see execute_swap/execute_swaps)."""
+    if trace is None:
+        trace = SwapTrace(ctx.tracer)
+    trace.meta.update(token_in=token_in, token_out=token_out, amount=amount, slippage_bps=slippage_bps)
+    try:
+        with trace.span("quote"):
+            quote = await quote_cache.get_or_fetch(
+                token_in, token_out, amount, slippage_bps,
+                lambda: fetch_quote(token_in, token_out, amount, slippage_bps),
+                slot=ctx.slot,
+            )
         route = {
             "in": token_in,
             "out": token_out,
             "amount": amount,
-            "expected_out": amount * 0.99,
-            "price_impact": "0.3%",
+            "expected_out": amount * quote["rate"],
+            "price_impact": f"{quote['price_impact_pct']}%",
+            "fee": amount * quote.get("fee_rate", 0.0),
         }
 
         # Simulate trade
-        print(f"🔄 Simulating trade: {route}")
-        log_trade(f"Simulated swap {amount} {token_in} → {token_out}")
+        if not ctx.offline:
+            print(f"🔄 Simulating trade: {route}")
 
         # Send fake transaction placeholder
-        tx = Transaction()
-        tx_sig = "FAKE-TX-" + datetime.datetime.now().strftime("%H%M%S")
-        print(f"✅ Trade simulated: {tx_sig}")
+        with trace.span("build"):
+            tx = Transaction()
+            # tx.recent_blockhash = await ctx.blockhash(); tx = ctx.signer.sign(tx)
+            # once the real route instructions are added, each in its own
+            # trace.span("sign") / ("send") / ("confirm")
+            tx_sig = "FAKE-TX-" + datetime.datetime.now().strftime("%H%M%S%f")
+        if not ctx.offline:
+            print(f"✅ Trade simulated: {tx_sig}")
+        if ctx.journal is not None:
+            with trace.span("journal"):
+                record_trade(
+                    ctx.journal, SIMULATED, note=f"Simulated swap {amount} {token_in} → {token_out}",
+                    token_in=token_in, token_out=token_out, amount_in=amount,
+                    amount_out=route["expected_out"], price_impact=quote["price_impact_pct"] / 100,
+                    fee=route["fee"], priority_fee=ctx.priority_fee(), tx=tx_sig,
+                )
+        trace.finish("success")
 
-        await client.close()
         return {"status": "success", "tx": tx_sig, "route": route}
 
     except Exception as e:
+        trace.finish("error")
+        if not ctx.offline:
+            log_error_to_discord(e)
+        if ctx.journal is not None:
+            record_trade(ctx.journal, FAILED, note=f"❌ Trade failed: {e}",
+                         token_in=token_in, token_out=token_out, amount_in=amount)
+        return {"status": "error", "error": str(e)}
+
+
+async def start_trading():
+    """Trading startup: connect the RPC pool, decrypt the key off-loop and warm chain state."""
+    await get_pool()
+    await load_signer()
+    await get_prefetcher(wait=True)
+    print("🔑 Trading context warm (RPC pool, signer, chain state)")
+
+
+async def execute_swap(token_in: str, token_out: str, amount: float):
+    """
+    Executes a real trade on Solana via Jupiter routes.
+    (For safety, this demo uses simulation mode unless LIVE_TRADING=True)
+    """
+    trace = SwapTrace(swap_tracer, token_in=token_in, token_out=token_out, amount=amount)
+    try:
+        ctx = await SwapContext.create(trace)
+    except Exception as e:
+        trace.finish("error")
         log_error_to_discord(e)
-        log_trade(f"❌ Trade failed: {e}")
+        log_trade(f"❌ Trade failed: {e}", FAILED, token_in=token_in, token_out=token_out, amount_in=amount)
         return {"status": "error", "error": str(e)}
+    return await run_swap(ctx, token_in, token_out, amount, trace=trace)
+
+
+async def execute_swaps(swaps, concurrency: int = DEFAULT_SWAP_CONCURRENCY):
+    """
+    Run many swaps at once, at most `concurrency` in flight.
+    `swaps` is a list of (token_in, token_out, amount) tuples or dicts with those keys.
+    Returns one result per swap in input order; a failing leg yields an error result
+    instead of aborting the batch.
+    """
+    swaps = list(swaps)
+    try:
+        ctx = await SwapContext.create()
+    except Exception as e:
+        log_error_to_discord(e)
+        log_trade(f"❌ Batch of {len(swaps)} swaps failed: {e}", FAILED)
+        return [{"status": "error", "error": str(e)} for _ in swaps]
+
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_leg(leg):
+        try:
+            if isinstance(leg, dict):
+                token_in, token_out, amount = leg["token_in"], leg["token_out"], leg["amount"]
+            else:
+                token_in, token_out, amount = leg
+            check_fields(token_in, token_out)   # reject before any RPC work, not in the journal write
+        except Exception as e:
+            return {"status": "error", "error": f"Invalid swap spec {leg!r}: {e}"}
+        async with sem:
+            return await run_swap(ctx, token_in, token_out, amount)
+
+    return await asyncio.gather(*(run_leg(leg) for leg in swaps))
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🛡️ EchoProPulse Supervisor
+# One resident daemon in place of watchdog.py, watchdog.sh,
+# discord_bot/watchdog.sh, token_watchdog.py (cron) and
+# vps_health_ping.sh (cron). Jobs share one interpreter, one
+# aiohttp session and one notifier:
+#
+#   heartbeat      event-driven liveness (socket + inotify)
+#   service_state  systemctl is-active, restart if down
+#   token          Discord token validity
+#   disk           usage alert + cleanup_echo.sh
+#   compact        fold rotated trade journal segments into trade_history
+#   daily_summary  all-systems report at a fixed NY time
+#
+# Restart-cooldown history and job bookkeeping persist in
+# STATE_FILE, so restarting the supervisor doesn't reset them.
+# Settings come from CONFIG_FILE (JSON; defaults below).
+#
+#   ExecStart=/root/EchoProPulse/venv/bin/python3 /root/EchoProPulse/supervisor.py
+# ==========================================================
+import os
+import json
+import time
+import shutil
+import signal
+import socket
+import asyncio
+import aiohttp
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path="/root/EchoProPulse/discord_bot/.env")
+
+from notify_dispatcher import get_dispatcher
+from notify_relay import resolve
+from error_reporter import report_error
+from liveness import LivenessMonitor, HEARTBEAT_FILE, read_heartbeat
+
+CONFIG_FILE = os.getenv("SUPERVISOR_CONFIG", "/root/EchoProPulse/discord_bot/supervisor.json")
+STATE_FILE = os.getenv("SUPERVISOR_STATE", "/root/EchoProPulse/discord_bot/supervisor_state.json")
+LOG_FILE = "/root/EchoProPulse/discord_bot/watchdog.log"
+BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
+TZ_NY = ZoneInfo("America/New_York")
+API_BASE = os.getenv("DISCORD_API_BASE", "https://discord.com/api/v10")
+
+DEFAULT_CONFIG = {
+    "service": "echopropulse.service",
+    "liveness_timeout": 15,
+    "startup_grace": 60,
+    "restart_limit": 3,
+    "restart_window_hours": 6,
+    "intervals": {"service_state": 60, "token": 900, "disk": 300, "compact": 600},
+    "disk_alert_pct": int(os.getenv("DISK_ALERT_THRESHOLD", "85")),
+    "cleanup_script": "/root/EchoProPulse/discord_bot/cleanup_echo.sh",
+    "cleanup_min_interval": 3600,
+    "daily_summary_at": "08:00",
+    "channels": {"alerts": "logs", "daily": "vps"},
+}
+
+
+def load_config(path=CONFIG_FILE):
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            user = json.load(f)
+        for key, value in user.items():
+            if isinstance(value, dict) and isinstance(config.get(key), dict):
+                config[key].update(value)
+            else:
+                config[key] = value
+    return config
+
+
+def human(bytes_):
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if bytes_ < 1024:
+            return f"{bytes_:.1f}{unit}"
+        bytes_ /= 1024
+    return f"{bytes_:.1f}PB"
+
+
+def read_disk():
+    total, used, _ = shutil.disk_usage("/")
+    pct = int(used * 100 / total) if total else 0
+    return f"{human(used)}/{human(total)} ({pct}%)", pct
+
+
+def read_memory():
+    info = {}
+    with open("/proc/meminfo") as f:
+        for line in f:
+            key, value = line.split(":", 1)
+            info[key] = int(value.split()[0]) * 1024
+    used = info["MemTotal"] - info.get("MemAvailable", info.get("MemFree", 0))
+    return f"{human(used)}/{human(info['MemTotal'])}"
+
+
+def read_uptime():
+    with open("/proc/uptime") as f:
+        seconds = int(float(f.read().split()[0]))
+    return str(timedelta(seconds=seconds))
+
+
+class Supervisor:
+    def __init__(self, config=None, state_path=STATE_FILE):
+        self.config = config or load_config()
+        self.state_path = state_path
+        self.state = self._load_state()
+        self.dispatcher = get_dispatcher(BOT_TOKEN)
+        self.session = None
+        self.token_ok = None
+
+    # ------------------------------------------------------
+    # State / logging / notify
+    # ------------------------------------------------------
+    def _load_state(self):
+        try:
+            with open(self.state_path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault("restarts", [])
+        state.setdefault("last_cleanup", 0)
+        state.setdefault("last_daily", None)
+        return state
+
+    def save_state(self):
+        tmp = f"{self.state_path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.state_path)
+
+    def log(self, message):
+        line = f"[{datetime.now(TZ_NY):%Y-%m-%d %H:%M:%S}] [supervisor] {message}"
+        print(line)
+        try:
+            with open(LOG_FILE, "a") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
+
+    def notify(self, message, channel="alerts"):
+        channel = self.config["channels"].get(channel, channel)
+        try:
+            target, payload = resolve({"channel": channel, "content": message})
+            self.dispatcher.submit(target, payload)
+        except ValueError as e:
+            self.log(f"⚠️ Notify skipped: {e}")
+
+    # ------------------------------------------------------
+    # Service control (shared cooldown)
+    # ------------------------------------------------------
+    async def _systemctl(self, *args):
+        proc = await asyncio.create_subprocess_exec(
+            "systemctl", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        out, err = await proc.communicate()
+        return proc.returncode, out.decode().strip(), err.decode().strip()
+
+    async def service_state(self):
+        try:
+            _, out, _ = await self._systemctl("is-active", self.config["service"])
+            return out or "unknown"
+        except OSError:
+            return "unknown"
+
+    async def restart_service(self, reason):
+        now = time.time()
+        window = self.config["restart_window_hours"] * 3600
+        self.state["restarts"] = [t for t in self.state["restarts"] if now - t < window]
+        if len(self.state["restarts"]) >= self.config["restart_limit"]:
+            self.log(f"🚫 Cooldown active: restart skipped ({reason}).")
+            # No restarts happen during a cooldown, so one notified after the latest
+            # restart was for this cooldown: alert once, until the oldest ages out
+            if self.state.get("cooldown_notified_at", 0) < max(self.state["restarts"]):
+                resume = datetime.fromtimestamp(min(self.state["restarts"]) + window, TZ_NY)
+                self.notify(f"🚫 Cooldown active: {len(self.state['restarts'])} restarts within "
+                            f"{self.config['restart_window_hours']}h. Restarts paused until "
+                            f"{resume:%I:%M %p %Z} ({reason}).")
+                self.state["cooldown_notified_at"] = now
+            self.save_state()
+            return False
+        self.log(f"🔁 Restarting {self.config['service']}: {reason}")
+        try:
+            code, _, err = await self._systemctl("restart", self.config["service"])
+        except OSError as e:
+            code, err = -1, str(e)
+        self.state["restarts"].append(now)   # failed attempts count too, so a broken unit can't spam
+        if code == 0:
+            self.notify(f"🔁 **Auto-Restart Triggered** — Reason: {reason}")
+        else:
+            self.notify(f"❌ **Restart Failed** (code {code}): {err}")
+        self.save_state()
+        return code == 0
+
+    # ------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------
+    async def on_stale(self, age):
+        if not os.path.exists(HEARTBEAT_FILE):
+            reason = "heartbeat file missing"
+        else:
+            reason = f"no heartbeat for {age:.0f}s"
+        await self.restart_service(reason)
+
+    async def check_service(self):
+        state = await self.service_state()
+        if state not in ("active", "activating", "reloading"):
+            await self.restart_service(f"service state {state}")
+
+    async def check_token(self):
+        try:
+            async with self.session.get(f"{API_BASE}/users/@me", headers={"Authorization": f"Bot {BOT_TOKEN}"}) as r:
+                status = r.status
+                data = await r.json() if status == 200 else {}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.log(f"⚠️ Token check error: {e}")
+            return
+        ok = status == 200
+        if ok and self.token_ok is not True:
+            self.notify(f"🟢 Token OK • Connected as **{data.get('username')}** at {datetime.now(TZ_NY):%I:%M %p %Z}", "daily")
+        if status in (401, 403):
+            self.notify(f"🚨 Discord token rejected ({status}).")
+            await self.restart_service(f"invalid token ({status})")
+        self.token_ok = ok
+
+    async def check_disk(self):
+        before, pct = read_disk()
+        if pct < self.config["disk_alert_pct"]:
+            return
+        if time.time() - self.state["last_cleanup"] < self.config["cleanup_min_interval"]:
+            return
+        script = self.config["cleanup_script"]
+        self.notify(f"🚨 Disk at **{pct}%**, initiating auto-clean via {os.path.basename(script)}…")
+        self.state["last_cleanup"] = time.time()
+        self.save_state()
+        if os.path.exists(script):
+            proc = await asyncio.create_subprocess_exec("bash", script)
+            await proc.wait()
+        after, after_pct = read_disk()
+        self.notify(f"🧹 **Auto-Clean Complete**\nBefore: `{before}`\nAfter: `{after}`\n"
+                    f"Freed: ~{max(0, pct - after_pct)}%")
+
+    async def compact_trades(self):
+        # pandas/pyarrow load on the first run, in the worker thread
+        def compact():
+            from trade_history import history
+            return history.compact()
+        added = await asyncio.to_thread(compact)
+        if added:
+            self.log(f"📚 Compacted {added} trades into trade history")
+
+    async def daily_summary(self):
+        now = datetime.now(TZ_NY)
+        load1, load5, load15 = os.getloadavg()
+        disk, _ = read_disk()
+        hb = read_heartbeat() or {}
+        loop = hb.get("loop", {})
+        try:
+            ip = socket.gethostbyname(socket.gethostname())
+        except OSError:
+            ip = "unknown"
+        self.notify(
+            f"🟢 **All Systems Green — Daily Status**\n"
+            f"📅 {now:%A, %B %d, %Y} • 🕗 {now:%I:%M %p %Z}\n"
+            f"💻 Host: {socket.gethostname()} ({ip}) • 🕐 Uptime: {read_uptime()}\n"
+            f"📊 Load: `{load1:.2f} {load5:.2f} {load15:.2f}`\n"
+            f"💾 Memory: `{read_memory()}` • 💽 Disk: `{disk}`\n"
+            f"🤖 Service: `{await self.service_state()}` • "
+            f"{'✅ Token verified' if self.token_ok else '⚠️ Token unverified'}\n"
+            f"🩺 Loop: {loop.get('state', 'n/a')} (lag p99 {loop.get('lag_p99_ms', 'n/a')} ms)\n"
+            f"🔁 Restarts (window): {len(self.state['restarts'])}",
+            "daily",
+        )
+        self.state["last_daily"] = now.date().isoformat()
+        self.save_state()
+
+    # ------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------
+    async def every(self, name, interval, job):
+        while True:
+            try:
+                await job()
+            except Exception as e:
+                self.log(f"⚠️ Job {name} failed: {e}")
+                report_error(e, source=f"Supervisor/{name}")
+            await asyncio.sleep(interval)
+
+    async def daily(self):
+        hour, minute = map(int, self.config["daily_summary_at"].split(":"))
+        while True:
+            now = datetime.now(TZ_NY)
+            due = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if due <= now and self.state["last_daily"] == now.date().isoformat():
+                due += timedelta(days=1)
+            if due > now:
+                await asyncio.sleep((due - now).total_seconds())
+            try:
+                await self.daily_summary()
+            except Exception as e:
+                self.log(f"⚠️ Daily summary failed: {e}")
+                report_error(e, source="Supervisor/daily_summary")
+                await asyncio.sleep(300)
+
+    async def run(self):
+        self.dispatcher.start()
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        monitor = LivenessMonitor(self.on_stale, timeout=self.config["liveness_timeout"],
+                                  grace=self.config["startup_grace"])
+        intervals = self.config["intervals"]
+        jobs = [
+            asyncio.create_task(monitor.run(), name="heartbeat"),
+            asyncio.create_task(self.every("service_state", intervals["service_state"], self.check_service)),
+            asyncio.create_task(self.every("token", intervals["token"], self.check_token)),
+            asyncio.create_task(self.every("disk", intervals["disk"], self.check_disk)),
+            asyncio.create_task(self.every("compact", intervals["compact"], self.compact_trades)),
+            asyncio.create_task(self.daily(), name="daily_summary"),
+        ]
+        self.log("🐾 Supervisor started.")
+        self.notify("🧩 **EchoProPulse Supervisor** started (heartbeat, service, token, disk, compact, daily).")
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        await stop.wait()
+
+        self.log("👋 Supervisor stopping.")
+        for job in jobs:
+            job.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+        await self.session.close()
+        self.save_state()
+        await asyncio.to_thread(self.dispatcher.flush)
+
+
+if __name__ == "__main__":
+    asyncio.run(Supervisor().run())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 🧭 EchoProPulse Swap Tracing
+# Span-style timing around each stage of the swap pipeline.
+# A SwapTrace collects stage durations for one swap; finished
+# traces land in a fixed-size numpy ring buffer (one column per
+# stage) that /latency reads for p50/p90/p99, and each span is
+# also observed into the swap_stage_seconds histogram.
+# The trading process flushes the buffer to SWAP_TRACE_EXPORT
+# every SWAP_TRACE_FLUSH_INTERVAL seconds (off-loop), which is
+# what the bot's /latency reads and bench/bench_swap_trace.py
+# replays.
+# ==========================================================
+import os
+import atexit
+import json
+import time
+import threading
+from contextlib import contextmanager
+import numpy as np
+
+from metrics import SWAP_STAGE_SECONDS
+
+TRACE_CAPACITY = int(os.getenv("SWAP_TRACE_CAPACITY", "2048"))
+TRACE_EXPORT = os.getenv("SWAP_TRACE_EXPORT", "/root/EchoProPulse/discord_bot/swap_traces.jsonl")
+TRACE_FLUSH_INTERVAL = float(os.getenv("SWAP_TRACE_FLUSH_INTERVAL", "30"))
+
+# Pipeline order. Context stages are traced by execute_swap only (a batch pays
+# them once for every leg); sign/send/confirm stay empty in simulation mode.
+STAGES = ("rpc_pool", "signer", "chain_state", "quote", "build", "sign", "send", "confirm", "journal", "total")
+QUANTILES = (50, 90, 99)
+
+_STATUS = {"success": 0, "error": 1}
+
+
+class SwapTrace:
+    """Stage durations (seconds) for one swap; use `with trace.span("quote"):`."""
+
+    __slots__ = ("tracer", "spans", "meta", "t0")
+
+    def __init__(self, tracer=None, **meta):
+        self.tracer = tracer
+        self.spans = {}
+        self.meta = meta
+        self.t0 = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[stage] = self.spans.get(stage, 0.0) + time.perf_counter() - t
+
+    def finish(self, status="success"):
+        """Close the trace: 'total' is wall time since the trace was created."""
+        self.spans["total"] = time.perf_counter() - self.t0
+        if self.tracer is not None:
+            self.tracer.record(self, status)
+        return self.spans
+
+
+class Tracer:
+    """Ring buffer of finished traces; `export_path=None` keeps it purely in memory."""
+
+    def __init__(self, capacity=TRACE_CAPACITY, export_path=TRACE_EXPORT, flush_interval=TRACE_FLUSH_INTERVAL):
+        self.capacity = capacity
+        self.export_path = export_path
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._flushing = False
+        self.ts = np.zeros(capacity, dtype=np.float64)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.values = np.full((capacity, len(STAGES)), np.nan, dtype=np.float64)
+        self.meta = [None] * capacity
+        self.count = 0
+        self._col = {s: i for i, s in enumerate(STAGES)}
+        self._lock = threading.Lock()
+
+    def trace(self, **meta):
+        return SwapTrace(self, **meta)
+
+    def record(self, trace, status="success"):
+        row = np.full(len(STAGES), np.nan)
+        for stage, seconds in trace.spans.items():
+            col = self._col.get(stage)
+            if col is not None:
+                row[col] = seconds
+            SWAP_STAGE_SECONDS.observe(seconds, stage)
+        with self._lock:
+            i = self.count % self.capacity
+            self.ts[i] = time.time()
+            self.status[i] = _STATUS.get(status, 1)
+            self.values[i] = row
+            self.meta[i] = trace.meta
+            self.count += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if not self.export_path or self._flushing or time.monotonic() - self._last_flush < self.flush_interval:
+            return
+        self._flushing = True
+        self._last_flush = time.monotonic()
+        threading.Thread(target=self._flush, name="swap-trace-flush", daemon=True).start()
+
+    def _flush(self):
+        try:
+            self.export_jsonl(self.export_path)
+        except OSError as e:
+            print(f"⚠️ Swap trace export failed: {e}")
+        finally:
+            self._flushing = False
+
+    def _recent(self, last=None):
+        with self._lock:
+            n = min(self.count, self.capacity, last or self.capacity)
+            idx = (np.arange(self.count - n, self.count)) % self.capacity
+            return (self.ts[idx].copy(), self.status[idx].copy(), self.values[idx].copy(),
+                    [self.meta[i] for i in idx])
+
+    def percentiles(self, last=None, quantiles=QUANTILES):
+        """{stage: {"n": samples, "p50": ms, ...}} over the last `last` traces; empty stages omitted."""
+        _, _, values, _ = self._recent(last)
+        out = {}
+        for stage, col in self._col.items():
+            column = values[:, col]
+            column = column[~np.isnan(column)]
+            if not len(column):
+                continue
+            stats = {"n": len(column)}
+            for q, v in zip(quantiles, np.percentile(column, quantiles)):
+                stats[f"p{q}"] = float(v) * 1000
+            out[stage] = stats
+        return out
+
+    def export_jsonl(self, path=TRACE_EXPORT, last=None):
+        """Write traces oldest→newest as JSON lines (atomic replace); returns the number written."""
+        ts, status, values, meta = self._recent(last)
+        names = {v: k for k, v in _STATUS.items()}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            for t, st, row, m in zip(ts, status, values, meta):
+                spans = {stage: round(float(v), 6) for stage, v in zip(STAGES, row) if not np.isnan(v)}
+                f.write(json.dumps({"ts": float(t), "status": names.get(int(st), "error"),
+                                    "spans": spans, **(m or {})}) + "\n")
+        os.replace(tmp, path)
+        return len(ts)
+
+    @classmethod
+    def from_records(cls, records, capacity=TRACE_CAPACITY):
+        """In-memory tracer rebuilt from export_jsonl() records (see load_jsonl)."""
+        self = cls(capacity=max(capacity, len(records)), export_path=None)
+        for rec in records:
+            i = self.count % self.capacity
+            self.ts[i] = rec.get("ts", 0.0)
+            self.status[i] = _STATUS.get(rec.get("status"), 1)
+            for stage, seconds in rec.get("spans", {}).items():
+                if stage in self._col:
+                    self.values[i, self._col[stage]] = seconds
+            self.meta[i] = {k: v for k, v in rec.items() if k not in ("ts", "status", "spans")}
+            self.count += 1
+        return self
+
+
+def format_percentiles(stats):
+    """Fixed-width table: stage, n, p50 / p90 / p99 in ms."""
+    lines = [f"{'stage':<12} {'n':>5} {'p50':>9} {'p90':>9} {'p99':>9}"]
+    for stage in STAGES:
+        if stage not in stats:
+            continue
+        s = stats[stage]
+        lines.append(f"{stage:<12} {s['n']:>5} {s['p50']:>7.2f}ms {s['p90']:>7.2f}ms {s['p99']:>7.2f}ms")
+    return "\n".join(lines)
+
+
+def load_jsonl(path):
+    """Read an export back: list of dicts with ts, status, spans and swap fields."""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def recent_tracer(path=TRACE_EXPORT):
+    """This process's tracer if it has traced swaps, else the trading process's last export."""
+    if tracer.count or not os.path.exists(path):
+        return tracer
+    return Tracer.from_records(load_jsonl(path))
+
+
+tracer = Tracer()
+
+
+@atexit.register
+def _flush_at_exit():
+    if tracer.count and tracer.export_path:
+        tracer._flush()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 📚 EchoProPulse Trade History
+# Columnar, memory-mapped trade store built from the binary
+# trade journal. Day partitions are Arrow IPC (Feather) files
+# with a UTC time index; window queries only map the days
+# they touch and aggregate with vectorized pandas.
+#
+#   python3 trade_history.py compact
+#   python3 trade_history.py pnl 7
+# ==========================================================
+import os
+import json
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+from datetime import datetime, timedelta, timezone
+
+import trade_journal
+from trade_journal import HEADER, RECORD, MAGIC, NOTE, FAILED
+
+HISTORY_DIR = os.getenv("TRADE_HISTORY_DIR", "/root/EchoProPulse/trade_history")
+MANIFEST = "manifest.json"
+
+
+# Mirrors trade_journal.RECORD ("<qB44s44sddddQ88s96s", no padding)
+JOURNAL_DTYPE = np.dtype([
+    ("ts_ns", "<i8"), ("kind", "u1"), ("token_in", "S44"), ("token_out", "S44"),
+    ("amount_in", "<f8"), ("amount_out", "<f8"), ("price_impact", "<f8"), ("fee", "<f8"),
+    ("priority_fee", "<u8"), ("tx", "S88"), ("note", "S96"),
+])
+assert JOURNAL_DTYPE.itemsize == RECORD.size
+
+# Records are stamped before they're queued, so a segment is only roughly time-ordered
+SPAN_SLACK_NS = 1_000_000_000
+
+COLUMNS = ["kind", "token_in", "token_out", "amount_in", "amount_out",
+           "price_impact", "fee", "priority_fee", "tx"]
+
+
+# ==========================================================
+# JOURNAL → DATAFRAME
+# ==========================================================
+def _map_segment(path):
+    """Memory-map a journal segment as a structured array (None when it holds no records)."""
+    size = os.path.getsize(path)
+    if size < HEADER.size:
+        return None
+    with open(path, "rb") as f:
+        magic, _, rec_size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or rec_size != RECORD.size:
+        raise ValueError(f"{path} is not a trade journal segment")
+    count = (size - HEADER.size) // RECORD.size
+    if count <= 0:
+        return None
+    return np.memmap(path, dtype=JOURNAL_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def segment_span(path):
+    """(first, last) record timestamps in ns, or None for an empty segment."""
+    arr = _map_segment(path)
+    if arr is None:
+        return None
+    return int(arr["ts_ns"][0]), int(arr["ts_ns"][-1])
+
+
+def journal_frame(path):
+    """Memory-map one journal segment into a DataFrame (notes dropped, tokens decoded)."""
+    arr = _map_segment(path)
+    if arr is None:
+        return pd.DataFrame(columns=COLUMNS)
+    arr = arr[arr["kind"] != NOTE]
+    df = pd.DataFrame({
+        "kind": arr["kind"],
+        "token_in": pd.Series(arr["token_in"]).str.decode("utf-8").astype("category"),
+        "token_out": pd.Series(arr["token_out"]).str.decode("utf-8").astype("category"),
+        "amount_in": arr["amount_in"],
+        "amount_out": arr["amount_out"],
+        "price_impact": arr["price_impact"],
+        "fee": arr["fee"],
+        "priority_fee": arr["priority_fee"],
+        "tx": pd.Series(arr["tx"]).str.decode("utf-8"),
+    })
+    df.index = pd.to_datetime(arr["ts_ns"], unit="ns", utc=True)
+    df.index.name = "ts"
+    return df
+
+
+def _utc(ts):
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def _read_partition(path):
+    return feather.read_table(path, memory_map=True).to_pandas().set_index("ts")
+
+
+# ==========================================================
+# STORE
+# ==========================================================
+class TradeHistory:
+    """Day-partitioned Arrow store with a manifest of journal segments already ingested."""
+
+    def __init__(self, directory=HISTORY_DIR, journal_dir=trade_journal.JOURNAL_DIR):
+        self.directory = directory
+        self.journal_dir = journal_dir
+
+    def _partition_path(self, day):
+        return os.path.join(self.directory, f"trades-{day:%Y-%m-%d}.arrow")
+
+    def _manifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+        return {"ingested": [], "pending": []}
+
+    def _save_manifest(self, manifest):
+        path = os.path.join(self.directory, MANIFEST)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, path)
+
+    def _stage_day(self, day, frame):
+        """Write `day`'s merged partition next to it as .tmp; _finish_pending() moves it into place."""
+        path = self._partition_path(day)
+        if os.path.exists(path):
+            frame = pd.concat([_read_partition(path), frame])
+        frame = frame.sort_index()
+        for col in ("token_in", "token_out"):
+            frame[col] = frame[col].astype(str).astype("category")
+        frame.reset_index().to_feather(path + ".tmp", compression="uncompressed")
+        return os.path.basename(path)
+
+    def _finish_pending(self, manifest):
+        """Rename the staged partitions the manifest committed to (redoes a compact() that crashed)."""
+        if not manifest.get("pending"):
+            return manifest
+        for name in manifest["pending"]:
+            path = os.path.join(self.directory, name)
+            if os.path.exists(path + ".tmp"):
+                os.replace(path + ".tmp", path)
+        manifest["pending"] = []
+        self._save_manifest(manifest)
+        return manifest
+
+    def _read_day(self, path, pending):
+        # Committed but not yet renamed: the staged file already holds the segment's rows
+        if os.path.basename(path) in pending:
+            try:
+                return _read_partition(path + ".tmp")
+            except FileNotFoundError:
+                pass
+        return _read_partition(path) if os.path.exists(path) else None
+
+    def compact(self):
+        """
+        Fold every rotated (closed) journal segment not yet ingested into day partitions.
+        A segment's partitions are staged first, then one manifest write records the
+        segment together with them, so a crash never ingests a segment twice.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self._finish_pending(self._manifest())
+        done = set(manifest["ingested"])
+        added = 0
+        for path in trade_journal.segments(self.journal_dir):
+            name = os.path.basename(path)
+            if name == trade_journal.ACTIVE_NAME or name in done:
+                continue
+            df = journal_frame(path)
+            staged = [self._stage_day(day, part) for day, part in df.groupby(df.index.floor("D"))]
+            added += len(df)
+            manifest["ingested"].append(name)
+            manifest["pending"] = staged
+            self._save_manifest(manifest)
+            manifest = self._finish_pending(manifest)
+        return added
+
+    def load(self, start=None, end=None, include_active=True):
+        """Trades in [start, end) as a time-indexed DataFrame, mapping only the days touched."""
+        end = _utc(end or datetime.now(timezone.utc))
+        start = _utc(start or end - timedelta(days=7))
+        manifest = self._manifest()
+        pending = set(manifest.get("pending", []))
+        frames = []
+        day = start.floor("D")
+        while day < end:
+            frame = self._read_day(self._partition_path(day), pending)
+            if frame is not None:
+                frames.append(frame)
+            day += pd.Timedelta(days=1)
+        if include_active:
+            # Journal segments not compacted yet (the active file and any fresh rotations),
+            # skipping any whose records all fall outside the window
+            done = set(manifest["ingested"])
+            lo, hi = start.value - SPAN_SLACK_NS, end.value + SPAN_SLACK_NS
+            for path in trade_journal.segments(self.journal_dir):
+                if os.path.basename(path) in done:
+                    continue
+                span = segment_span(path)
+                if span is None or span[1] < lo or span[0] >= hi:
+                    continue
+                frames.append(journal_frame(path))
+        frames = [f for f in frames if len(f)]
+        if not frames:
+            return pd.DataFrame(columns=COLUMNS, index=pd.DatetimeIndex([], tz="UTC", name="ts"))
+        df = pd.concat(frames).sort_index()
+        return df.loc[start:end - pd.Timedelta(1, "ns")]
+
+    def pnl_by_token(self, start=None, end=None, prices=None):
+        """
+        Per-token volume, fees and P&L over a window. P&L is the net token flow
+        (received − spent) in token units; pass `prices` {token: price} to also value it.
+        Failed trades count towards `failed` only.
+        """
+        df = self.load(start, end)
+        ok = df[df["kind"] != FAILED]
+        spent = ok.groupby("token_in", observed=True)["amount_in"].sum()
+        received = ok.groupby("token_out", observed=True)["amount_out"].sum()
+        fees = ok.groupby("token_in", observed=True)["fee"].sum()
+        trades = ok.groupby("token_in", observed=True).size()
+        failed = df[df["kind"] == FAILED].groupby("token_in", observed=True).size()
+
+        out = pd.DataFrame({"spent": spent, "received": received, "fees": fees,
+                            "trades": trades, "failed": failed}).fillna(0)
+        out.index = out.index.astype(str)
+        out.index.name = "token"
+        out["volume"] = out["spent"] + out["received"]
+        out["pnl"] = out["received"] - out["spent"]
+        if prices:
+            px = pd.Series(prices, dtype="float64").reindex(out.index)
+            out["pnl_value"] = out["pnl"] * px
+            out["fees_value"] = out["fees"] * px
+        return out.sort_values("volume", ascending=False)
+
+
+history = TradeHistory()
+
+
+def format_pnl(table, days):
+    """Render a pnl_by_token table as a Discord-friendly code block."""
+    if table.empty:
+        return f"No trades in the last {days} day(s)."
+    lines = [f"{'TOKEN':<10} {'VOLUME':>14} {'FEES':>10} {'P&L':>14} {'N':>6}"]
+    for token, row in table.head(20).iterrows():
+        lines.append(f"{token[:10]:<10} {row['volume']:>14,.4f} {row['fees']:>10,.4f} "
+                     f"{row['pnl']:>+14,.4f} {int(row['trades']):>6}")
+    return "```\n" + "\n".join(lines) + "\n```"
+
+
+if __name__ == "__main__":
+    import sys
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "pnl"
+    if cmd == "compact":
+        print(f"📚 Compacted {history.compact()} trades into {HISTORY_DIR}")
+    else:
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+        end = datetime.now(timezone.utc)
+        print(history.pnl_by_token(end - timedelta(days=days), end).to_string())
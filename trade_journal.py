@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# ==========================================================
+# 📒 EchoProPulse Trade Journal
+# Append-only binary journal of fixed-size trade records with
+# UTC timestamps. Writers only enqueue; a background thread
+# batches records to disk, flushing by size or time, rotating
+# segments by size and fsyncing on shutdown.
+# ==========================================================
+import os
+import time
+import queue
+import atexit
+import struct
+import threading
+from datetime import datetime, timezone
+
+JOURNAL_DIR = os.getenv("TRADE_JOURNAL_DIR", "/root/EchoProPulse/trade_journal")
+ACTIVE_NAME = "trades.bin"
+FLUSH_BYTES = int(os.getenv("TRADE_JOURNAL_FLUSH_BYTES", str(64 * 1024)))
+FLUSH_INTERVAL = float(os.getenv("TRADE_JOURNAL_FLUSH_INTERVAL", "1.0"))
+ROTATE_BYTES = int(os.getenv("TRADE_JOURNAL_ROTATE_BYTES", str(64 * 1024 * 1024)))
+
+MAGIC = b"EPTJ"
+VERSION = 1
+
+# Record kinds
+NOTE, SIMULATED, LIVE, FAILED = 0, 1, 2, 3
+KIND_NAMES = {NOTE: "note", SIMULATED: "simulated", LIVE: "live", FAILED: "failed"}
+
+# ts_ns, kind, token_in, token_out, amount_in, amount_out, price_impact, fee, priority_fee, tx, note
+# Mints are 32-44 base58 chars, signatures up to 88.
+TOKEN_BYTES, TX_BYTES, NOTE_BYTES = 44, 88, 96
+RECORD = struct.Struct(f"<qB{TOKEN_BYTES}s{TOKEN_BYTES}sddddQ{TX_BYTES}s{NOTE_BYTES}s")
+HEADER = struct.Struct("<4sHH")  # magic, version, record size
+FIELDS = ("ts_ns", "kind", "token_in", "token_out", "amount_in", "amount_out",
+          "price_impact", "fee", "priority_fee", "tx", "note")
+
+
+def _enc(text, size, field, clip=False):
+    """UTF-8 bytes for a fixed-width field. Identifiers that don't fit are rejected, never cut."""
+    data = (text or "").encode("utf-8")
+    if len(data) > size:
+        if not clip:
+            raise ValueError(f"{field} is {len(data)} bytes, the journal field holds {size}: {text!r}")
+        data = data[:size].decode("utf-8", "ignore").encode("utf-8")   # free text: cut on a char boundary
+    return data
+
+
+def check_fields(token_in="", token_out="", tx=""):
+    """Raise ValueError now for identifiers pack() would reject, before any work is done for them."""
+    _enc(token_in, TOKEN_BYTES, "token_in")
+    _enc(token_out, TOKEN_BYTES, "token_out")
+    _enc(tx, TX_BYTES, "tx")
+
+
+def pack(kind, token_in="", token_out="", amount_in=0.0, amount_out=0.0, price_impact=0.0,
+         fee=0.0, priority_fee=0, tx="", note="", ts_ns=None):
+    return RECORD.pack(
+        time.time_ns() if ts_ns is None else ts_ns, kind,
+        _enc(token_in, TOKEN_BYTES, "token_in"), _enc(token_out, TOKEN_BYTES, "token_out"),
+        float(amount_in), float(amount_out), float(price_impact), float(fee), int(priority_fee),
+        _enc(tx, TX_BYTES, "tx"), _enc(note, NOTE_BYTES, "note", clip=True),
+    )
+
+
+def unpack(buf, offset=0):
+    values = list(RECORD.unpack_from(buf, offset))
+    for i in (2, 3, 9, 10):
+        values[i] = values[i].rstrip(b"\0").decode("utf-8", "replace")
+    return dict(zip(FIELDS, values))
+
+
+class TradeJournal:
+    """Non-blocking journal writer. `record()` costs one struct.pack and a queue put."""
+
+    def __init__(self, directory=JOURNAL_DIR, flush_bytes=FLUSH_BYTES,
+                 flush_interval=FLUSH_INTERVAL, rotate_bytes=ROTATE_BYTES):
+        self.directory = directory
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.rotate_bytes = rotate_bytes
+        self._q = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopping = False
+        self.written = 0
+        self.dropped = 0
+
+    @property
+    def active_path(self):
+        return os.path.join(self.directory, ACTIVE_NAME)
+
+    # ------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="trade-journal", daemon=True)
+                self._thread.start()
+        return self
+
+    def record(self, kind, **fields):
+        if self._stopping:
+            self.dropped += 1
+            return
+        if self._thread is None:
+            self.start()
+        self._q.put(pack(kind, **fields))
+
+    def close(self, timeout=5.0):
+        """Flush everything queued, fsync and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._q.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    # ------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        f = open(self.active_path, "ab")
+        if f.tell() == 0:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        return f
+
+    def _rotate(self, f):
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        os.replace(self.active_path, os.path.join(self.directory, f"trades-{stamp}.bin"))
+        return self._open()
+
+    def _run(self):
+        f = self._open()
+        buf = bytearray()
+        deadline = time.monotonic() + self.flush_interval
+        stop = False
+        try:
+            while not stop:
+                try:
+                    item = self._q.get(timeout=max(0.0, deadline - time.monotonic()))
+                    if item is None:
+                        stop = True
+                    else:
+                        buf += item
+                        # Drain whatever else is already waiting without blocking
+                        while len(buf) < self.flush_bytes:
+                            try:
+                                item = self._q.get_nowait()
+                            except queue.Empty:
+                                break
+                            if item is None:
+                                stop = True
+                                break
+                            buf += item
+                except queue.Empty:
+                    pass
+
+                if buf and (stop or len(buf) >= self.flush_bytes or time.monotonic() >= deadline):
+                    f.write(buf)
+                    f.flush()
+                    self.written += len(buf) // RECORD.size
+                    buf.clear()
+                    if f.tell() >= self.rotate_bytes:
+                        f = self._rotate(f)
+                if time.monotonic() >= deadline:
+                    deadline = time.monotonic() + self.flush_interval
+        except Exception as e:
+            print(f"❌ Trade journal writer failed: {e}")
+        finally:
+            try:
+                if buf:
+                    f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                f.close()
+
+
+# ==========================================================
+# READING
+# ==========================================================
+def segments(directory=JOURNAL_DIR):
+    """Journal files oldest → newest (rotated segments, then the active file)."""
+    if not os.path.isdir(directory):
+        return []
+    rotated = sorted(n for n in os.listdir(directory) if n.startswith("trades-") and n.endswith(".bin"))
+    names = rotated + ([ACTIVE_NAME] if os.path.exists(os.path.join(directory, ACTIVE_NAME)) else [])
+    return [os.path.join(directory, n) for n in names]
+
+
+def read_segment(path):
+    """Yield decoded records from one segment, ignoring a torn trailing record."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        return
+    magic, version, size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or size != RECORD.size:
+        raise ValueError(f"{path} is not a v{VERSION} trade journal")
+    for off in range(HEADER.size, len(data) - size + 1, size):
+        yield unpack(data, off)
+
+
+def read_journal(directory=JOURNAL_DIR):
+    for path in segments(directory):
+        yield from read_segment(path)
+
+
+def format_record(rec):
+    ts = datetime.fromtimestamp(rec["ts_ns"] / 1e9, tz=timezone.utc)
+    kind = KIND_NAMES.get(rec["kind"], str(rec["kind"]))
+    if rec["kind"] == NOTE:
+        return f"[{ts:%Y-%m-%d %H:%M:%S.%f UTC}] {rec['note']}"
+    return (f"[{ts:%Y-%m-%d %H:%M:%S.%f UTC}] {kind} {rec['amount_in']} {rec['token_in']} → "
+            f"{rec['amount_out']:.6f} {rec['token_out']} impact={rec['price_impact']:.4%} "
+            f"tx={rec['tx']} {rec['note']}".rstrip())
+
+
+# ==========================================================
+# SHARED JOURNAL
+# ==========================================================
+journal = TradeJournal()
+atexit.register(journal.close)
+
+
+if __name__ == "__main__":
+    import sys
+    for rec in read_journal(sys.argv[1] if len(sys.argv) > 1 else JOURNAL_DIR):
+        print(format_record(rec))